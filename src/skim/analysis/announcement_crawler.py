@@ -0,0 +1,169 @@
+"""
+Concurrent, incremental crawler for ASX announcements.
+
+Fills an ``AnnouncementArchive`` with every pending ticker-year: complete
+past years are never requested again and the current year is refreshed
+on each run. Requests run on one asyncio event loop with a bound on
+in-flight requests and a per-host request rate, and a ticker-year whose
+fetch fails, or whose page has no announcements table, stays pending for
+the next crawl.
+"""
+
+import asyncio
+import random
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from skim.analysis.announcement_scraper import (
+    ASX_BASE_URL,
+    announcements_url,
+    parse_announcements_page,
+)
+from skim.analysis.announcements import AnnouncementArchive
+
+DEFAULT_CONCURRENCY = 8
+# Requests per second to any one host
+DEFAULT_RATE = 4.0
+MAX_RETRIES = 3
+RETRY_DELAY = 1.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class HostRateLimiter:
+    """Spaces requests to each host at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate: float = DEFAULT_RATE):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url: str) -> None:
+        """Wait for the next request slot of the URL's host."""
+        host = urlsplit(url).netloc
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            slot = max(now, self._next.get(host, now))
+            self._next[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of a crawl."""
+
+    fetched: int = 0
+    added: int = 0
+    failed: list[tuple[str, int]] = field(default_factory=list)
+
+
+async def fetch_page(
+    client: httpx.AsyncClient,
+    limiter: HostRateLimiter,
+    url: str,
+    max_retries: int = MAX_RETRIES,
+    retry_delay: float = RETRY_DELAY,
+) -> str | None:
+    """
+    Fetch a page, retrying rate-limit, server and network errors.
+
+    Returns:
+        Response text, or None once retries are exhausted or on a
+        non-retryable error status
+    """
+    delay = retry_delay
+    for attempt in range(max_retries + 1):
+        await limiter.wait(url)
+        try:
+            response = await client.get(url)
+            if response.status_code not in RETRYABLE_STATUS:
+                response.raise_for_status()
+                return response.text
+            reason = f"HTTP {response.status_code}"
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"Giving up on {url}: {e}")
+            return None
+        except httpx.RequestError as e:
+            reason = f"network error: {e}"
+
+        if attempt < max_retries:
+            logger.debug(f"Retrying {url} after {reason}")
+            await asyncio.sleep(delay * (1 + random.random() * 0.1))
+            delay *= 2
+        else:
+            logger.warning(f"Giving up on {url} after {reason}")
+    return None
+
+
+async def crawl_announcements(
+    archive: AnnouncementArchive,
+    tickers: Iterable[str],
+    years: Iterable[int],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE,
+    base_url: str = ASX_BASE_URL,
+    today: date | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    retry_delay: float = RETRY_DELAY,
+) -> CrawlResult:
+    """
+    Fetch every pending ticker-year into the archive.
+
+    Args:
+        archive: Archive to read pending years from and store into
+        tickers: ASX ticker symbols
+        years: Calendar years to cover
+        concurrency: Maximum requests in flight
+        rate: Maximum requests per second to one host
+        base_url: Announcements site root
+        today: Reference date for completeness (default: today)
+        progress: Optional callback receiving (done, total)
+        retry_delay: First retry delay in seconds, doubling per retry
+
+    Returns:
+        CrawlResult with pages fetched, announcements added and the
+        ticker-years that failed
+    """
+    today = today or date.today()
+    pending = archive.pending(tickers, years, today)
+    result = CrawlResult()
+    limiter = HostRateLimiter(rate)
+    semaphore = asyncio.Semaphore(concurrency)
+    done = 0
+
+    async def crawl_one(client: httpx.AsyncClient, ticker: str, year: int):
+        nonlocal done
+        async with semaphore:
+            html = await fetch_page(
+                client,
+                limiter,
+                announcements_url(ticker, year, base_url),
+                retry_delay=retry_delay,
+            )
+        announcements = None if html is None else parse_announcements_page(html)
+        if announcements is None:
+            result.failed.append((ticker, year))
+        else:
+            result.fetched += 1
+            result.added += archive.store_year(
+                ticker, year, announcements, today
+            )
+        done += 1
+        if progress is not None:
+            progress(done, len(pending))
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        timeout=30, limits=limits, follow_redirects=True
+    ) as client:
+        await asyncio.gather(
+            *(crawl_one(client, ticker, year) for ticker, year in pending)
+        )
+
+    result.failed.sort()
+    return result
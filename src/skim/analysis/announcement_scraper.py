@@ -9,6 +9,8 @@ from bs4 import BeautifulSoup
 from rich.console import Console
 from rich.table import Table
 
+from skim.analysis.announcements import AnnouncementArchive
+
 ASX_BASE_URL = "https://www.asx.com.au"
 
 
@@ -66,35 +68,56 @@ def parse_row(cells) -> dict | None:
     }
 
 
-def scrape_announcements_for_year(ticker: str, year: int) -> list[dict]:
-    """Scrape announcements for a given ticker and year."""
-    url = f"{ASX_BASE_URL}/asx/v2/statistics/announcements.do?by=asxCode&asxCode={ticker}&timeframe=Y&year={year}"
+def announcements_url(
+    ticker: str, year: int, base_url: str = ASX_BASE_URL
+) -> str:
+    """URL of the ASX announcements page for a ticker and year."""
+    return (
+        f"{base_url}/asx/v2/statistics/announcements.do"
+        f"?by=asxCode&asxCode={ticker}&timeframe=Y&year={year}"
+    )
 
-    try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        table = soup.select("#content > div > announcement_data > table")
+def parse_announcements_page(html: str) -> list[dict] | None:
+    """
+    Extract announcements from an ASX announcements page.
 
-        if not table:
-            return []
+    Returns:
+        Announcements listed on the page, or None if it has no
+        announcements table (e.g. a block or error page)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.select("#content > div > announcement_data > table")
 
-        announcements = table[0].select("tr")[1:]
-        results = []
+    if not table:
+        return None
+
+    results = []
+    for row in table[0].select("tr")[1:]:
+        cells = row.select("td")
+        if len(cells) < 3:
+            continue
 
-        for row in announcements:
-            cells = row.select("td")
-            if len(cells) < 3:
-                continue
+        announcement = parse_row(cells)
+        if announcement and announcement["date"]:
+            results.append(announcement)
 
-            announcement = parse_row(cells)
-            if announcement and announcement["date"]:
-                results.append(announcement)
+    return results
 
-        return results
+
+def fetch_announcements_for_year(ticker: str, year: int) -> list[dict] | None:
+    """Scrape announcements for a ticker and year, or None on failure."""
+    try:
+        response = requests.get(announcements_url(ticker, year), timeout=30)
+        response.raise_for_status()
+        return parse_announcements_page(response.text)
     except Exception:
-        return []
+        return None
+
+
+def scrape_announcements_for_year(ticker: str, year: int) -> list[dict]:
+    """Scrape announcements for a given ticker and year."""
+    return fetch_announcements_for_year(ticker, year) or []
 
 
 def filter_announcements_by_date_range(
@@ -114,12 +137,19 @@ def filter_announcements_by_date_range(
 class AnnouncementScraper:
     """Scrapes and displays ASX company announcements."""
 
+    def __init__(self, archive: AnnouncementArchive | None = None):
+        self.archive = archive
+
     def get_announcements(
         self, ticker: str, start_date: datetime, end_date: datetime
     ) -> list[dict]:
         """
         Get announcements for a ticker within date range.
 
+        With an archive attached, years it holds in full are read from it
+        and only the others (always including the current year) are
+        scraped and stored.
+
         Args:
             ticker: ASX ticker symbol
             start_date: Start date for filtering
@@ -134,6 +164,14 @@ class AnnouncementScraper:
         start_year = start_date.year
         end_year = end_date.year
 
+        if self.archive is not None:
+            years = range(start_year, end_year + 1)
+            for year in self.archive.pending_years(ticker, years):
+                fetched = fetch_announcements_for_year(ticker, year)
+                if fetched is not None:
+                    self.archive.store_year(ticker, year, fetched)
+            return self.archive.get(ticker, start_date, end_date)
+
         for year in range(start_year, end_year + 1):
             year_announcements = scrape_announcements_for_year(ticker, year)
             results.extend(year_announcements)
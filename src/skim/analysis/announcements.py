@@ -0,0 +1,535 @@
+"""
+Stored ASX announcements and their as-of join to price events.
+
+Announcements are kept in SQLite in the scraper's own format (``date`` as
+YYYYMMDD and ``time`` as HHMM, Sydney time), along with the ticker-years
+fetched so far. A year fetched after it ended is complete and never
+fetched again; the current year stays pending so every crawl refreshes
+it. Headlines are indexed with SQLite FTS5, kept in step with the table
+by triggers so new announcements are searchable as soon as they are
+stored. Each announcement's ``id`` is a publish-time key, and the index
+is keyed on it, so matches come back newest first and date filters are
+id ranges, without sorting or joining every match. ``link_announcements`` pairs
+every gap in a gap table with the latest announcement for its ticker
+published at or before that day's market open, in a single as-of join
+over the whole universe.
+"""
+
+import sqlite3
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+DEFAULT_ARCHIVE_PATH = Path("data/processed/announcements.db")
+
+# ASX normal trading opens at 10:00 Sydney time
+MARKET_OPEN = timedelta(hours=10)
+
+# Oldest announcement that can explain a gap
+DEFAULT_TOLERANCE = timedelta(days=3)
+
+ANNOUNCEMENT_SCHEMA = {
+    "ticker": pl.String,
+    "published": pl.Datetime("us"),
+    "headline": pl.String,
+    "price_sensitive": pl.Boolean,
+    "pages": pl.Int64,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS announcements (
+    id INTEGER PRIMARY KEY,
+    ticker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL,
+    headline TEXT NOT NULL,
+    price_sensitive INTEGER NOT NULL,
+    pages INTEGER NOT NULL,
+    UNIQUE (ticker, date, time, headline)
+);
+CREATE INDEX IF NOT EXISTS idx_announcements_date
+    ON announcements (date, ticker);
+CREATE TABLE IF NOT EXISTS announcement_years (
+    ticker TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    complete INTEGER NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (ticker, year)
+);
+"""
+
+# External-content FTS5 index over headlines, stemmed so that "placement"
+# also finds "placements". Tickers are indexed too so a ticker filter is
+# part of the full-text match.
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS announcements_fts USING fts5(
+    headline,
+    ticker,
+    date UNINDEXED,
+    price_sensitive UNINDEXED,
+    content = 'announcements',
+    content_rowid = 'id',
+    tokenize = 'porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS announcements_fts_insert
+AFTER INSERT ON announcements BEGIN
+    INSERT INTO announcements_fts (
+        rowid, headline, ticker, date, price_sensitive
+    ) VALUES (
+        new.id, new.headline, new.ticker, new.date, new.price_sensitive
+    );
+END;
+CREATE TRIGGER IF NOT EXISTS announcements_fts_delete
+AFTER DELETE ON announcements BEGIN
+    INSERT INTO announcements_fts (
+        announcements_fts, rowid, headline, ticker, date, price_sensitive
+    ) VALUES (
+        'delete', old.id, old.headline, old.ticker, old.date,
+        old.price_sensitive
+    );
+END;
+"""
+
+SEARCH_LIMIT = 50
+
+# Ids are YYYYMMDDHHMM * PUBLISH_KEY_SCALE plus a sequence number within
+# the minute
+PUBLISH_KEY_SCALE = 1_000_000
+
+INSERT_SQL = f"""
+INSERT OR IGNORE INTO announcements (
+    id, ticker, date, time, headline, price_sensitive, pages
+)
+SELECT
+    COALESCE(MAX(id) + 1, :key), :ticker, :date, :time, :headline,
+    :price_sensitive, :pages
+FROM announcements
+WHERE id BETWEEN :key AND :key + {PUBLISH_KEY_SCALE} - 1
+"""
+
+# Rebuilds archives created before announcements had an id column,
+# keyed on (ticker, date, time, headline); the search index is dropped
+# and rebuilt afterwards
+MIGRATE_SQL = f"""
+DROP TRIGGER IF EXISTS announcements_fts_insert;
+DROP TRIGGER IF EXISTS announcements_fts_delete;
+DROP TABLE IF EXISTS announcements_fts;
+ALTER TABLE announcements RENAME TO announcements_unkeyed;
+DROP INDEX IF EXISTS idx_announcements_date;
+{SCHEMA}
+INSERT INTO announcements (
+    id, ticker, date, time, headline, price_sensitive, pages
+)
+SELECT
+    CAST(date || time AS INTEGER) * {PUBLISH_KEY_SCALE}
+        + ROW_NUMBER() OVER (PARTITION BY date, time ORDER BY rowid) - 1,
+    ticker, date, time, headline, price_sensitive, pages
+FROM announcements_unkeyed;
+DROP TABLE announcements_unkeyed;
+"""
+
+
+def _yyyymmdd(value: date | datetime) -> str:
+    """Archive date string for a date or datetime."""
+    return value.strftime("%Y%m%d")
+
+
+def _publish_key(day: str, time: str) -> int:
+    """First id of the minute an announcement was published."""
+    return int(day + time) * PUBLISH_KEY_SCALE
+
+
+class AnnouncementArchive:
+    """SQLite store of announcements keyed by ticker and publish time."""
+
+    def __init__(self, db_path: str | Path = DEFAULT_ARCHIVE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        columns = {
+            row[1]
+            for row in self.conn.execute("PRAGMA table_info(announcements)")
+        }
+        if "id" not in columns:
+            self.conn.executescript(f"BEGIN; {MIGRATE_SQL} COMMIT;")
+        indexed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'announcements_fts'"
+        ).fetchone()
+        if not indexed:
+            # Archives created before the index existed
+            self.conn.executescript(
+                f"BEGIN; {SEARCH_SCHEMA} "
+                "INSERT INTO announcements_fts (announcements_fts) "
+                "VALUES ('rebuild'); COMMIT;"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def add(self, ticker: str, announcements: Iterable[dict]) -> int:
+        """
+        Store announcements for a ticker, ignoring ones already stored.
+
+        Args:
+            ticker: ASX ticker symbol
+            announcements: Dictionaries with date, time, headline,
+                price_sensitive and pages, as returned by the scraper
+
+        Returns:
+            Number of announcements added
+        """
+        with self.conn:
+            cursor = self.conn.executemany(
+                INSERT_SQL,
+                [
+                    {
+                        "key": _publish_key(a["date"], a["time"]),
+                        "ticker": ticker.upper(),
+                        "date": a["date"],
+                        "time": a["time"],
+                        "headline": a["headline"],
+                        "price_sensitive": int(a["price_sensitive"]),
+                        "pages": a["pages"],
+                    }
+                    for a in announcements
+                ],
+            )
+        return max(cursor.rowcount, 0)
+
+    def store_year(
+        self,
+        ticker: str,
+        year: int,
+        announcements: Iterable[dict],
+        today: date | None = None,
+    ) -> int:
+        """
+        Store a fetched ticker-year and record it as fetched.
+
+        Only pass announcements parsed from an actual listing; a page
+        that could not be parsed must leave the year pending.
+
+        Args:
+            ticker: ASX ticker symbol
+            year: Calendar year the announcements were fetched for
+            announcements: Every announcement listed for that year
+            today: Fetch date, deciding whether the year is complete
+                (default: today)
+
+        Returns:
+            Number of announcements added
+        """
+        today = today or date.today()
+        added = self.add(ticker, announcements)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO announcement_years VALUES (?, ?, ?, ?)",
+                (
+                    ticker.upper(),
+                    year,
+                    int(year < today.year),
+                    datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+        return added
+
+    def pending(
+        self,
+        tickers: Iterable[str],
+        years: Iterable[int],
+        today: date | None = None,
+    ) -> list[tuple[str, int]]:
+        """
+        Ticker-years that still need fetching.
+
+        Complete years are skipped, as are years after ``today``.
+
+        Args:
+            tickers: ASX ticker symbols
+            years: Calendar years wanted
+            today: Reference date (default: today)
+
+        Returns:
+            (ticker, year) pairs in ticker then year order
+        """
+        today = today or date.today()
+        complete = set(
+            self.conn.execute(
+                "SELECT ticker, year FROM announcement_years WHERE complete = 1"
+            ).fetchall()
+        )
+        years = [y for y in years if y <= today.year]
+        return [
+            (ticker, year)
+            for ticker in sorted({t.upper() for t in tickers})
+            for year in years
+            if (ticker, year) not in complete
+        ]
+
+    def pending_years(
+        self, ticker: str, years: Iterable[int], today: date | None = None
+    ) -> list[int]:
+        """Years of one ticker that still need fetching."""
+        return [year for _, year in self.pending([ticker], years, today)]
+
+    def get(
+        self, ticker: str, start_date: datetime, end_date: datetime
+    ) -> list[dict]:
+        """
+        Stored announcements for a ticker within a date range.
+
+        Returns:
+            Announcement dictionaries in the scraper's format, newest first
+        """
+        rows = self.conn.execute(
+            "SELECT date, time, headline, price_sensitive, pages "
+            "FROM announcements WHERE ticker = ? AND date BETWEEN ? AND ? "
+            "ORDER BY date DESC, time DESC",
+            (ticker.upper(), _yyyymmdd(start_date), _yyyymmdd(end_date)),
+        ).fetchall()
+        return [
+            {
+                "date": d,
+                "time": t,
+                "headline": headline,
+                "price_sensitive": bool(sensitive),
+                "pages": pages,
+            }
+            for d, t, headline, sensitive, pages in rows
+        ]
+
+    def search(
+        self,
+        query: str,
+        ticker: str | None = None,
+        start_date: date | datetime | None = None,
+        end_date: date | datetime | None = None,
+        price_sensitive_only: bool = False,
+        limit: int | None = SEARCH_LIMIT,
+    ) -> pl.DataFrame:
+        """
+        Full-text search over headlines.
+
+        Queries use FTS5 syntax: bare terms must all match, "quoted
+        phrases" match in order, ``term*`` matches a prefix, and terms
+        combine with AND, OR, NOT and parentheses.
+
+        Args:
+            query: FTS5 query
+            ticker: Restrict to one ticker
+            start_date: Earliest publish date (default: unbounded)
+            end_date: Latest publish date (default: unbounded)
+            price_sensitive_only: Only return price-sensitive announcements
+            limit: Maximum rows returned, newest first (None for all)
+
+        Returns:
+            DataFrame with columns as in ANNOUNCEMENT_SCHEMA
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax
+        """
+        _check_balanced(query)
+        match = f"headline : ({query})"
+        if ticker is not None:
+            code = ticker.upper().replace('"', "")
+            match += f' AND ticker : "{code}"'
+        clauses = ["announcements_fts MATCH ?"]
+        params: list[str | int] = [match]
+        if start_date is not None:
+            clauses.append("f.rowid >= ?")
+            params.append(_publish_key(_yyyymmdd(start_date), "0000"))
+        if end_date is not None:
+            clauses.append("f.rowid <= ?")
+            params.append(_publish_key(_yyyymmdd(end_date), "2400"))
+        if price_sensitive_only:
+            clauses.append("f.price_sensitive = 1")
+        sql = (
+            "SELECT a.ticker, a.date || a.time, a.headline, "
+            "a.price_sensitive, a.pages FROM announcements_fts AS f "
+            "CROSS JOIN announcements AS a ON a.id = f.rowid "
+            f"WHERE {' AND '.join(clauses)} ORDER BY f.rowid DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        try:
+            rows = self.conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query '{query}': {e}") from None
+        return _announcement_frame(rows)
+
+    def frame(
+        self,
+        tickers: Iterable[str] | None = None,
+        start_date: date | datetime | None = None,
+        end_date: date | datetime | None = None,
+    ) -> pl.DataFrame:
+        """
+        Stored announcements as a DataFrame.
+
+        Args:
+            tickers: Restrict to these tickers (default: all)
+            start_date: Earliest publish date (default: unbounded)
+            end_date: Latest publish date (default: unbounded)
+
+        Returns:
+            DataFrame with columns as in ANNOUNCEMENT_SCHEMA, sorted by
+            publish time
+        """
+        clauses, params = [], []
+        if start_date is not None:
+            clauses.append("date >= ?")
+            params.append(_yyyymmdd(start_date))
+        if end_date is not None:
+            clauses.append("date <= ?")
+            params.append(_yyyymmdd(end_date))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            "SELECT ticker, date || time, headline, price_sensitive, pages "
+            f"FROM announcements {where}",
+            params,
+        ).fetchall()
+
+        frame = _announcement_frame(rows)
+        if tickers is not None:
+            frame = frame.filter(pl.col("ticker").is_in(list(tickers)))
+        return frame.sort("published")
+
+
+def _check_balanced(query: str) -> None:
+    """
+    Reject queries whose parentheses or quotes are unbalanced.
+
+    The query is wrapped in ``headline : (...)``, so an unmatched closing
+    parenthesis would end that group and let the rest of the query
+    search other columns.
+
+    Raises:
+        ValueError: If a parenthesis or quote is unmatched
+    """
+    depth = 0
+    quoted = False
+    for position, char in enumerate(query):
+        if char == '"':
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                raise ValueError(
+                    f"Invalid search query '{query}': unmatched ')' at "
+                    f"position {position}"
+                )
+    if quoted or depth:
+        raise ValueError(
+            f"Invalid search query '{query}': unclosed "
+            f"{'quote' if quoted else 'parenthesis'}"
+        )
+
+
+def _announcement_frame(rows: list[tuple]) -> pl.DataFrame:
+    """Frame from (ticker, date || time, headline, sensitive, pages) rows."""
+    return pl.DataFrame(
+        rows,
+        schema={**ANNOUNCEMENT_SCHEMA, "published": pl.String},
+        orient="row",
+    ).with_columns(
+        pl.col("published").str.strptime(pl.Datetime("us"), "%Y%m%d%H%M"),
+        pl.col("price_sensitive").cast(pl.Boolean),
+    )
+
+
+def display_headlines(
+    announcements: pl.DataFrame, console: Console, title: str
+) -> None:
+    """Display announcements across tickers in a formatted table."""
+    if announcements.is_empty():
+        console.print("[yellow]No announcements found[/yellow]")
+        return
+
+    table = Table(title=f"{title} (showing {announcements.height})")
+    table.add_column("Ticker", style="cyan", no_wrap=True)
+    table.add_column("Published", style="yellow", no_wrap=True)
+    table.add_column("Headline", style="white")
+    table.add_column("PS", no_wrap=True)
+
+    for ann in announcements.iter_rows(named=True):
+        table.add_row(
+            ann["ticker"],
+            ann["published"].strftime("%d/%m/%Y %H:%M"),
+            ann["headline"],
+            "✓" if ann["price_sensitive"] else "✗",
+        )
+
+    console.print(table)
+
+
+def link_announcements(
+    gaps: pl.DataFrame,
+    announcements: pl.DataFrame,
+    tolerance: timedelta = DEFAULT_TOLERANCE,
+    price_sensitive_only: bool = False,
+) -> pl.DataFrame:
+    """
+    Annotate gaps with the announcement that most likely explains them.
+
+    Each gap is matched to the latest announcement for its ticker
+    published at or before market open on the gap day and no more than
+    ``tolerance`` earlier.
+
+    Args:
+        gaps: Gap table with at least ticker and date columns
+        announcements: Announcement table as from
+            ``AnnouncementArchive.frame``
+        tolerance: Oldest announcement relative to the open to match
+        price_sensitive_only: Only match price-sensitive announcements
+
+    Returns:
+        The gap table in its original order with headline,
+        price_sensitive, published and lag_hours (open minus publish
+        time) added; null where no announcement matched
+    """
+    if price_sensitive_only:
+        announcements = announcements.filter(pl.col("price_sensitive"))
+
+    gap_open = pl.col("date").cast(pl.Datetime("us")) + MARKET_OPEN
+    return (
+        gaps.lazy()
+        .with_row_index("_row")
+        .with_columns(gap_open.alias("_open"))
+        .sort("_open")
+        .join_asof(
+            announcements.lazy()
+            .select(
+                "ticker",
+                pl.col("published").alias("_open"),
+                "published",
+                "headline",
+                "price_sensitive",
+            )
+            .sort("_open"),
+            on="_open",
+            by="ticker",
+            strategy="backward",
+            tolerance=tolerance,
+            check_sortedness=False,
+        )
+        .with_columns(
+            (
+                (pl.col("_open") - pl.col("published")).dt.total_minutes() / 60
+            ).alias("lag_hours")
+        )
+        .sort("_row")
+        .drop("_row", "_open")
+        .collect()
+    )
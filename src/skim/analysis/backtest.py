@@ -0,0 +1,502 @@
+"""
+Vectorized daily-bar backtest of the gap / opening-range breakout strategy.
+
+Every gap that passes the scanner filters becomes a trade, sized as in
+``Trader.execute_breakouts`` and protected by the strategy's stop (the
+opening-range low, or 5% below entry without one). All tickers and days
+are simulated at once with Polars expressions: entries are a filter over
+the universe, stop exits are found by searching forward from each entry
+in doubling windows of bars, and the equity curve marks every open
+position to each day's close.
+
+Daily bars carry no opening range, so by default an entry fills at the
+gap-day open and the 5% stop applies. A universe frame with ``or_high``
+and ``or_low`` columns (e.g. built from intraday bars) enters only on a
+break above ``or_high`` and stops at ``or_low``.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+from skim.analysis.results import Results, result_count, shown_rows
+from skim.analysis.stock_data import StockData
+from skim.analysis.universe import build_universe
+from skim.trading.core.config import ScannerConfig
+
+# Position sizing from Trader.execute_breakouts
+POSITION_VALUE = 5000.0
+MAX_POSITION_SIZE = 1000
+# Stop distance below entry when there is no opening-range low
+FALLBACK_STOP_PCT = 5.0
+
+DEFAULT_CAPITAL = 100_000.0
+
+# Bars searched for a stop in the first pass (doubled on each pass)
+STOP_SEARCH_BARS = 8
+
+TRADE_COLUMNS = [
+    "ticker",
+    "entry_date",
+    "gap_percent",
+    "entry_price",
+    "quantity",
+    "stop",
+    "exit_date",
+    "exit_price",
+    "exit_reason",
+    "bars_held",
+    "pnl",
+    "return_pct",
+]
+
+
+def _stop_rows(low: pl.Series, trades: pl.DataFrame) -> pl.DataFrame:
+    """
+    First bar at or after entry whose low reaches each trade's stop.
+
+    Bars are checked in windows that double in length, so short trades
+    (most of them) cost a handful of bars and only long holds scan far.
+
+    Args:
+        low: Low prices of the scanned frame, indexed by row
+        trades: Frame with id, row (entry bar), limit_row and stop
+
+    Returns:
+        Frame of (id, stop_row) for trades that were stopped out
+    """
+    pending = trades.select("id", "row", "limit_row", "stop")
+    found = []
+    offset, width = 0, STOP_SEARCH_BARS
+    while pending.height:
+        window = (
+            pending.with_columns(
+                pl.int_ranges(
+                    pl.col("row") + offset,
+                    pl.min_horizontal(
+                        pl.col("row") + offset + width,
+                        pl.col("limit_row") + 1,
+                    ),
+                ).alias("bar")
+            )
+            .explode("bar")
+            .drop_nulls("bar")
+        )
+        hits = (
+            window.with_columns(low.gather(window["bar"]).alias("low"))
+            .filter(pl.col("low") <= pl.col("stop"))
+            .group_by("id")
+            .agg(pl.col("bar").min().alias("stop_row"))
+        )
+        found.append(hits)
+        pending = pending.join(hits, on="id", how="anti").filter(
+            pl.col("row") + offset + width <= pl.col("limit_row")
+        )
+        offset += width
+        width *= 2
+
+    return (
+        pl.concat(found)
+        if found
+        else pl.DataFrame(schema={"id": pl.UInt32, "stop_row": pl.Int64})
+    )
+
+
+def simulate_trades(
+    universe: pl.DataFrame,
+    start_date: date | datetime,
+    end_date: date | datetime,
+    gap_threshold: float = 9.0,
+    min_price: float = 0.05,
+    min_volume: int = 10000,
+    stop_pct: float = FALLBACK_STOP_PCT,
+    max_hold_days: int | None = None,
+) -> pl.DataFrame:
+    """
+    Simulate one breakout trade per qualifying gap across a universe.
+
+    A gap qualifies when the open is at least ``gap_threshold`` percent
+    above the prior close, the open is at least ``min_price`` and the
+    prior bar traded at least ``min_volume`` shares. Positions exit at
+    the stop (at the open instead if a later bar gaps below it), after
+    ``max_hold_days`` bars at the close, or at the last close on or
+    before ``end_date``.
+
+    Args:
+        universe: Long OHLCV frame grouped by ticker and sorted by date
+        start_date: First date an entry may occur on
+        end_date: Last date of the simulation
+        gap_threshold: Minimum gap percentage
+        min_price: Minimum open price
+        min_volume: Minimum prior-day volume
+        stop_pct: Stop distance below entry without an opening-range low
+        max_hold_days: Exit after this many bars (default: hold to stop)
+
+    Returns:
+        DataFrame of trades with columns as in TRADE_COLUMNS, in entry order
+    """
+    frame = universe.filter(pl.col("date") <= end_date).with_row_index("row")
+    prev_close = pl.col("close").shift(1).over("ticker")
+    has_range = "or_high" in frame.columns and "or_low" in frame.columns
+
+    if has_range:
+        entry_price = pl.max_horizontal("open", "or_high")
+        broke_out = pl.col("high") > pl.col("or_high")
+        stop = (
+            pl.when(pl.col("or_low") < entry_price)
+            .then(pl.col("or_low"))
+            .otherwise(entry_price * (1 - stop_pct / 100))
+        )
+    else:
+        entry_price = pl.col("open")
+        broke_out = pl.lit(True)
+        stop = entry_price * (1 - stop_pct / 100)
+
+    last_row = pl.col("row").max().over("ticker")
+    limit_row = (
+        last_row
+        if max_hold_days is None
+        else pl.min_horizontal(last_row, pl.col("row") + max_hold_days)
+    )
+
+    trades = (
+        frame.lazy()
+        .with_columns(
+            ((pl.col("open") - prev_close) / prev_close * 100).alias(
+                "gap_percent"
+            ),
+            pl.col("volume").shift(1).over("ticker").alias("prev_volume"),
+            last_row.alias("last_row"),
+            limit_row.cast(pl.UInt32).alias("limit_row"),
+        )
+        .filter(
+            (pl.col("date") >= start_date)
+            & (prev_close > 0)
+            & (pl.col("gap_percent") >= gap_threshold)
+            & (pl.col("open") >= min_price)
+            & (pl.col("prev_volume") >= min_volume)
+            & broke_out
+        )
+        .with_columns(entry_price.alias("entry_price"), stop.alias("stop"))
+        .with_columns(
+            (POSITION_VALUE / pl.col("entry_price"))
+            .floor()
+            .clip(upper_bound=MAX_POSITION_SIZE)
+            .cast(pl.Int64)
+            .alias("quantity")
+        )
+        .filter(pl.col("quantity") >= 1)
+        .with_row_index("id")
+        .collect()
+    )
+
+    trades = trades.join(
+        _stop_rows(frame["low"], trades), on="id", how="left"
+    ).with_columns(
+        pl.coalesce("stop_row", "limit_row").alias("exit_row"),
+        pl.when(pl.col("stop_row").is_not_null())
+        .then(pl.lit("stop"))
+        .when(pl.col("limit_row") < pl.col("last_row"))
+        .then(pl.lit("time"))
+        .otherwise(pl.lit("end"))
+        .alias("exit_reason"),
+    )
+    exit_row = trades["exit_row"]
+    trades = trades.with_columns(
+        frame["date"].gather(exit_row).alias("exit_date"),
+        frame["open"].gather(exit_row).alias("exit_open"),
+        frame["close"].gather(exit_row).alias("exit_close"),
+    )
+
+    exit_price = (
+        pl.when(pl.col("exit_reason") != "stop")
+        .then(pl.col("exit_close"))
+        .when(pl.col("exit_row") == pl.col("row"))
+        .then(pl.col("stop"))
+        .otherwise(pl.min_horizontal("exit_open", "stop"))
+    )
+    return (
+        trades.with_columns(
+            pl.col("date").alias("entry_date"),
+            exit_price.alias("exit_price"),
+            (pl.col("exit_row").cast(pl.Int64) - pl.col("row")).alias(
+                "bars_held"
+            ),
+        )
+        .with_columns(
+            (
+                pl.col("quantity")
+                * (pl.col("exit_price") - pl.col("entry_price"))
+            ).alias("pnl"),
+            ((pl.col("exit_price") / pl.col("entry_price") - 1) * 100).alias(
+                "return_pct"
+            ),
+        )
+        .sort("entry_date", "ticker")
+        .select(TRADE_COLUMNS)
+    )
+
+
+def equity_curve(
+    universe: pl.DataFrame,
+    trades: pl.DataFrame,
+    start_date: date | datetime,
+    end_date: date | datetime,
+    capital: float = DEFAULT_CAPITAL,
+) -> pl.DataFrame:
+    """
+    Mark every open position to each day's close.
+
+    Args:
+        universe: Long OHLCV frame the trades were simulated on
+        trades: Output of ``simulate_trades``
+        start_date: First date of the curve
+        end_date: Last date of the curve
+        capital: Starting equity
+
+    Returns:
+        DataFrame of date, pnl (that day's mark-to-market change), equity
+        and open_positions (positions held at the close), one row per
+        trading day
+    """
+    frame = universe.select("ticker", "date", "close").with_row_index("row")
+    bars = frame.select("ticker", "date", "row")
+    legs = (
+        trades.select(
+            "ticker",
+            "entry_date",
+            "exit_date",
+            "entry_price",
+            "exit_price",
+            "quantity",
+        )
+        .join(
+            bars.rename({"date": "entry_date", "row": "entry_row"}),
+            on=["ticker", "entry_date"],
+        )
+        .join(
+            bars.rename({"date": "exit_date", "row": "exit_row"}),
+            on=["ticker", "exit_date"],
+        )
+        .with_columns(pl.col("entry_row", "exit_row").cast(pl.Int64))
+    )
+    legs = legs.with_columns(
+        frame["close"].gather(legs["entry_row"]).alias("entry_close"),
+        frame["close"]
+        .gather((legs["exit_row"] - 1).clip(lower_bound=0))
+        .alias("before_exit_close"),
+    )
+
+    # Entry and exit days are marked from the fill prices; the days between
+    # are the held quantity times the close-to-close change, accumulated
+    # from +quantity / -quantity markers so no trade is expanded per bar.
+    same_day = pl.col("exit_row") == pl.col("entry_row")
+    qty = pl.col("quantity")
+    changes = pl.concat(
+        [
+            legs.select(
+                pl.col("entry_row").alias("row"),
+                pl.when(same_day)
+                .then(qty * (pl.col("exit_price") - pl.col("entry_price")))
+                .otherwise(
+                    qty * (pl.col("entry_close") - pl.col("entry_price"))
+                )
+                .alias("pnl"),
+                pl.lit(0, pl.Int64).alias("held"),
+                pl.lit(1, pl.Int64).alias("opened"),
+            ),
+            legs.select(
+                pl.col("exit_row").alias("row"),
+                pl.when(same_day)
+                .then(0.0)
+                .otherwise(
+                    qty * (pl.col("exit_price") - pl.col("before_exit_close"))
+                )
+                .alias("pnl"),
+                pl.lit(0, pl.Int64).alias("held"),
+                pl.lit(-1, pl.Int64).alias("opened"),
+            ),
+            legs.filter(~same_day).select(
+                (pl.col("entry_row") + 1).alias("row"),
+                pl.lit(0.0).alias("pnl"),
+                qty.alias("held"),
+                pl.lit(0, pl.Int64).alias("opened"),
+            ),
+            legs.filter(~same_day).select(
+                pl.col("exit_row").alias("row"),
+                pl.lit(0.0).alias("pnl"),
+                (-qty).alias("held"),
+                pl.lit(0, pl.Int64).alias("opened"),
+            ),
+        ]
+    )
+    daily = (
+        frame.with_columns(pl.col("row").cast(pl.Int64))
+        .join(
+            changes.group_by("row").agg(pl.col("pnl", "held", "opened").sum()),
+            on="row",
+            how="left",
+            maintain_order="left",
+        )
+        .with_columns(pl.col("pnl", "held", "opened").fill_null(0))
+        .with_columns(
+            (
+                pl.col("pnl")
+                + pl.col("held").cum_sum()
+                * (pl.col("close") - pl.col("close").shift(1)).fill_null(0.0)
+            ).alias("pnl"),
+            pl.col("opened").cum_sum().alias("open_positions"),
+        )
+        .filter(pl.col("date").is_between(start_date, end_date))
+        .group_by("date")
+        .agg(pl.col("pnl", "open_positions").sum())
+    )
+    return (
+        daily.sort("date")
+        .with_columns((capital + pl.col("pnl").cum_sum()).alias("equity"))
+        .select("date", "pnl", "equity", "open_positions")
+    )
+
+
+@dataclass
+class BacktestResult:
+    """Trades and equity curve of one backtest run."""
+
+    trades: pl.DataFrame
+    equity: pl.DataFrame
+    capital: float = DEFAULT_CAPITAL
+
+    def summary(self) -> dict:
+        """Headline statistics of the run."""
+        trades = self.trades
+        equity = self.equity["equity"]
+        drawdown = (equity - equity.cum_max()).min() if len(equity) else 0.0
+        return {
+            "trades": trades.height,
+            "win_rate": (
+                trades.select((pl.col("pnl") > 0).mean() * 100).item()
+                if trades.height
+                else 0.0
+            ),
+            "total_pnl": trades["pnl"].sum(),
+            "avg_return_pct": (
+                trades["return_pct"].mean() if trades.height else 0.0
+            ),
+            "max_drawdown": drawdown or 0.0,
+            "final_equity": equity[-1] if len(equity) else self.capital,
+        }
+
+
+class Backtester:
+    """Backtests the gap breakout strategy across all loaded stocks."""
+
+    def __init__(self, stocks: dict[str, StockData]):
+        self.stocks = stocks
+        self._universe: pl.DataFrame | None = None
+
+    @property
+    def universe(self) -> pl.DataFrame:
+        """Long OHLCV frame of all stocks, built on first use."""
+        if self._universe is None:
+            self._universe = build_universe(self.stocks)
+        return self._universe
+
+    def run(
+        self,
+        start_date: date | datetime,
+        end_date: date | datetime,
+        config: ScannerConfig | None = None,
+        stop_pct: float = FALLBACK_STOP_PCT,
+        max_hold_days: int | None = None,
+        capital: float = DEFAULT_CAPITAL,
+    ) -> BacktestResult:
+        """
+        Backtest the strategy over a period.
+
+        Args:
+            start_date: First date an entry may occur on
+            end_date: Last date of the simulation
+            config: Scanner settings supplying the gap threshold and the
+                price and volume filters (default: ScannerConfig())
+            stop_pct: Stop distance below entry without an opening range
+            max_hold_days: Exit after this many bars (default: hold to stop)
+            capital: Starting equity
+
+        Returns:
+            BacktestResult with the trades table and equity curve
+        """
+        config = config or ScannerConfig()
+        trades = simulate_trades(
+            self.universe,
+            start_date,
+            end_date,
+            gap_threshold=config.gap_threshold,
+            min_price=config.price_filter,
+            min_volume=config.volume_filter,
+            stop_pct=stop_pct,
+            max_hold_days=max_hold_days,
+        )
+        equity = equity_curve(
+            self.universe, trades, start_date, end_date, capital
+        )
+        return BacktestResult(trades, equity, capital)
+
+    def display_results(
+        self, result: BacktestResult, console: Console, limit: int = 30
+    ) -> None:
+        """Display a backtest summary and its largest trades."""
+        stats = result.summary()
+        console.print(
+            f"[bold]Trades:[/bold] {stats['trades']}  "
+            f"[bold]Win rate:[/bold] {stats['win_rate']:.1f}%  "
+            f"[bold]Avg return:[/bold] {stats['avg_return_pct']:.2f}%  "
+            f"[bold]Total P&L:[/bold] ${stats['total_pnl']:,.2f}  "
+            f"[bold]Max drawdown:[/bold] ${stats['max_drawdown']:,.2f}  "
+            f"[bold]Final equity:[/bold] ${stats['final_equity']:,.2f}"
+        )
+        self.display_trades(
+            result.trades.sort(pl.col("pnl").abs(), descending=True),
+            console,
+            limit,
+        )
+
+    def display_trades(
+        self, trades: Results, console: Console, limit: int = 30
+    ) -> None:
+        """Display trades in a formatted table."""
+        if not result_count(trades):
+            console.print("[yellow]No trades[/yellow]")
+            return
+
+        table = Table(
+            title=f"Backtest Trades (showing {min(limit, result_count(trades))}"
+            f" of {result_count(trades)})"
+        )
+        table.add_column("Ticker", style="cyan", width=8)
+        table.add_column("Entry", style="yellow", width=12)
+        table.add_column("Gap %", width=8)
+        table.add_column("Price", width=8)
+        table.add_column("Qty", justify="right", width=6)
+        table.add_column("Exit", style="yellow", width=12)
+        table.add_column("Exit $", width=8)
+        table.add_column("Reason", width=6)
+        table.add_column("P&L", justify="right", width=10)
+
+        for t in shown_rows(trades, limit):
+            color = "green" if t["pnl"] > 0 else "red"
+            table.add_row(
+                t["ticker"],
+                t["entry_date"].strftime("%Y-%m-%d"),
+                f"{t['gap_percent']:.1f}%",
+                f"{t['entry_price']:.3f}",
+                f"{t['quantity']:,}",
+                t["exit_date"].strftime("%Y-%m-%d"),
+                f"{t['exit_price']:.3f}",
+                t["exit_reason"],
+                f"[{color}]{t['pnl']:,.2f}[/{color}]",
+            )
+
+        console.print(table)
@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the analysis pipeline.
+
+Run with ``python -m skim.analysis.bench``; see ``--help`` for scales
+and baseline options.
+"""
@@ -0,0 +1,141 @@
+"""Command-line entry point for the analysis benchmarks."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from loguru import logger
+from rich.console import Console
+
+from skim.analysis.bench.runner import (
+    DEFAULT_BASELINE,
+    DEFAULT_CACHE_DIR,
+    IMPORT_TICKERS,
+    REGRESSION_THRESHOLD,
+    compare,
+    dataset_dir,
+    display_results,
+    load_baseline,
+    regressions,
+    run_suite,
+    save_baseline,
+)
+
+SCALES = {"small": 500, "medium": 2_000, "large": 5_000}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the benchmark argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m skim.analysis.bench",
+        description="Benchmark the analysis pipeline on synthetic data",
+    )
+    parser.add_argument(
+        "--scale",
+        choices=SCALES,
+        default="small",
+        help="Universe size: small (500), medium (2,000) or large (5,000)",
+    )
+    parser.add_argument(
+        "--tickers", type=int, help="Number of tickers (overrides --scale)"
+    )
+    parser.add_argument(
+        "--years", type=int, default=10, help="Years of history (default: 10)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Generator seed (default: 0)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per step (default: 3)"
+    )
+    parser.add_argument(
+        "--skip",
+        action="append",
+        default=[],
+        metavar="STEP",
+        help="Leave out a step (repeatable)",
+    )
+    parser.add_argument(
+        "--import-tickers",
+        type=int,
+        default=IMPORT_TICKERS,
+        help=f"Tickers imported by import_historical (default: {IMPORT_TICKERS})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Where generated datasets are kept (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help=f"Baseline results file (default: {DEFAULT_BASELINE})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write this run's results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="Slowdown that counts as a regression (default: 0.20)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmarks and compare them against the baseline.
+
+    Returns:
+        1 if any step regressed beyond the threshold, otherwise 0
+    """
+    args = build_parser().parse_args(argv)
+    console = Console()
+    logger.disable("skim")
+
+    tickers = args.tickers or SCALES[args.scale]
+    scale = {"tickers": tickers, "years": args.years, "seed": args.seed}
+    console.print(
+        f"[cyan]→ Preparing {tickers:,} tickers × {args.years} years...[/cyan]"
+    )
+    data_dir = dataset_dir(tickers, args.years, args.seed, args.cache_dir)
+
+    results = run_suite(
+        data_dir,
+        repeat=args.repeat,
+        skip=set(args.skip),
+        import_tickers=args.import_tickers,
+    )
+
+    changes = None
+    if not args.save_baseline and args.baseline.exists():
+        baseline = load_baseline(args.baseline)
+        if baseline.get("scale") == scale:
+            changes = compare(results, baseline)
+        else:
+            console.print(
+                f"[yellow]Baseline was measured at {baseline.get('scale')}, "
+                "not comparing[/yellow]"
+            )
+
+    display_results(results, console, changes, args.threshold)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline, scale)
+        console.print(f"[green]✓ Saved baseline to {args.baseline}[/green]")
+        return 0
+
+    slower = regressions(changes or {}, args.threshold)
+    if slower:
+        console.print(f"[red]Regressed: {', '.join(slower)}[/red]")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
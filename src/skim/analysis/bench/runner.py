@@ -0,0 +1,349 @@
+"""
+Timing and peak-memory benchmarks for the analysis pipeline.
+
+Each step runs against a cached synthetic universe (see ``synthetic``):
+per-step setup such as building the universe frame is excluded from the
+timing, every step reports the best of ``repeat`` runs and the peak
+resident memory seen while it ran, and results can be saved as a JSON
+baseline and compared against later runs.
+"""
+
+import json
+import resource
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+from skim.analysis.backtest import Backtester
+from skim.analysis.bench.synthetic import generate_universe
+from skim.analysis.data_loader import DataLoader
+from skim.analysis.gap_scanner import GapScanner
+from skim.analysis.momentum_scanner import MomentumScanner
+from skim.analysis.performance import PerformanceCalculator
+from skim.analysis.stock_data import StockData
+from skim.infrastructure.database.historical import HistoricalDataRepository
+from skim.infrastructure.database.historical.repository import (
+    HistoricalDatabase,
+)
+from skim.trading.data.import_historical import import_directory
+
+DEFAULT_CACHE_DIR = Path("data/bench")
+DEFAULT_BASELINE = DEFAULT_CACHE_DIR / "baseline.json"
+
+# Fractional slowdown against the baseline that counts as a regression
+REGRESSION_THRESHOLD = 0.20
+
+# import_historical writes row by row, so it runs over a ticker subset
+IMPORT_TICKERS = 10
+
+# A step's setup returns the callable that is timed
+Step = Callable[[], Callable[[], object]]
+
+
+@dataclass
+class BenchResult:
+    """Best wall time and peak resident memory of one step."""
+
+    name: str
+    seconds: float
+    peak_mb: float
+
+
+def _rss_bytes() -> int:
+    """Current resident set size, or the process peak where unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class PeakMemory:
+    """Context manager sampling resident memory on a background thread."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _rss_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "PeakMemory":
+        self.peak = _rss_bytes()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_bytes())
+
+
+def measure(name: str, step: Step, repeat: int = 3) -> BenchResult:
+    """
+    Time a benchmark step.
+
+    Args:
+        name: Step name
+        step: Setup function returning the callable to time
+        repeat: Number of timed runs; the fastest is reported
+
+    Returns:
+        BenchResult with the best time and the highest peak memory
+    """
+    best = float("inf")
+    peak = 0
+    for _ in range(max(repeat, 1)):
+        run = step()
+        with PeakMemory() as memory:
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+        best = min(best, elapsed)
+        peak = max(peak, memory.peak)
+    return BenchResult(name, best, peak / 1024**2)
+
+
+def dataset_dir(
+    tickers: int, years: int, seed: int, cache_dir: Path = DEFAULT_CACHE_DIR
+) -> Path:
+    """
+    Synthetic dataset for a scale, generated on first use.
+
+    Args:
+        tickers: Number of tickers
+        years: Years of history
+        seed: Generator seed
+        cache_dir: Directory holding generated datasets
+
+    Returns:
+        Directory of per-ticker CSVs
+    """
+    root = cache_dir / f"{tickers}x{years}y-seed{seed}"
+    historical = root / "historical"
+    if not (root / ".complete").exists():
+        shutil.rmtree(root, ignore_errors=True)
+        generate_universe(root, tickers=tickers, years=years, seed=seed)
+        (root / ".complete").touch()
+    return historical
+
+
+def build_steps(
+    data_dir: Path,
+    work_dir: Path,
+    import_tickers: int = IMPORT_TICKERS,
+) -> dict[str, Step]:
+    """
+    Benchmark steps over a directory of per-ticker CSVs.
+
+    Scans cover the final year of data and the backtest the final ten
+    years. Every loaded ticker is kept (no price or volume filter), so
+    the universe has as many tickers as the chosen scale.
+
+    Args:
+        data_dir: Directory of per-ticker CSVs
+        work_dir: Scratch directory for import databases
+        import_tickers: Tickers imported by the import_historical step
+
+    Returns:
+        Ordered mapping of step name to setup function
+    """
+    state: dict[str, dict[str, StockData]] = {}
+
+    def stocks() -> dict[str, StockData]:
+        if "stocks" not in state:
+            state["stocks"] = DataLoader(str(data_dir)).load_all(
+                min_price=0, min_volume=0, quiet=True
+            )
+        return state["stocks"]
+
+    def period(universe: pl.DataFrame) -> tuple[datetime, datetime]:
+        latest = universe["date"].max()
+        assert isinstance(latest, date)
+        end = datetime.combine(latest, datetime.min.time())
+        return end - timedelta(days=365), end
+
+    def load_all():
+        loader = DataLoader(str(data_dir))
+
+        def run():
+            state["stocks"] = loader.load_all(
+                min_price=0, min_volume=0, quiet=True
+            )
+
+        return run
+
+    def find_gaps():
+        scanner = GapScanner(stocks())
+        start, end = period(scanner.universe)
+        return lambda: scanner.find_gaps(start, end)
+
+    def momentum_bursts():
+        scanner = MomentumScanner(stocks())
+        start, end = period(scanner.universe)
+        return lambda: scanner.find_all_momentum_bursts(start, end)
+
+    def consolidations():
+        scanner = MomentumScanner(stocks())
+        start, end = period(scanner.universe)
+        return lambda: scanner.find_all_consolidations(start, end)
+
+    def top_performers():
+        calculator = PerformanceCalculator(stocks())
+        start, end = period(calculator.universe)
+        return lambda: calculator.find_top_performers(
+            start, end, min_price=0, min_volume=0
+        )
+
+    def backtest():
+        backtester = Backtester(stocks())
+        start, end = period(backtester.universe)
+        return lambda: backtester.run(start - timedelta(days=9 * 365), end)
+
+    def import_historical():
+        work = Path(tempfile.mkdtemp(dir=work_dir))
+        subset = work / "csv"
+        subset.mkdir()
+        for path in sorted(data_dir.glob("*.csv"))[:import_tickers]:
+            shutil.copy(path, subset / path.name)
+        repo = HistoricalDataRepository(
+            HistoricalDatabase(str(work / "historical.db"))
+        )
+        return lambda: import_directory(subset, repo, quiet=True)
+
+    return {
+        "load_all": load_all,
+        "find_gaps": find_gaps,
+        "momentum_bursts": momentum_bursts,
+        "consolidations": consolidations,
+        "top_performers": top_performers,
+        "backtest": backtest,
+        "import_historical": import_historical,
+    }
+
+
+def run_suite(
+    data_dir: Path,
+    repeat: int = 3,
+    skip: set[str] | None = None,
+    import_tickers: int = IMPORT_TICKERS,
+) -> list[BenchResult]:
+    """
+    Run every benchmark step not skipped.
+
+    Args:
+        data_dir: Directory of per-ticker CSVs
+        repeat: Timed runs per step
+        skip: Step names to leave out
+        import_tickers: Tickers imported by the import_historical step
+
+    Returns:
+        One BenchResult per step, in run order
+    """
+    skip = skip or set()
+    with tempfile.TemporaryDirectory(prefix="skim-bench-") as work_dir:
+        steps = build_steps(data_dir, Path(work_dir), import_tickers)
+        return [
+            measure(name, step, repeat)
+            for name, step in steps.items()
+            if name not in skip
+        ]
+
+
+def save_baseline(results: list[BenchResult], path: Path, scale: dict) -> None:
+    """Write results and the scale they were measured at as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "scale": scale,
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def load_baseline(path: Path) -> dict:
+    """
+    Read a baseline written by ``save_baseline``.
+
+    Raises:
+        ValueError: If the file is not a benchmark baseline
+    """
+    payload = json.loads(path.read_text())
+    if "results" not in payload:
+        raise ValueError(f"Not a benchmark baseline: {path}")
+    return payload
+
+
+def compare(
+    results: list[BenchResult], baseline: dict
+) -> dict[str, float | None]:
+    """
+    Relative change in time of each step against a baseline.
+
+    Args:
+        results: Current results
+        baseline: Payload from ``load_baseline``
+
+    Returns:
+        Mapping of step name to fractional change (None without a
+        baseline entry)
+    """
+    changes: dict[str, float | None] = {}
+    for result in results:
+        base = baseline["results"].get(result.name)
+        if base is None or base["seconds"] <= 0:
+            changes[result.name] = None
+        else:
+            changes[result.name] = result.seconds / base["seconds"] - 1
+    return changes
+
+
+def regressions(
+    changes: dict[str, float | None], threshold: float = REGRESSION_THRESHOLD
+) -> list[str]:
+    """Steps whose time grew by more than ``threshold``."""
+    return [
+        name
+        for name, change in changes.items()
+        if change is not None and change > threshold
+    ]
+
+
+def display_results(
+    results: list[BenchResult],
+    console: Console,
+    changes: dict[str, float | None] | None = None,
+    threshold: float = REGRESSION_THRESHOLD,
+) -> None:
+    """Display benchmark results, with baseline changes when given."""
+    table = Table(title="Analysis Benchmarks")
+    table.add_column("Step", style="cyan")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    if changes is not None:
+        table.add_column("vs Baseline", justify="right")
+
+    for result in results:
+        row = [result.name, f"{result.seconds:.3f}", f"{result.peak_mb:,.0f}"]
+        if changes is not None:
+            change = changes.get(result.name)
+            if change is None:
+                row.append("N/A")
+            else:
+                color = "red" if change > threshold else "green"
+                row.append(f"[{color}]{change:+.1%}[/{color}]")
+        table.add_row(*row)
+
+    console.print(table)
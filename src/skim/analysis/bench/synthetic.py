@@ -0,0 +1,170 @@
+"""
+Deterministic synthetic ASX universe in CoolTrader file formats.
+
+Per-ticker history files (``AAA.csv``) match the processed historical
+directory read by ``DataLoader`` and ``import_historical``. Monthly zips
+(``YYYYMM.zip``) hold one ``YYYYMMDD.csv`` per trading day with every
+ticker's bar, as consumed by ``DataPreprocessor``. Every ticker draws
+from its own seeded generator, so a given scale always produces
+byte-identical files.
+"""
+
+import math
+import random
+import string
+import zipfile
+from datetime import date, timedelta
+from itertools import islice, product
+from pathlib import Path
+
+import polars as pl
+
+from skim.analysis.stock_data import CSV_COLUMNS
+
+TRADING_DAYS_PER_YEAR = 252
+GAP_PROBABILITY = 0.01
+
+
+def synthetic_tickers(count: int) -> list[str]:
+    """First ``count`` three-letter tickers (AAA, AAB, ...)."""
+    letters = string.ascii_uppercase
+    return [
+        "".join(chars) for chars in islice(product(letters, repeat=3), count)
+    ]
+
+
+def trading_days(end: date, count: int) -> list[date]:
+    """The ``count`` weekdays up to and including ``end``."""
+    days = []
+    current = end
+    while len(days) < count:
+        if current.weekday() < 5:
+            days.append(current)
+        current -= timedelta(days=1)
+    return days[::-1]
+
+
+def synthetic_bars(ticker: str, days: list[date], seed: int) -> pl.DataFrame:
+    """
+    Generate one ticker's daily OHLCV history.
+
+    Prices follow a log-normal random walk with occasional opening gaps
+    on elevated volume; about a fifth of tickers list part-way through
+    the history.
+
+    Args:
+        ticker: Ticker symbol (also salts the generator)
+        days: Trading days of the full history
+        seed: Universe seed
+
+    Returns:
+        DataFrame with CSV_COLUMNS and a Date-typed date column
+    """
+    rng = random.Random(f"{seed}:{ticker}")
+    listed = rng.randrange(len(days) // 2) if rng.random() < 0.2 else 0
+    n = len(days) - listed
+
+    price = math.exp(rng.uniform(math.log(0.02), math.log(60.0)))
+    base_volume = math.exp(rng.uniform(math.log(5_000), math.log(5_000_000)))
+    volatility = rng.uniform(0.01, 0.05)
+
+    gaps = [
+        rng.uniform(0.05, 0.30) if rng.random() < GAP_PROBABILITY else 0.0
+        for _ in range(n)
+    ]
+    frame = pl.DataFrame(
+        {
+            "date": days[listed:],
+            "ret": [rng.gauss(0.0, volatility) for _ in range(n)],
+            "gap": gaps,
+            "wick": [abs(rng.gauss(0.0, volatility)) for _ in range(n)],
+            "vol_noise": [rng.gauss(0.0, 0.5) for _ in range(n)],
+        }
+    )
+
+    close = price * (pl.col("ret") + pl.col("gap")).cum_sum().exp()
+    prev_close = close.shift(1).fill_null(price)
+    open_ = prev_close * (1 + pl.col("gap"))
+    return frame.select(
+        pl.lit(ticker).alias("ticker"),
+        "date",
+        open_.round(3).alias("open"),
+        (pl.max_horizontal(open_, close) * (1 + pl.col("wick")))
+        .round(3)
+        .alias("high"),
+        (pl.min_horizontal(open_, close) * (1 - pl.col("wick")))
+        .round(3)
+        .alias("low"),
+        close.round(3).alias("close"),
+        (
+            base_volume
+            * pl.col("vol_noise").exp()
+            * pl.when(pl.col("gap") > 0).then(4.0).otherwise(1.0)
+        )
+        .cast(pl.Int64)
+        .alias("volume"),
+    ).with_columns(pl.col("open", "high", "low", "close").clip(0.001))
+
+
+def _write_csv(frame: pl.DataFrame, path: Path) -> None:
+    """Write bars in CoolTrader CSV format (no header, DD/MM/YYYY)."""
+    frame.with_columns(pl.col("date").dt.strftime("%d/%m/%Y")).select(
+        CSV_COLUMNS
+    ).write_csv(path, include_header=False)
+
+
+def generate_universe(
+    out_dir: Path,
+    tickers: int = 500,
+    years: int = 10,
+    seed: int = 0,
+    zip_months: int = 3,
+    end: date = date(2025, 12, 31),
+) -> Path:
+    """
+    Write a synthetic universe of per-ticker CSVs and monthly daily zips.
+
+    Args:
+        out_dir: Output directory; history goes to ``historical/`` and
+            zips to ``zips/``
+        tickers: Number of tickers
+        years: Years of daily history per ticker
+        seed: Generator seed
+        zip_months: Trailing months also written as daily-file zips
+        end: Last trading day of the history
+
+    Returns:
+        Directory of per-ticker CSVs
+    """
+    historical = out_dir / "historical"
+    zips = out_dir / "zips"
+    historical.mkdir(parents=True, exist_ok=True)
+    zips.mkdir(parents=True, exist_ok=True)
+
+    days = trading_days(end, years * TRADING_DAYS_PER_YEAR)
+    zip_start = date(end.year, end.month, 1)
+    for _ in range(zip_months - 1):
+        zip_start = (zip_start - timedelta(days=1)).replace(day=1)
+
+    recent = []
+    for ticker in synthetic_tickers(tickers):
+        bars = synthetic_bars(ticker, days, seed)
+        _write_csv(bars, historical / f"{ticker}.csv")
+        if zip_months > 0:
+            recent.append(bars.filter(pl.col("date") >= zip_start))
+
+    if recent:
+        daily = pl.concat(recent).sort("date", "ticker")
+        for (month,), bars in daily.group_by(
+            pl.col("date").dt.strftime("%Y%m"), maintain_order=True
+        ):
+            with zipfile.ZipFile(zips / f"{month}.zip", "w") as archive:
+                for (day,), day_bars in bars.group_by(
+                    pl.col("date").dt.strftime("%Y%m%d"), maintain_order=True
+                ):
+                    buffer = day_bars.with_columns(
+                        pl.col("date").dt.strftime("%d/%m/%Y")
+                    ).write_csv(include_header=False)
+                    archive.writestr(f"{day}.csv", buffer)
+
+    return historical
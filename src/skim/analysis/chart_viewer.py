@@ -9,6 +9,99 @@ from rich.console import Console
 from skim.analysis.date_parser import parse_date_range
 from skim.analysis.stock_data import StockData
 
+# Resampling intervals from finest to coarsest (group_by_dynamic syntax)
+INTERVALS = ["1d", "1w", "1mo"]
+
+INTERVAL_ALIASES = {
+    "d": "1d",
+    "daily": "1d",
+    "w": "1w",
+    "weekly": "1w",
+    "m": "1mo",
+    "monthly": "1mo",
+}
+
+# Terminal columns taken by the price axis and chart border
+CHART_MARGIN = 16
+
+
+def parse_interval(interval: str) -> str:
+    """
+    Normalise a user-supplied chart interval.
+
+    Args:
+        interval: "1d"/"daily"/"d", "1w"/"weekly"/"w" or "1mo"/"monthly"/"m"
+
+    Returns:
+        Interval in group_by_dynamic syntax
+
+    Raises:
+        ValueError: If the interval is not supported
+    """
+    value = interval.strip().lower()
+    value = INTERVAL_ALIASES.get(value, value)
+    if value not in INTERVALS:
+        raise ValueError(
+            f"Unknown interval '{interval}'. Use daily, weekly or monthly"
+        )
+    return value
+
+
+def choose_interval(dates: pl.Series, width: int) -> str:
+    """
+    Pick the finest interval whose candles fit the terminal width.
+
+    Args:
+        dates: Bar dates of the period being charted
+        width: Terminal width in columns
+
+    Returns:
+        Interval in group_by_dynamic syntax
+    """
+    slots = max(width - CHART_MARGIN, 1)
+    for interval in INTERVALS:
+        if dates.dt.truncate(interval).n_unique() <= slots:
+            return interval
+    return INTERVALS[-1]
+
+
+def resample_ohlcv(df: pl.DataFrame, interval: str) -> pl.DataFrame:
+    """
+    Aggregate daily bars into OHLCV bars of a coarser interval.
+
+    Args:
+        df: Daily bars sorted by date
+        interval: Interval in group_by_dynamic syntax
+
+    Returns:
+        One bar per interval (daily input is returned unchanged)
+    """
+    if interval == "1d":
+        return df
+    return (
+        df.sort("date")
+        .group_by_dynamic("date", every=interval)
+        .agg(
+            pl.col("open").first(),
+            pl.col("high").max(),
+            pl.col("low").min(),
+            pl.col("close").last(),
+            pl.col("volume").sum(),
+        )
+    )
+
+
+def build_candles(df: pl.DataFrame) -> list[Candle]:
+    """Build chart candles from the OHLCV column buffers."""
+    columns = [
+        df[name].cast(pl.Float64).to_list()
+        for name in ("open", "high", "low", "close", "volume")
+    ]
+    return [
+        Candle(open=o, high=h, low=lo, close=c, volume=v)
+        for o, h, lo, c, v in zip(*columns, strict=True)
+    ]
+
 
 class ChartViewer:
     """Displays terminal candlestick charts for stocks."""
@@ -17,14 +110,23 @@ class ChartViewer:
         self.stocks = stocks
         self.console = console
 
-    def show_chart(self, ticker: str, period: str | None = None) -> None:
+    def show_chart(
+        self,
+        ticker: str,
+        period: str | None = None,
+        interval: str | None = None,
+    ) -> None:
         """
         Display terminal candlestick chart for a ticker.
 
+        Long periods are resampled to weekly or monthly candles so the
+        chart fits the terminal width, unless an interval is given.
+
         Args:
             ticker: Stock ticker symbol
             period: Optional time period (e.g., "2024", "2024-03", "1M", "3M")
                     If None, shows last 100 candles
+            interval: Optional candle interval ("daily", "weekly", "monthly")
         """
         ticker_upper = ticker.upper()
 
@@ -70,18 +172,23 @@ class ChartViewer:
             return
 
         try:
-            candles = [
-                Candle(
-                    open=float(row["open"]),
-                    close=float(row["close"]),
-                    high=float(row["high"]),
-                    low=float(row["low"]),
-                    volume=float(row["volume"]),
-                )
-                for row in df.iter_rows(named=True)
-            ]
+            interval = (
+                parse_interval(interval)
+                if interval
+                else choose_interval(df["date"], self.console.width)
+            )
+        except ValueError as e:
+            self.console.print(f"[red]{e}[/red]")
+            return
+
+        df = resample_ohlcv(
+            df.drop_nulls(["open", "high", "low", "close"]), interval
+        )
+
+        try:
+            candles = build_candles(df)
 
-            chart = Chart(candles, title=f"{ticker_upper} OHLC")
+            chart = Chart(candles, title=f"{ticker_upper} OHLC ({interval})")
             chart.set_name(f"ASX:{ticker_upper}")
             chart.set_bear_color(255, 107, 107)
             chart.set_bull_color(75, 199, 124)
@@ -0,0 +1,209 @@
+"""
+Non-interactive batch mode for the analysis console.
+
+Runs a script of console commands against one loaded dataset and writes
+each command's results to a file instead of rendering a Rich table. A
+script is a text file (or ``-c`` string) of commands separated by newlines
+or ``;``, with ``#`` starting a comment line, e.g.::
+
+    gaps 2024; top 3M
+    bursts 1Y
+
+Results are written to ``<n>-<command>.<ext>`` in the output directory
+as CSV, JSON Lines or Parquet, so large result sets are never rendered
+row by row. Messages go to stderr.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+import polars as pl
+from rich.console import Console
+
+from skim.analysis.cli.cli import CLI
+from skim.analysis.results import Results
+
+# Commands with a result set to write; the others only print
+BATCH_COMMANDS = frozenset(
+    {
+        "top",
+        "gaps",
+        "ann",
+        "search",
+        "momentum",
+        "bursts",
+        "consolidate",
+        "pattern",
+        "perf",
+        "movestats",
+        "screen",
+        "backtest",
+        "sectors",
+    }
+)
+
+# Batch commands that read the archives rather than stock data
+ARCHIVE_COMMANDS = frozenset({"ann", "search"})
+
+FORMATS = {"csv": ".csv", "json": ".jsonl", "parquet": ".parquet"}
+
+DEFAULT_OUTPUT_DIR = Path("results")
+
+
+def split_commands(script: str) -> list[str]:
+    """
+    Split a batch script into commands.
+
+    Args:
+        script: Commands separated by newlines or ``;``
+
+    Returns:
+        Non-empty commands in order, without comment lines
+    """
+    return [
+        command.strip()
+        for line in script.splitlines()
+        if not line.lstrip().startswith("#")
+        for command in line.split(";")
+        if command.strip()
+    ]
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in FORMATS:
+        raise ValueError(
+            f"Unknown format '{fmt}' (expected one of: {', '.join(FORMATS)})"
+        )
+
+
+def write_results(results: Results, path: Path, fmt: str) -> int:
+    """
+    Write a result set to a CSV, JSON Lines or Parquet file.
+
+    List columns are joined with ``;`` in CSV output, which has no nested
+    values.
+
+    Args:
+        results: Scanner result frame or list of dictionaries
+        path: Output file
+        fmt: One of FORMATS
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    _check_format(fmt)
+    frame = (
+        results if isinstance(results, pl.DataFrame) else pl.DataFrame(results)
+    )
+    if fmt == "csv":
+        frame = frame.with_columns(
+            pl.col(name).cast(pl.List(pl.String)).list.join(";")
+            for name, dtype in frame.schema.items()
+            if isinstance(dtype, pl.List)
+        )
+
+    if fmt == "csv":
+        frame.write_csv(path)
+    elif fmt == "json":
+        frame.write_ndjson(path)
+    else:
+        frame.write_parquet(path)
+    return frame.height
+
+
+class BatchRunner:
+    """Runs console commands against one dataset, writing results."""
+
+    def __init__(
+        self,
+        cli: CLI,
+        output_dir: Path = DEFAULT_OUTPUT_DIR,
+        fmt: str = "csv",
+        keep_going: bool = False,
+    ):
+        """
+        Args:
+            cli: Console to run commands on; its output is sent to stderr
+            output_dir: Directory for result files
+            fmt: Output format, one of FORMATS
+            keep_going: Run the remaining commands after a failure
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        _check_format(fmt)
+        self.cli = cli
+        self.cli.console = Console(stderr=True)
+        self.cli.result_sink = self._write
+        self.console = self.cli.console
+        self.output_dir = Path(output_dir)
+        self.fmt = fmt
+        self.keep_going = keep_going
+        self.written: list[Path] = []
+        self._step = 0
+        self._emitted = False
+
+    def run(self, commands: Iterable[str]) -> int:
+        """
+        Run commands in order.
+
+        Stock data is loaded once, in the background, if any command
+        needs it.
+
+        Args:
+            commands: Console command lines
+
+        Returns:
+            Exit status: 0 if every command succeeded, 1 otherwise
+        """
+        commands = list(commands)
+        if not commands:
+            self.console.print("[red]Error: No commands to run[/red]")
+            return 1
+
+        names = [command.split()[0].lower() for command in commands]
+        if any(name not in ARCHIVE_COMMANDS for name in names):
+            self.cli.start_background_load()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        failures = 0
+        for step, (command, name) in enumerate(
+            zip(commands, names, strict=True), start=1
+        ):
+            self._step = step
+            if not self._run_one(command, name):
+                failures += 1
+                self.console.print(
+                    f"[red]✗ Command {step} failed: {command}[/red]"
+                )
+                if not self.keep_going:
+                    break
+
+        return 1 if failures else 0
+
+    def _run_one(self, command: str, name: str) -> bool:
+        """Run one command; it succeeds when it writes a result file."""
+        if name not in BATCH_COMMANDS:
+            self.console.print(
+                f"[red]Error: '{name}' is not available in batch mode "
+                f"(use one of: {', '.join(sorted(BATCH_COMMANDS))})[/red]"
+            )
+            return False
+
+        self._emitted = False
+        try:
+            self.cli.execute(command)
+        except Exception as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+            return False
+        return self._emitted
+
+    def _write(self, name: str, results: Results) -> None:
+        path = self.output_dir / f"{self._step:02d}-{name}{FORMATS[self.fmt]}"
+        rows = write_results(results, path, self.fmt)
+        self.written.append(path)
+        self._emitted = True
+        self.console.print(f"[green]✓ {rows:,} rows → {path}[/green]")
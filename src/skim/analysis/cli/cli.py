@@ -2,32 +2,84 @@
 Interactive console interface for ASX stock analysis.
 """
 
-import yfinance as yf
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
 from skim.analysis.announcement_scraper import AnnouncementScraper
+from skim.analysis.announcements import (
+    AnnouncementArchive,
+    display_headlines,
+    link_announcements,
+)
+from skim.analysis.backtest import FALLBACK_STOP_PCT, Backtester
 from skim.analysis.chart_viewer import ChartViewer
+from skim.analysis.company_info import (
+    DEFAULT_TTL,
+    CompanyStore,
+    display_sectors,
+    format_market_cap,
+    sector_performance,
+    yahoo_company_info,
+)
 from skim.analysis.data_downloader import CoolTraderDownloader
 from skim.analysis.data_loader import DataLoader
 from skim.analysis.date_parser import parse_date_range
+from skim.analysis.event_index import EventIndex
 from skim.analysis.gap_scanner import GapScanner
-from skim.analysis.momentum_scanner import MomentumScanner
+from skim.analysis.momentum_scanner import (
+    MomentumScanner,
+    move_statistics_frame,
+)
 from skim.analysis.performance import PerformanceCalculator
+from skim.analysis.results import Results
+from skim.analysis.screener import Screener
+from skim.trading.core.config import ScannerConfig
 
 
 class CLI:
     """Interactive command-line interface."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        shared_path: Path | None = None,
+        index_path: Path | None = None,
+        archive_path: Path | None = None,
+        company_path: Path | None = None,
+    ):
         self.console = Console()
+        self.shared_path = shared_path
+        self.index_path = index_path
+        self.archive = (
+            AnnouncementArchive(archive_path) if archive_path else None
+        )
+        self.companies = CompanyStore(company_path) if company_path else None
         self.loader: DataLoader
         self.calculator: PerformanceCalculator
         self.scanner: GapScanner
         self.momentum_scanner: MomentumScanner
-        self.scraper = AnnouncementScraper()
+        self.screener: Screener
+        self.backtester: Backtester
+        self.scraper = AnnouncementScraper(self.archive)
         self.viewer: ChartViewer
         self.data_loaded = False
+        self._load_future: Future[DataLoader] | None = None
+        self._load_progress: tuple[int, int] = (0, 0)
+        self.timing_enabled = False
+        # Receives (command, results) instead of rendering, in batch mode
+        self.result_sink: Callable[[str, Results], None] | None = None
 
     def show_welcome(self):
         """Display welcome message."""
@@ -36,15 +88,19 @@ class CLI:
 
         Commands:
         [yellow]top <period>[/yellow]      - Show top performers (e.g., 'top 2024', 'top 2024-03')
-        [yellow]gaps <period>[/yellow]     - Show gaps (e.g., 'gaps 2024-06')
+        [yellow]gaps <period> [--news][/yellow] - Show gaps (e.g., 'gaps 2024-06')
         [yellow]ann <ticker> <period>[/yellow] - Show announcements (e.g., 'ann BHP 2024')
+        [yellow]search <query>[/yellow]    - Search announcement headlines (e.g., 'search "trading halt"')
         [yellow]chart <ticker> [period][/yellow] - Show terminal candlestick chart (e.g., 'chart BHP 2024')
         [yellow]momentum <period>[/yellow] - Show momentum bursts (e.g., 'momentum 2024-12')
         [yellow]consolidate <period>[/yellow] - Show consolidation patterns (e.g., 'consolidate 2024-12')
         [yellow]pattern <ticker> <period>[/yellow] - Show pattern analysis (e.g., 'pattern BHP 2024-12')
         [yellow]perf <ticker> <period>[/yellow] - Show stock performance (e.g., 'perf BHP 2024-12')
         [yellow]movestats <period>[/yellow] - Show move statistics (e.g., 'movestats 2024-12')
+        [yellow]screen <expression>[/yellow] - Screen stocks (e.g., 'screen return_3m > 30%')
+        [yellow]backtest <period>[/yellow] - Backtest the gap breakout strategy (e.g., 'backtest 2024')
         [yellow]info <ticker>[/yellow]      - Show company info (e.g., 'info BHP')
+        [yellow]sectors <period>[/yellow]  - Show returns by sector (e.g., 'sectors 2024')
         [yellow]help[/yellow]              - Show this help
         [yellow]quit[/yellow]              - Exit
         """
@@ -55,20 +111,129 @@ class CLI:
         )
 
     def load_data(self):
-        """Load stock data."""
+        """Load stock data, waiting for a background load if one is running."""
         if self.data_loaded:
             self.console.print("[yellow]Data already loaded[/yellow]")
             return
 
+        if self._load_future is not None:
+            self.ensure_data()
+            return
+
         self.console.print("[cyan]Loading stock data...[/cyan]")
-        self.loader = DataLoader()
-        self.loader.load_all(min_price=0.20, min_volume=50000)
+        self._finish_load(self._load_stocks())
+
+    def _load_stocks(
+        self,
+        quiet: bool = False,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> DataLoader:
+        """Load stocks from CSV, or attach to a shared dataset server."""
+        loader = DataLoader()
+        if self.shared_path is not None:
+            loader.attach(self.shared_path)
+        else:
+            loader.load_all(
+                min_price=0.20,
+                min_volume=50000,
+                quiet=quiet,
+                progress=progress,
+            )
+        return loader
+
+    def start_background_load(self) -> None:
+        """Start loading stock data on a background thread."""
+        if self.data_loaded or self._load_future is not None:
+            return
+
+        future: Future[DataLoader] = Future()
+
+        def worker() -> None:
+            try:
+                loader = self._load_stocks(
+                    quiet=True, progress=self._on_load_progress
+                )
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(loader)
+
+        self._load_future = future
+        threading.Thread(
+            target=worker, name="skim-data-load", daemon=True
+        ).start()
+
+    def _on_load_progress(self, done: int, total: int) -> None:
+        """Record background load progress for the prompt."""
+        self._load_progress = (done, total)
+
+    def _loading_status(self) -> str:
+        """Describe background load progress, e.g. 'loading 45%'."""
+        done, total = self._load_progress
+        if total == 0:
+            return "loading"
+        return f"loading {done * 100 // total}%"
+
+    def prompt(self) -> str:
+        """Build the input prompt, including background load progress."""
+        if self._load_future is not None and not self._load_future.done():
+            return f"[{self._loading_status()}] > "
+        return "> "
+
+    def ensure_data(self) -> bool:
+        """
+        Make sure stock data is available for a command.
+
+        Waits for the background load if it is still running.
+
+        Returns:
+            True if data is loaded, False if loading failed or never started
+        """
+        if self.data_loaded:
+            return True
+
+        if self._load_future is None:
+            self.console.print(
+                "[red]Please load data first using 'load' command[/red]"
+            )
+            return False
+
+        if not self._load_future.done():
+            self.console.print(
+                f"[cyan]Waiting for stock data ({self._loading_status()})...[/cyan]"
+            )
 
+        try:
+            loader = self._load_future.result()
+        except Exception as e:
+            self._load_future = None
+            self.console.print(f"[red]✗ Failed to load stock data: {e}[/red]")
+            return False
+
+        self._finish_load(loader)
+        return True
+
+    def _report_background_load(self) -> None:
+        """Announce a background load that finished since the last prompt."""
+        if (
+            not self.data_loaded
+            and self._load_future is not None
+            and self._load_future.done()
+        ):
+            self.ensure_data()
+
+    def _finish_load(self, loader: DataLoader) -> None:
+        """Build analysis components from a completed load."""
+        self.loader = loader
         self.calculator = PerformanceCalculator(self.loader.stocks)
-        self.scanner = GapScanner(self.loader.stocks)
-        self.momentum_scanner = MomentumScanner(self.loader.stocks)
+        index = EventIndex(self.index_path) if self.index_path else None
+        self.scanner = GapScanner(self.loader.stocks, index=index)
+        self.momentum_scanner = MomentumScanner(self.loader.stocks, index=index)
+        self.screener = Screener(self.loader.stocks)
+        self.backtester = Backtester(self.loader.stocks)
         self.viewer = ChartViewer(self.loader.stocks, self.console)
         self.data_loaded = True
+        self._load_future = None
 
         self.console.print(
             f"[green]✓ Loaded {len(self.loader.stocks)} stocks[/green]"
@@ -116,10 +281,7 @@ class CLI:
 
     def show_top_performers(self, period: str):
         """Show top performers for a period."""
-        if not self.data_loaded:
-            self.console.print(
-                "[red]Please load data first using 'load' command[/red]"
-            )
+        if not self.ensure_data():
             return
 
         try:
@@ -135,19 +297,22 @@ class CLI:
         results = self.calculator.find_top_performers(
             start_date=start_date,
             end_date=end_date,
-            limit=50,
+            limit=self._limit(50),
             min_price=0.20,
             min_volume=50000,
         )
 
-        self.calculator.display_top_performers(results, self.console)
+        self._emit(
+            "top",
+            results,
+            lambda: self.calculator.display_top_performers(
+                results, self.console
+            ),
+        )
 
-    def show_gaps(self, period: str):
-        """Show gaps for a period."""
-        if not self.data_loaded:
-            self.console.print(
-                "[red]Please load data first using 'load' command[/red]"
-            )
+    def show_gaps(self, period: str, news: bool = False):
+        """Show gaps for a period, optionally with their announcements."""
+        if not self.ensure_data():
             return
 
         try:
@@ -168,7 +333,21 @@ class CLI:
             min_volume=50000,
         )
 
-        self.scanner.display_gaps(gaps, self.console)
+        if news:
+            if self.archive is None:
+                self.console.print(
+                    "[yellow]No announcement archive configured[/yellow]"
+                )
+            else:
+                announcements = self.archive.frame(
+                    tickers=gaps["ticker"].unique(),
+                    end_date=end_date,
+                )
+                gaps = link_announcements(gaps, announcements)
+
+        self._emit(
+            "gaps", gaps, lambda: self.scanner.display_gaps(gaps, self.console)
+        )
 
     def show_announcements(self, ticker: str, period: str):
         """Show announcements for a ticker."""
@@ -185,24 +364,66 @@ class CLI:
         announcements = self.scraper.get_announcements(
             ticker, start_date, end_date
         )
-        self.scraper.display_announcements(announcements, self.console)
+        self._emit(
+            "ann",
+            announcements,
+            lambda: self.scraper.display_announcements(
+                announcements, self.console
+            ),
+        )
 
-    def show_chart(self, ticker: str, period: str | None = None):
-        """Show terminal candlestick chart for a ticker."""
-        if not self.data_loaded:
+    def show_search(
+        self,
+        query: str,
+        ticker: str | None = None,
+        period: str | None = None,
+        price_sensitive_only: bool = False,
+    ):
+        """Search stored announcement headlines."""
+        if self.archive is None:
             self.console.print(
-                "[red]Please load data first using 'load' command[/red]"
+                "[yellow]No announcement archive configured[/yellow]"
+            )
+            return
+
+        start_date = end_date = None
+        try:
+            if period is not None:
+                start_date, end_date = parse_date_range(period)
+            results = self.archive.search(
+                query,
+                ticker=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                price_sensitive_only=price_sensitive_only,
             )
+        except ValueError as e:
+            self.console.print(f"[red]Error: {e}[/red]")
+            return
+
+        self._emit(
+            "search",
+            results,
+            lambda: display_headlines(
+                results, self.console, f"Headlines matching {query}"
+            ),
+        )
+
+    def show_chart(
+        self,
+        ticker: str,
+        period: str | None = None,
+        interval: str | None = None,
+    ):
+        """Show terminal candlestick chart for a ticker."""
+        if not self.ensure_data():
             return
 
-        self.viewer.show_chart(ticker, period)
+        self.viewer.show_chart(ticker, period, interval)
 
     def show_momentum_bursts(self, period: str, min_days: int = 3):
         """Show momentum bursts for a period."""
-        if not self.data_loaded:
-            self.console.print(
-                "[red]Please load data first using 'load' command[/red]"
-            )
+        if not self.ensure_data():
             return
 
         try:
@@ -219,19 +440,26 @@ class CLI:
             start_date=start_date,
             end_date=end_date,
             min_days=min_days,
-            limit=50,
+            limit=self._limit(50),
         )
 
-        self.momentum_scanner.display_momentum_bursts(bursts, self.console)
+        self._emit(
+            "momentum",
+            bursts,
+            lambda: self.momentum_scanner.display_momentum_bursts(
+                bursts, self.console
+            ),
+        )
 
     def show_consolidations(
-        self, period: str, max_range: float = 10.0, min_days: int = 5
+        self,
+        period: str,
+        max_range: float = 10.0,
+        min_days: int = 5,
+        merge: bool = True,
     ):
         """Show consolidation patterns for a period."""
-        if not self.data_loaded:
-            self.console.print(
-                "[red]Please load data first using 'load' command[/red]"
-            )
+        if not self.ensure_data():
             return
 
         try:
@@ -249,19 +477,21 @@ class CLI:
             end_date=end_date,
             max_range_pct=max_range,
             min_days=min_days,
-            limit=50,
+            limit=self._limit(50),
+            merge=merge,
         )
 
-        self.momentum_scanner.display_consolidations(
-            consolidations, self.console
+        self._emit(
+            "consolidate",
+            consolidations,
+            lambda: self.momentum_scanner.display_consolidations(
+                consolidations, self.console
+            ),
         )
 
     def show_pattern_analysis(self, ticker: str, period: str):
         """Show pattern analysis for a specific stock."""
-        if not self.data_loaded:
-            self.console.print(
-                "[red]Please load data first using 'load' command[/red]"
-            )
+        if not self.ensure_data():
             return
 
         try:
@@ -277,7 +507,30 @@ class CLI:
         patterns = self.momentum_scanner.analyze_stock_patterns(
             ticker, start_date, end_date
         )
+        if "error" in patterns:
+            self.console.print(
+                f"[red]Stock {ticker} not found in loaded data[/red]"
+            )
+            return
+
+        # One result set: both pattern types, told apart by pattern_type
+        found = pl.concat(
+            [
+                pl.DataFrame(patterns["momentum_bursts"]),
+                pl.DataFrame(patterns["consolidations"]),
+            ],
+            how="diagonal_relaxed",
+        )
+        self._emit(
+            "pattern",
+            found,
+            lambda: self._print_pattern_analysis(ticker, period, patterns),
+        )
 
+    def _print_pattern_analysis(
+        self, ticker: str, period: str, patterns: dict
+    ) -> None:
+        """Render a stock's bursts and consolidations."""
         self.console.print(
             f"[bold]Pattern Analysis for {ticker} ({period})[/bold]\n"
         )
@@ -298,10 +551,7 @@ class CLI:
 
     def show_performance(self, ticker: str, period: str):
         """Show performance metrics for a specific stock."""
-        if not self.data_loaded:
-            self.console.print(
-                "[red]Please load data first using 'load' command[/red]"
-            )
+        if not self.ensure_data():
             return
 
         if ticker.upper() not in self.loader.stocks:
@@ -329,8 +579,23 @@ class CLI:
             )
             return
 
-        from rich.table import Table
+        # Trailing 1M/3M/6M/1Y returns up to the end of the period
+        trailing = self.calculator.returns_matrix(
+            [ticker], reference_date=end_date
+        )
+        for name in trailing.columns[1:]:
+            metrics[f"return_{name}"] = trailing[name][0]
 
+        self._emit(
+            "perf",
+            pl.DataFrame([metrics]),
+            lambda: self._print_performance(ticker, period, metrics),
+        )
+
+    def _print_performance(
+        self, ticker: str, period: str, metrics: dict
+    ) -> None:
+        """Render a stock's performance metrics."""
         table = Table(title=f"Performance: {ticker.upper()} ({period})")
         table.add_column("Metric", style="cyan", width=15)
         table.add_column("Value", style="white", width=20)
@@ -362,15 +627,18 @@ class CLI:
         table.add_row(
             "Days", f"{metrics['days']}" if metrics.get("days") else "N/A"
         )
+        for key, value in metrics.items():
+            if key.startswith("return_"):
+                table.add_row(
+                    f"{key.removeprefix('return_')} Return %",
+                    f"{value:.2f}%" if value is not None else "N/A",
+                )
 
         self.console.print(table)
 
     def show_move_statistics(self, period: str):
         """Show move duration statistics."""
-        if not self.data_loaded:
-            self.console.print(
-                "[red]Please load data first using 'load' command[/red]"
-            )
+        if not self.ensure_data():
             return
 
         try:
@@ -384,71 +652,171 @@ class CLI:
         )
 
         stats = self.momentum_scanner.get_move_statistics(start_date, end_date)
-        self.momentum_scanner.display_move_statistics(stats, self.console)
+        self._emit(
+            "movestats",
+            move_statistics_frame(stats),
+            lambda: self.momentum_scanner.display_move_statistics(
+                stats, self.console
+            ),
+        )
 
-    def show_company_info(self, ticker: str):
-        """Show company information using yfinance."""
-        ticker = ticker.upper()
-        yahoo_ticker = f"{ticker}.AX"
+    def show_screen(self, expression: str):
+        """Show stocks matching a screen expression."""
+        if not self.ensure_data():
+            return
 
-        self.console.print(
-            f"[cyan]Fetching company info for {ticker}...[/cyan]"
+        try:
+            results = self.screener.screen(expression)
+        except ValueError as e:
+            self.console.print(f"[red]Error parsing screen: {e}[/red]")
+            return
+
+        self._emit(
+            "screen",
+            results,
+            lambda: self.screener.display_results(results, self.console),
         )
 
+    def show_backtest(
+        self,
+        period: str,
+        gap_threshold: float | None = None,
+        stop_pct: float = FALLBACK_STOP_PCT,
+        max_hold_days: int | None = None,
+    ):
+        """Backtest the gap breakout strategy over a period."""
+        if not self.ensure_data():
+            return
+
         try:
-            stock = yf.Ticker(yahoo_ticker)
-            info = stock.info
+            start_date, end_date = parse_date_range(period)
+        except ValueError as e:
+            self.console.print(f"[red]Error parsing period: {e}[/red]")
+            return
+
+        config = ScannerConfig()
+        if gap_threshold is not None:
+            config.gap_threshold = gap_threshold
+
+        self.console.print(
+            f"[cyan]Backtesting {config.gap_threshold:g}%+ gaps for {period} "
+            f"({start_date.date()} to {end_date.date()})...[/cyan]"
+        )
+
+        result = self.backtester.run(
+            start_date,
+            end_date,
+            config=config,
+            stop_pct=stop_pct,
+            max_hold_days=max_hold_days,
+        )
+        self._emit(
+            "backtest",
+            result.trades,
+            lambda: self.backtester.display_results(result, self.console),
+        )
+
+    def show_company_info(self, ticker: str):
+        """Show company information, read locally while it is fresh."""
+        ticker = ticker.upper()
+        info = self.companies.get(ticker) if self.companies else None
 
-            if not info or "longName" not in info:
+        if info is None or datetime.now() - info["fetched_at"] > DEFAULT_TTL:
+            self.console.print(
+                f"[cyan]Fetching company info for {ticker}...[/cyan]"
+            )
+            try:
+                fetched = yahoo_company_info(ticker)
+            except Exception as e:
+                if info is None:
+                    self.console.print(
+                        f"[red]Error fetching info for {ticker}: {e}[/red]"
+                    )
+                    return
                 self.console.print(
-                    f"[red]Ticker {ticker} not found or no data available[/red]"
+                    f"[yellow]Could not refresh {ticker} ({e}); showing "
+                    f"info from {info['fetched_at']:%Y-%m-%d}[/yellow]"
                 )
-                return
-
-            name = info.get("longName", "N/A")
-            sector = info.get("sector", "N/A")
-            industry = info.get("industry", "N/A")
-            market_cap = info.get("marketCap", None)
-            summary = info.get("longBusinessSummary", "N/A")
-
-            if market_cap is not None:
-                if market_cap >= 1e9:
-                    market_cap_str = f"${market_cap / 1e9:.2f}B"
-                elif market_cap >= 1e6:
-                    market_cap_str = f"${market_cap / 1e6:.2f}M"
-                else:
-                    market_cap_str = f"${market_cap:,.0f}"
             else:
-                market_cap_str = "N/A"
+                if self.companies is not None:
+                    self.companies.put(ticker, fetched)
+                # An empty response keeps what was known before
+                if fetched is not None:
+                    info = fetched
 
-            if summary and summary != "N/A":
-                first_period = summary.split(".")[0] + "."
-            else:
-                first_period = "N/A"
+        if not info or info["name"] is None:
+            self.console.print(
+                f"[red]Ticker {ticker} not found or no data available[/red]"
+            )
+            return
 
-            from rich.table import Table
+        summary = info["summary"]
+        first_period = summary.split(".")[0] + "." if summary else "N/A"
 
-            table = Table(title=f"Company Info: {ticker}")
-            table.add_column("Field", style="cyan", width=20)
-            table.add_column("Value", style="white", width=50)
+        table = Table(title=f"Company Info: {ticker}")
+        table.add_column("Field", style="cyan", width=20)
+        table.add_column("Value", style="white", width=50)
 
-            table.add_row("Company Name", name)
-            table.add_row("Sector", sector)
-            table.add_row("Industry", industry)
-            table.add_row("Market Cap", market_cap_str)
-            table.add_row(
-                "Business Summary",
-                first_period[:200] + "..."
-                if len(first_period) > 200
-                else first_period,
-            )
+        table.add_row("Company Name", info["name"])
+        table.add_row("Sector", info["sector"] or "N/A")
+        table.add_row("Industry", info["industry"] or "N/A")
+        table.add_row("Market Cap", format_market_cap(info["market_cap"]))
+        table.add_row(
+            "Business Summary",
+            first_period[:200] + "..."
+            if len(first_period) > 200
+            else first_period,
+        )
 
-            self.console.print(table)
+        self.console.print(table)
 
-        except Exception as e:
+    def show_sectors(self, period: str):
+        """Show returns over a period aggregated by sector."""
+        if not self.ensure_data():
+            return
+
+        try:
+            start_date, end_date = parse_date_range(period)
+        except ValueError as e:
+            self.console.print(f"[red]Error parsing period: {e}[/red]")
+            return
+
+        companies = self.companies.frame() if self.companies else None
+        if companies is None or companies.is_empty():
             self.console.print(
-                f"[red]Error fetching info for {ticker}: {e}[/red]"
+                "[yellow]No company info stored; fill it with "
+                "'skim-analyze prefetch-info'[/yellow]"
             )
+            return
+
+        self.console.print(
+            f"[cyan]Sector performance for {period} ({start_date.date()} to {end_date.date()})...[/cyan]"
+        )
+
+        performance = self.calculator.find_top_performers(
+            start_date=start_date,
+            end_date=end_date,
+            limit=None,
+            min_price=0.0,
+            min_volume=0,
+        )
+        sectors = sector_performance(performance, companies)
+        self._emit(
+            "sectors", sectors, lambda: display_sectors(sectors, self.console)
+        )
+
+    def _limit(self, shown: int) -> int | None:
+        """Row limit for a command: ``shown`` on screen, none in batch mode."""
+        return shown if self.result_sink is None else None
+
+    def _emit(
+        self, name: str, results: Results, render: Callable[[], None]
+    ) -> None:
+        """Render a command's results, or pass them to the result sink."""
+        if self.result_sink is None:
+            render()
+        else:
+            self.result_sink(name, results)
 
     def show_help(self):
         """Show help information."""
@@ -463,26 +831,37 @@ class CLI:
             Show top performing stocks for a period.
             Examples: top 2024, top 2024-03, top 2024-03-01 to 2024-03-31, top 1M
 
-        [cyan]gaps <period>[/cyan]
-            Show significant gaps (10%+) for a period.
-            Examples: gaps 2024, gaps 2024-06
+        [cyan]gaps <period> [--news][/cyan]
+            Show significant gaps (10%+) for a period. --news adds the latest
+            stored announcement published up to 3 days before each gap's open.
+            Examples: gaps 2024, gaps 2024-06, gaps 2024 --news
 
         [cyan]ann <ticker> <period>[/cyan]
-            Show announcements for a ticker.
+            Show announcements for a ticker. Past years already in the
+            announcement archive are read locally; others are fetched and stored.
             Examples: ann BHP 2024, ann CBA 2024-06, ann TLS 2024-01-01 to 2024-03-31, ann WOW 3M
 
-        [cyan]chart <ticker> [period][/cyan]
+        [cyan]search <query> [--ticker T] [--period P] [--ps][/cyan]
+            Search archived announcement headlines (newest 50 matches). Terms
+            must all match; use "quoted phrases", prefix* and AND / OR / NOT.
+            --ps keeps price-sensitive announcements only.
+            Examples: search placement, search "drilling results" --ps,
+                      search trading halt NOT "response to" --period 2024
+
+        [cyan]chart <ticker> [period] [--interval daily|weekly|monthly][/cyan]
             Show terminal candlestick chart for a ticker.
             Optional period: YYYY, YYYY-MM, YYYY-MM-DD to YYYY-MM-DD, 1M, 3M, 6M, 1Y
-            Examples: chart BHP, chart BHP 2024, chart BHP 2024-03, chart CBA 3M
+            Long periods switch to weekly or monthly candles to fit the terminal.
+            Examples: chart BHP, chart BHP 2024, chart CBA 3M, chart BHP 2020 --interval weekly
 
-        [cyan]momentum <period>[/cyan]
+        [cyan]momentum <period>[/cyan]  (alias: bursts)
             Show momentum bursts (3+ consecutive up days) for a period.
             Examples: momentum 2024, momentum 2024-12, momentum 3M
 
-        [cyan]consolidate <period>[/cyan]
+        [cyan]consolidate [--raw] <period>[/cyan]
             Show consolidation patterns (flat price + low volume) for a period.
-            Examples: consolidate 2024, consolidate 2024-12, consolidate 6M
+            Overlapping windows are merged into intervals; --raw lists every window.
+            Examples: consolidate 2024, consolidate 2024-12, consolidate --raw 6M
 
         [cyan]pattern <ticker> <period>[/cyan]
             Show pattern analysis (momentum + consolidation) for a specific stock.
@@ -496,11 +875,43 @@ class CLI:
             Show move duration statistics across all stocks.
             Examples: movestats 2024, movestats 2024-12
 
+        [cyan]screen <expression>[/cyan]
+            Screen all stocks with conditions on per-ticker features, joined
+            with ',' / 'and' / 'or' / 'not'. Windowed features take a bar
+            count suffix (d, w = 5, m = 21, y = 252); numbers accept %, k, m.
+            Features: close, open, volume, gap, change, return_<n>,
+            avg_volume_<n>, max_gap_<n>, high_<n>, low_<n>, from_high_<n>,
+            volatility_<n>, up_days_<n>
+            Examples: screen return_3m > 30%, avg_volume_50d > 200k, max_gap_10d > 5%
+                      screen close > 0.5 and (from_high_52w > -10% or up_days_10d >= 7)
+
+        [cyan]backtest <period> [--gap N] [--stop N] [--hold N][/cyan]
+            Simulate the gap breakout strategy on daily bars: enter every gap
+            of N% (default 9) at the open, 5,000 notional capped at 1,000
+            shares, exit at a --stop % stop (default 5) or after --hold bars.
+            Examples: backtest 2024, backtest 2020-01-01 to 2024-12-31 --gap 15 --hold 10
+
         [cyan]info <ticker>[/cyan]
             Show company information (name, sector, market cap, description).
-            Works independently without loading data.
+            Read from the local company store, fetched only when missing or
+            older than 7 days. Works independently without loading data.
             Examples: info BHP, info CBA, info TLS
 
+        [cyan]sectors <period>[/cyan]
+            Show median and mean returns, breadth and the best stock per
+            sector, from stored company info (see skim-analyze prefetch-info).
+            Examples: sectors 2024, sectors 3M
+
+        [cyan]timing on|off[/cyan]
+            Print wall and CPU time after every command.
+
+        [cyan]profile [--dump <file>] <command...>[/cyan]
+            Run one command under cProfile and show the top hotspots.
+            Examples: profile gaps 2024, profile --dump gaps.pstats gaps 2024
+
+        [cyan]mem [off][/cyan]
+            Start allocation tracing, or show top allocations and frame sizes.
+
         [cyan]help[/cyan]
             Show this help message.
 
@@ -511,132 +922,353 @@ class CLI:
             Panel(help_text, title="[bold]Help[/bold]", border_style="yellow")
         )
 
+    def execute(self, command: str) -> bool:
+        """
+        Run a single console command, timing it when timing is enabled.
+
+        Args:
+            command: Command line as typed at the prompt
+
+        Returns:
+            False if the command asks to exit, True otherwise
+        """
+        if not self.timing_enabled or command.split()[0].lower() == "timing":
+            return self._dispatch(command)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            return self._dispatch(command)
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            self.console.print(
+                f"[dim]⏱ wall {wall * 1000:,.1f} ms | cpu {cpu * 1000:,.1f} ms[/dim]"
+            )
+
+    def profile_command(self, args: list[str]) -> bool:
+        """
+        Run one command under cProfile and show the top hotspots.
+
+        Args:
+            args: Command words, optionally prefixed by ``--dump <file>`` to
+                  also write the raw pstats data
+
+        Returns:
+            False if the profiled command asks to exit, True otherwise
+        """
+        dump_path = None
+        if args and args[0] == "--dump":
+            if len(args) < 3:
+                self.console.print(
+                    "[red]Usage: profile [--dump <file>] <command...>[/red]"
+                )
+                return True
+            dump_path = args[1]
+            args = args[2:]
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            keep_running = self._dispatch(" ".join(args))
+        finally:
+            profiler.disable()
+
+        buffer = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buffer)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(20)
+        self.console.print(buffer.getvalue(), markup=False, highlight=False)
+
+        if dump_path:
+            stats.dump_stats(dump_path)
+            self.console.print(f"[green]✓ Wrote profile to {dump_path}[/green]")
+        return keep_running
+
+    def show_memory(self, action: str | None = None) -> None:
+        """
+        Show tracemalloc top allocations and per-ticker frame sizes.
+
+        Tracing starts on the first call, so allocations are reported for
+        commands run after it. ``mem off`` stops tracing.
+
+        Args:
+            action: Optional "off" to stop allocation tracing
+        """
+        if action == "off":
+            tracemalloc.stop()
+            self.console.print("[yellow]Allocation tracing stopped[/yellow]")
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.console.print(
+                "[cyan]Allocation tracing started; run commands then 'mem' again[/cyan]"
+            )
+        else:
+            current, peak = tracemalloc.get_traced_memory()
+            table = Table(
+                title=f"Top Allocations (current {current / 1e6:,.1f} MB, "
+                f"peak {peak / 1e6:,.1f} MB)"
+            )
+            table.add_column("Location", style="cyan")
+            table.add_column("Size", justify="right")
+            table.add_column("Blocks", justify="right")
+
+            snapshot = tracemalloc.take_snapshot()
+            for stat in snapshot.statistics("lineno")[:10]:
+                frame = stat.traceback[0]
+                table.add_row(
+                    f"{frame.filename}:{frame.lineno}",
+                    f"{stat.size / 1e6:,.2f} MB",
+                    f"{stat.count:,}",
+                )
+            self.console.print(table)
+
+        if not self.data_loaded:
+            return
+
+        sizes = sorted(
+            (
+                (ticker, stock.df.height, stock.df.estimated_size())
+                for ticker, stock in self.loader.stocks.items()
+                if stock.df is not None
+            ),
+            key=lambda x: x[2],
+            reverse=True,
+        )
+        total = sum(size for _, _, size in sizes)
+
+        table = Table(
+            title=f"Frame Sizes ({len(sizes)} stocks, {total / 1e6:,.1f} MB)"
+        )
+        table.add_column("Ticker", style="cyan", width=8)
+        table.add_column("Rows", justify="right")
+        table.add_column("Size", justify="right")
+        for ticker, rows, size in sizes[:10]:
+            table.add_row(
+                ticker,
+                f"{rows:,}",
+                f"{size / 1e3:,.1f} KB",
+            )
+        self.console.print(table)
+
+    def _dispatch(self, command: str) -> bool:
+        """Route a command line to its handler."""
+        parts = command.split()
+        cmd = parts[0].lower()
+
+        if cmd == "quit" or cmd == "exit" or cmd == "q":
+            self.console.print("[yellow]Goodbye![/yellow]")
+            return False
+
+        elif cmd == "load":
+            self.load_data()
+
+        elif cmd == "download":
+            date_arg = parts[1] if len(parts) > 1 else None
+            self.download_data(date_arg)
+
+        elif cmd == "top":
+            if len(parts) < 2:
+                self.console.print("[red]Usage: top <period>[/red]")
+                return True
+            self.show_top_performers(" ".join(parts[1:]))
+
+        elif cmd == "gaps":
+            news = "--news" in parts
+            args = [p for p in parts[1:] if p != "--news"]
+            if not args:
+                self.console.print("[red]Usage: gaps <period> [--news][/red]")
+                return True
+            self.show_gaps(" ".join(args), news=news)
+
+        elif cmd == "ann":
+            if len(parts) < 3:
+                self.console.print("[red]Usage: ann <ticker> <period>[/red]")
+                return True
+            ticker = parts[1]
+            period = " ".join(parts[2:])
+            self.show_announcements(ticker, period)
+
+        elif cmd == "search":
+            usage = (
+                "[red]Usage: search <query> [--ticker T] [--period P] "
+                "[--ps][/red]"
+            )
+            args = [p for p in parts[1:] if p != "--ps"]
+            filters: dict[str, str] = {}
+            for flag in ("--ticker", "--period"):
+                if flag in args:
+                    i = args.index(flag)
+                    if i + 1 >= len(args):
+                        self.console.print(usage)
+                        return True
+                    filters[flag] = args[i + 1]
+                    args = args[:i] + args[i + 2 :]
+            if not args:
+                self.console.print(usage)
+                return True
+            self.show_search(
+                " ".join(args),
+                ticker=filters.get("--ticker"),
+                period=filters.get("--period"),
+                price_sensitive_only="--ps" in parts,
+            )
+
+        elif cmd == "chart":
+            args = parts[1:]
+            interval = None
+            if "--interval" in args:
+                i = args.index("--interval")
+                interval = args[i + 1] if i + 1 < len(args) else None
+                args = args[:i] + args[i + 2 :]
+            if not args or ("--interval" in parts and interval is None):
+                self.console.print(
+                    "[red]Usage: chart <ticker> [period] "
+                    "[--interval daily|weekly|monthly][/red]"
+                )
+                return True
+            ticker = args[0]
+            period = " ".join(args[1:]) if len(args) > 1 else None
+            self.show_chart(ticker, period, interval)
+
+        elif cmd in ("momentum", "bursts"):
+            if len(parts) < 2:
+                self.console.print(f"[red]Usage: {cmd} <period>[/red]")
+                return True
+            period = " ".join(parts[1:])
+            self.show_momentum_bursts(period)
+
+        elif cmd == "consolidate":
+            raw = "--raw" in parts
+            args = [p for p in parts[1:] if p != "--raw"]
+            if not args:
+                self.console.print(
+                    "[red]Usage: consolidate [--raw] <period>[/red]"
+                )
+                return True
+            period = " ".join(args)
+            self.show_consolidations(period, merge=not raw)
+
+        elif cmd == "pattern":
+            if len(parts) < 3:
+                self.console.print(
+                    "[red]Usage: pattern <ticker> <period>[/red]"
+                )
+                return True
+            ticker = parts[1]
+            period = " ".join(parts[2:])
+            self.show_pattern_analysis(ticker, period)
+
+        elif cmd == "perf":
+            if len(parts) < 3:
+                self.console.print("[red]Usage: perf <ticker> <period>[/red]")
+                return True
+            ticker = parts[1]
+            period = " ".join(parts[2:])
+            self.show_performance(ticker, period)
+
+        elif cmd == "movestats":
+            if len(parts) < 2:
+                self.console.print("[red]Usage: movestats <period>[/red]")
+                return True
+            period = " ".join(parts[1:])
+            self.show_move_statistics(period)
+
+        elif cmd == "screen":
+            if len(parts) < 2:
+                self.console.print("[red]Usage: screen <expression>[/red]")
+                return True
+            self.show_screen(" ".join(parts[1:]))
+
+        elif cmd == "backtest":
+            usage = (
+                "[red]Usage: backtest <period> [--gap N] [--stop N] "
+                "[--hold N][/red]"
+            )
+            args = parts[1:]
+            options: dict[str, float] = {}
+            try:
+                for flag in ("--gap", "--stop", "--hold"):
+                    if flag in args:
+                        i = args.index(flag)
+                        options[flag] = float(args[i + 1])
+                        args = args[:i] + args[i + 2 :]
+            except (IndexError, ValueError):
+                self.console.print(usage)
+                return True
+            if not args:
+                self.console.print(usage)
+                return True
+            self.show_backtest(
+                " ".join(args),
+                gap_threshold=options.get("--gap"),
+                stop_pct=options.get("--stop", FALLBACK_STOP_PCT),
+                max_hold_days=(
+                    int(options["--hold"]) if "--hold" in options else None
+                ),
+            )
+
+        elif cmd == "info":
+            if len(parts) < 2:
+                self.console.print("[red]Usage: info <ticker>[/red]")
+                return True
+            ticker = parts[1]
+            self.show_company_info(ticker)
+
+        elif cmd == "sectors":
+            if len(parts) < 2:
+                self.console.print("[red]Usage: sectors <period>[/red]")
+                return True
+            self.show_sectors(" ".join(parts[1:]))
+
+        elif cmd == "timing":
+            if len(parts) != 2 or parts[1].lower() not in ("on", "off"):
+                self.console.print("[red]Usage: timing on|off[/red]")
+                return True
+            self.timing_enabled = parts[1].lower() == "on"
+            state = "enabled" if self.timing_enabled else "disabled"
+            self.console.print(f"[green]✓ Command timing {state}[/green]")
+
+        elif cmd == "profile":
+            if len(parts) < 2:
+                self.console.print(
+                    "[red]Usage: profile [--dump <file>] <command...>[/red]"
+                )
+                return True
+            return self.profile_command(parts[1:])
+
+        elif cmd == "mem":
+            self.show_memory(parts[1].lower() if len(parts) > 1 else None)
+
+        elif cmd == "help" or cmd == "h":
+            self.show_help()
+
+        else:
+            self.console.print(f"[red]Unknown command: {cmd}[/red]")
+            self.console.print(
+                "[yellow]Type 'help' for available commands[/yellow]"
+            )
+
+        return True
+
     def run(self):
         """Run interactive console."""
         self.show_welcome()
-        self.load_data()
+        self.start_background_load()
 
         try:
             while True:
                 try:
-                    command = input("> ").strip()
+                    self._report_background_load()
+                    command = input(self.prompt()).strip()
 
                     if not command:
                         continue
 
-                    parts = command.split()
-                    cmd = parts[0].lower()
-
-                    if cmd == "quit" or cmd == "exit" or cmd == "q":
-                        self.console.print("[yellow]Goodbye![/yellow]")
+                    if not self.execute(command):
                         break
 
-                    elif cmd == "load":
-                        self.load_data()
-
-                    elif cmd == "download":
-                        date_arg = parts[1] if len(parts) > 1 else None
-                        self.download_data(date_arg)
-
-                    elif cmd == "top":
-                        if len(parts) < 2:
-                            self.console.print("[red]Usage: top <period>[/red]")
-                            continue
-                        self.show_top_performers(" ".join(parts[1:]))
-
-                    elif cmd == "gaps":
-                        if len(parts) < 2:
-                            self.console.print(
-                                "[red]Usage: gaps <period>[/red]"
-                            )
-                            continue
-                        self.show_gaps(" ".join(parts[1:]))
-
-                    elif cmd == "ann":
-                        if len(parts) < 3:
-                            self.console.print(
-                                "[red]Usage: ann <ticker> <period>[/red]"
-                            )
-                            continue
-                        ticker = parts[1]
-                        period = " ".join(parts[2:])
-                        self.show_announcements(ticker, period)
-
-                    elif cmd == "chart":
-                        if len(parts) < 2:
-                            self.console.print(
-                                "[red]Usage: chart <ticker> [period][/red]"
-                            )
-                            continue
-                        ticker = parts[1]
-                        period = " ".join(parts[2:]) if len(parts) > 2 else None
-                        self.show_chart(ticker, period)
-
-                    elif cmd == "momentum":
-                        if len(parts) < 2:
-                            self.console.print(
-                                "[red]Usage: momentum <period>[/red]"
-                            )
-                            continue
-                        period = " ".join(parts[1:])
-                        self.show_momentum_bursts(period)
-
-                    elif cmd == "consolidate":
-                        if len(parts) < 2:
-                            self.console.print(
-                                "[red]Usage: consolidate <period>[/red]"
-                            )
-                            continue
-                        period = " ".join(parts[1:])
-                        self.show_consolidations(period)
-
-                    elif cmd == "pattern":
-                        if len(parts) < 3:
-                            self.console.print(
-                                "[red]Usage: pattern <ticker> <period>[/red]"
-                            )
-                            continue
-                        ticker = parts[1]
-                        period = " ".join(parts[2:])
-                        self.show_pattern_analysis(ticker, period)
-
-                    elif cmd == "perf":
-                        if len(parts) < 3:
-                            self.console.print(
-                                "[red]Usage: perf <ticker> <period>[/red]"
-                            )
-                            continue
-                        ticker = parts[1]
-                        period = " ".join(parts[2:])
-                        self.show_performance(ticker, period)
-
-                    elif cmd == "movestats":
-                        if len(parts) < 2:
-                            self.console.print(
-                                "[red]Usage: movestats <period>[/red]"
-                            )
-                            continue
-                        period = " ".join(parts[1:])
-                        self.show_move_statistics(period)
-
-                    elif cmd == "info":
-                        if len(parts) < 2:
-                            self.console.print(
-                                "[red]Usage: info <ticker>[/red]"
-                            )
-                            continue
-                        ticker = parts[1]
-                        self.show_company_info(ticker)
-
-                    elif cmd == "help" or cmd == "h":
-                        self.show_help()
-
-                    else:
-                        self.console.print(f"[red]Unknown command: {cmd}[/red]")
-                        self.console.print(
-                            "[yellow]Type 'help' for available commands[/yellow]"
-                        )
-
                 except KeyboardInterrupt:
                     self.console.print(
                         "\n[yellow]Interrupted. Type 'quit' to exit.[/yellow]"
@@ -1,13 +1,500 @@
 """CLI entry point for the ASX analysis tool."""
 
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+from rich.console import Console
+
+from skim.analysis import company_info, sweep
+from skim.analysis.announcement_crawler import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RATE,
+    crawl_announcements,
+)
+from skim.analysis.announcements import (
+    DEFAULT_ARCHIVE_PATH,
+    AnnouncementArchive,
+)
+from skim.analysis.backtest import FALLBACK_STOP_PCT
+from skim.analysis.cli import batch
 from skim.analysis.cli.cli import CLI
+from skim.analysis.data_loader import DataLoader
+from skim.analysis.dataset_server import DatasetServer
+from skim.analysis.date_parser import parse_date_range
+from skim.analysis.event_index import DEFAULT_INDEX_PATH
+from skim.analysis.universe import build_universe, default_shared_path
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the skim-analyze argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="skim-analyze", description="ASX stock analysis console"
+    )
+    parser.add_argument(
+        "--attach",
+        nargs="?",
+        const=default_shared_path(),
+        type=Path,
+        metavar="PATH",
+        help="Attach to a running dataset server instead of loading CSVs",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parameter sweeps (default: 1)",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_INDEX_PATH,
+        metavar="PATH",
+        help=(
+            "Answer pattern scans from an event index database "
+            f"(default path: {DEFAULT_INDEX_PATH}). Events are detected "
+            "over each ticker's full history, so they can differ from a "
+            "scan of the period alone"
+        ),
+    )
+    parser.add_argument(
+        "--announcements",
+        type=Path,
+        default=DEFAULT_ARCHIVE_PATH,
+        metavar="PATH",
+        help=f"Announcement archive database (default: {DEFAULT_ARCHIVE_PATH})",
+    )
+    parser.add_argument(
+        "--companies",
+        type=Path,
+        default=company_info.DEFAULT_COMPANY_PATH,
+        metavar="PATH",
+        help=f"Company info database "
+        f"(default: {company_info.DEFAULT_COMPANY_PATH})",
+    )
+    parser.add_argument(
+        "-c",
+        dest="commands",
+        metavar="COMMANDS",
+        help="Run ';'-separated console commands in batch mode and exit, "
+        "e.g. -c 'gaps 2024; top 3M'",
+    )
+    add_batch_arguments(parser)
+
+    subparsers = parser.add_subparsers(dest="command")
+    serve = subparsers.add_parser(
+        "serve", help="Run a resident dataset server for other sessions"
+    )
+    serve.add_argument(
+        "--data-dir",
+        default="data/processed/historical",
+        help="Directory of processed per-ticker CSVs",
+    )
+    serve.add_argument(
+        "--shared-path",
+        type=Path,
+        default=default_shared_path(),
+        help="Where to publish the shared Arrow file",
+    )
+    serve.add_argument(
+        "--refresh",
+        type=float,
+        default=60.0,
+        help="Seconds between checks for updated source data",
+    )
+
+    sweeper = subparsers.add_parser(
+        "sweep",
+        help="Backtest a grid or random search of strategy thresholds",
+        description="Sweep values: a list (gap_threshold=5,9,15), a stepped "
+        "range (gap_threshold=5:20:5) or, with --random, a continuous range "
+        "(min_3month_return=-20:50). Parameters: "
+        + ", ".join(sweep.PARAMETERS),
+    )
+    sweeper.add_argument(
+        "period",
+        help="Backtest period, e.g. 2024 or '2016-01-01 to 2025-12-31'",
+    )
+    sweeper.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=VALUES",
+        help="Parameter values to sweep (repeatable)",
+    )
+    sweeper.add_argument(
+        "--random",
+        type=int,
+        metavar="N",
+        help="Evaluate N random points instead of the full grid",
+    )
+    sweeper.add_argument(
+        "--seed", type=int, default=0, help="Random search seed (default: 0)"
+    )
+    sweeper.add_argument(
+        "--stop",
+        type=float,
+        default=FALLBACK_STOP_PCT,
+        help=f"Stop distance below entry in %% (default: {FALLBACK_STOP_PCT:g})",
+    )
+    sweeper.add_argument(
+        "--hold", type=int, help="Exit after this many bars (default: none)"
+    )
+    sweeper.add_argument(
+        "--out",
+        type=Path,
+        default=sweep.DEFAULT_SWEEP_PATH,
+        help="Parquet results file; existing points are skipped "
+        f"(default: {sweep.DEFAULT_SWEEP_PATH})",
+    )
+    sweeper.add_argument(
+        "--data-dir",
+        default="data/processed/historical",
+        help="Directory of processed per-ticker CSVs",
+    )
+
+    crawl = subparsers.add_parser(
+        "crawl",
+        help="Fetch announcements into the local archive",
+        description="Fetch every ticker-year not yet archived. Past years "
+        "are fetched once; the current year is refreshed on every run.",
+    )
+    crawl.add_argument(
+        "tickers",
+        nargs="*",
+        help="Tickers to crawl (default: every ticker in --data-dir)",
+    )
+    crawl.add_argument(
+        "--years",
+        default=str(date.today().year),
+        metavar="FIRST[-LAST]",
+        help="Years to cover, e.g. 2015-2025 (default: current year)",
+    )
+    crawl.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Requests in flight (default: {DEFAULT_CONCURRENCY})",
+    )
+    crawl.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help=f"Requests per second to the ASX site (default: {DEFAULT_RATE:g})",
+    )
+    crawl.add_argument(
+        "--data-dir",
+        default="data/processed/historical",
+        help="Directory of processed per-ticker CSVs",
+    )
+
+    prefetch = subparsers.add_parser(
+        "prefetch-info",
+        help="Fetch company info (name, sector, market cap) into the store",
+        description="Fetch company info for every ticker without an entry "
+        "younger than --ttl days.",
+    )
+    prefetch.add_argument(
+        "tickers",
+        nargs="*",
+        help="Tickers to fetch (default: every ticker in --data-dir)",
+    )
+    prefetch.add_argument(
+        "--ttl",
+        type=float,
+        default=company_info.DEFAULT_TTL.days,
+        metavar="DAYS",
+        help="Refetch entries older than this "
+        f"(default: {company_info.DEFAULT_TTL.days})",
+    )
+    prefetch.add_argument(
+        "--concurrency",
+        type=int,
+        default=company_info.DEFAULT_CONCURRENCY,
+        help="Requests in flight "
+        f"(default: {company_info.DEFAULT_CONCURRENCY})",
+    )
+    prefetch.add_argument(
+        "--rate",
+        type=float,
+        default=company_info.DEFAULT_RATE,
+        help="Requests per second to Yahoo Finance "
+        f"(default: {company_info.DEFAULT_RATE:g})",
+    )
+    prefetch.add_argument(
+        "--data-dir",
+        default="data/processed/historical",
+        help="Directory of processed per-ticker CSVs",
+    )
+
+    runner = subparsers.add_parser(
+        "run",
+        help="Run a script of console commands in batch mode",
+        description="Run console commands from a script (one per line or "
+        "';'-separated, '#' comments) against one loaded dataset, writing "
+        "each result set to a file. Batch commands: "
+        + ", ".join(sorted(batch.BATCH_COMMANDS)),
+    )
+    runner.add_argument(
+        "script", type=Path, help="Script file, or - to read standard input"
+    )
+    add_batch_arguments(runner, subcommand=True)
+    return parser
+
+
+def add_batch_arguments(
+    parser: argparse.ArgumentParser, subcommand: bool = False
+) -> None:
+    """
+    Add the batch output options to a parser.
+
+    Args:
+        parser: Top-level or ``run`` parser
+        subcommand: Suppress the defaults, so a subcommand does not
+            overwrite options given before it
+    """
+
+    def default(value):
+        return argparse.SUPPRESS if subcommand else value
+
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=default(batch.DEFAULT_OUTPUT_DIR),
+        metavar="DIR",
+        help=f"Batch result directory (default: {batch.DEFAULT_OUTPUT_DIR})",
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(batch.FORMATS),
+        default=default("csv"),
+        help="Batch result file format (default: csv)",
+    )
+    parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        default=default(False),
+        help="Run the remaining batch commands after one fails",
+    )
+
+
+def parse_years(spec: str) -> range:
+    """
+    Parse a ``YYYY`` or ``YYYY-YYYY`` year range.
+
+    Raises:
+        ValueError: If the range is malformed or reversed
+    """
+    first, _, last = spec.partition("-")
+    try:
+        years = range(int(first), int(last or first) + 1)
+    except ValueError:
+        raise ValueError(f"Invalid year range: '{spec}'") from None
+    if not years:
+        raise ValueError(f"Invalid year range: '{spec}'")
+    return years
+
+
+def run_crawl_command(args: argparse.Namespace) -> None:
+    """Run the ``crawl`` subcommand."""
+    console = Console()
+    try:
+        years = parse_years(args.years)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        return
+
+    tickers = args.tickers or sorted(
+        path.stem for path in Path(args.data_dir).glob("*.csv")
+    )
+    if not tickers:
+        console.print(f"[red]Error: No tickers found in {args.data_dir}[/red]")
+        return
+
+    archive = AnnouncementArchive(args.announcements)
+    console.print(
+        f"[cyan]Crawling announcements for {len(tickers)} tickers, "
+        f"{years.start}-{years.stop - 1}...[/cyan]"
+    )
+    try:
+        result = asyncio.run(
+            crawl_announcements(
+                archive,
+                tickers,
+                years,
+                concurrency=args.concurrency,
+                rate=args.rate,
+                progress=lambda done, total: (
+                    console.print(f"[dim]{done}/{total} pages[/dim]")
+                    if done % 100 == 0 or done == total
+                    else None
+                ),
+            )
+        )
+    finally:
+        archive.close()
+
+    console.print(
+        f"[green]✓ Fetched {result.fetched} pages, "
+        f"{result.added} new announcements[/green]"
+    )
+    if result.failed:
+        console.print(
+            f"[yellow]{len(result.failed)} ticker-years failed and will be "
+            "retried on the next crawl[/yellow]"
+        )
+
+
+def run_prefetch_info_command(args: argparse.Namespace) -> None:
+    """Run the ``prefetch-info`` subcommand."""
+    console = Console()
+    tickers = args.tickers or sorted(
+        path.stem for path in Path(args.data_dir).glob("*.csv")
+    )
+    if not tickers:
+        console.print(f"[red]Error: No tickers found in {args.data_dir}[/red]")
+        return
+
+    store = company_info.CompanyStore(args.companies)
+    console.print(
+        f"[cyan]Fetching company info for {len(tickers)} tickers...[/cyan]"
+    )
+    try:
+        result = asyncio.run(
+            company_info.prefetch_company_info(
+                store,
+                tickers,
+                ttl=timedelta(days=args.ttl),
+                concurrency=args.concurrency,
+                rate=args.rate,
+                progress=lambda done, total: (
+                    console.print(f"[dim]{done}/{total} tickers[/dim]")
+                    if done % 100 == 0 or done == total
+                    else None
+                ),
+            )
+        )
+    finally:
+        store.close()
+
+    console.print(
+        f"[green]✓ Fetched {result.fetched} companies, "
+        f"{result.missing} not found[/green]"
+    )
+    if result.failed:
+        console.print(
+            f"[yellow]{len(result.failed)} tickers failed and will be "
+            "retried on the next prefetch[/yellow]"
+        )
+
+
+def run_sweep_command(args: argparse.Namespace) -> None:
+    """Run the ``sweep`` subcommand."""
+    console = Console()
+    try:
+        start_date, end_date = parse_date_range(args.period)
+        specs = dict(sweep.parse_parameter(spec) for spec in args.param)
+        if args.random:
+            points = sweep.random_points(specs, args.random, args.seed)
+        else:
+            points = sweep.grid_points(specs)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        return
+
+    stocks = DataLoader(args.data_dir).load_all(min_price=0, min_volume=0)
+    console.print(
+        f"[cyan]Sweeping {len(points)} points over {args.period} "
+        f"({start_date.date()} to {end_date.date()})...[/cyan]"
+    )
+    results = sweep.run_sweep(
+        build_universe(stocks),
+        points,
+        start_date,
+        end_date,
+        out_path=args.out,
+        workers=args.workers,
+        stop_pct=args.stop,
+        max_hold_days=args.hold,
+        progress=lambda done, total: console.print(
+            f"[dim]{done}/{total} points[/dim]"
+        ),
+    )
+    console.print(f"[green]✓ Results saved to {args.out}[/green]")
+    sweep.display_results(results, console)
+
+
+def run_batch_command(args: argparse.Namespace, cli: CLI) -> int:
+    """
+    Run ``-c`` commands or a ``run`` script in batch mode.
+
+    Returns:
+        Process exit status
+    """
+    if args.command == "run":
+        try:
+            script = (
+                sys.stdin.read()
+                if str(args.script) == "-"
+                else args.script.read_text()
+            )
+        except OSError as e:
+            Console(stderr=True).print(f"[red]Error: {e}[/red]")
+            return 2
+    else:
+        script = args.commands
+
+    runner = batch.BatchRunner(
+        cli,
+        output_dir=args.output_dir,
+        fmt=args.format,
+        keep_going=args.keep_going,
+    )
+    return runner.run(batch.split_commands(script))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Main entry point for the analysis CLI.
+
+    Returns:
+        Process exit status
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.command == "serve":
+        server = DatasetServer(
+            data_dir=args.data_dir, shared_path=args.shared_path
+        )
+        server.serve_forever(refresh_interval=args.refresh)
+        return 0
+
+    if args.command == "sweep":
+        run_sweep_command(args)
+        return 0
+
+    if args.command == "crawl":
+        run_crawl_command(args)
+        return 0
 
+    if args.command == "prefetch-info":
+        run_prefetch_info_command(args)
+        return 0
 
-def main():
-    """Main entry point for the analysis CLI."""
-    cli = CLI()
+    cli = CLI(
+        shared_path=args.attach,
+        index_path=args.index,
+        archive_path=args.announcements,
+        company_path=args.companies,
+    )
+    if args.command == "run" or args.commands is not None:
+        return run_batch_command(args, cli)
     cli.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
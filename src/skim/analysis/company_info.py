@@ -0,0 +1,338 @@
+"""
+Cached company metadata for the analysis tools.
+
+Name, sector, industry and market cap come from Yahoo Finance, which is
+slow and rate limited, so they are kept in SQLite and refreshed only once
+older than a TTL. ``prefetch_company_info`` fills the store for a whole
+universe with a bound on requests in flight and a request rate; tickers
+Yahoo does not know are stored too, so they are not asked for again
+until their entry expires. Reads are local, which lets the ``info``
+command answer instantly and sector-level analysis join metadata onto a
+universe-wide frame.
+"""
+
+import asyncio
+import sqlite3
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import yfinance as yf
+from loguru import logger
+from rich.console import Console
+from rich.table import Table
+
+from skim.analysis.announcement_crawler import HostRateLimiter
+
+DEFAULT_COMPANY_PATH = Path("data/processed/companies.db")
+DEFAULT_TTL = timedelta(days=7)
+DEFAULT_CONCURRENCY = 4
+# Requests per second to Yahoo Finance
+DEFAULT_RATE = 2.0
+YAHOO_URL = "https://query2.finance.yahoo.com"
+
+COMPANY_SCHEMA = {
+    "ticker": pl.String,
+    "name": pl.String,
+    "sector": pl.String,
+    "industry": pl.String,
+    "market_cap": pl.Float64,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    ticker TEXT PRIMARY KEY,
+    name TEXT,
+    sector TEXT,
+    industry TEXT,
+    market_cap REAL,
+    summary TEXT,
+    fetched_at TEXT NOT NULL
+);
+"""
+
+COMPANY_FIELDS = ("name", "sector", "industry", "market_cap", "summary")
+
+InfoSource = Callable[[str], dict | None]
+
+
+def parse_yahoo_info(info: dict | None) -> dict | None:
+    """
+    Company metadata from a Yahoo Finance ``info`` dictionary.
+
+    Returns:
+        Dictionary with COMPANY_FIELDS keys, or None if Yahoo has no
+        company under the symbol
+    """
+    if not info or "longName" not in info:
+        return None
+    return {
+        "name": info["longName"],
+        "sector": info.get("sector"),
+        "industry": info.get("industry"),
+        "market_cap": info.get("marketCap"),
+        "summary": info.get("longBusinessSummary"),
+    }
+
+
+def yahoo_company_info(ticker: str) -> dict | None:
+    """Fetch metadata for an ASX ticker from Yahoo Finance."""
+    return parse_yahoo_info(yf.Ticker(f"{ticker.upper()}.AX").info)
+
+
+class CompanyStore:
+    """SQLite store of company metadata keyed by ticker."""
+
+    def __init__(self, db_path: str | Path = DEFAULT_COMPANY_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def put(
+        self,
+        ticker: str,
+        info: dict | None,
+        fetched_at: datetime | None = None,
+    ) -> None:
+        """
+        Store a ticker's metadata, replacing any earlier entry.
+
+        A source returning nothing for a ticker it knew before does not
+        erase it: the earlier entry is kept and only its fetch time is
+        refreshed.
+
+        Args:
+            ticker: ASX ticker symbol
+            info: Metadata with COMPANY_FIELDS keys, or None to record
+                that the source has no company under the ticker
+            fetched_at: When it was fetched (default: now)
+        """
+        fetched_at = fetched_at or datetime.now()
+        on_conflict = (
+            "DO UPDATE SET fetched_at = excluded.fetched_at"
+            if info is None
+            else "DO UPDATE SET "
+            + ", ".join(f"{name} = excluded.{name}" for name in COMPANY_FIELDS)
+            + ", fetched_at = excluded.fetched_at"
+        )
+        info = info or {}
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO companies VALUES (?, ?, ?, ?, ?, ?, ?) "
+                f"ON CONFLICT (ticker) {on_conflict}",
+                (
+                    ticker.upper(),
+                    *(info.get(name) for name in COMPANY_FIELDS),
+                    fetched_at.isoformat(timespec="seconds"),
+                ),
+            )
+
+    def get(self, ticker: str) -> dict | None:
+        """
+        Stored metadata for a ticker.
+
+        Returns:
+            Dictionary with COMPANY_FIELDS keys (``name`` is None if the
+            source had no such company) and ``fetched_at``, or None if
+            the ticker was never fetched
+        """
+        row = self.conn.execute(
+            f"SELECT {', '.join(COMPANY_FIELDS)}, fetched_at "
+            "FROM companies WHERE ticker = ?",
+            (ticker.upper(),),
+        ).fetchone()
+        if row is None:
+            return None
+        info: dict[str, Any] = dict(zip(COMPANY_FIELDS, row[:-1], strict=True))
+        info["fetched_at"] = datetime.fromisoformat(row[-1])
+        return info
+
+    def stale(
+        self,
+        tickers: Iterable[str],
+        ttl: timedelta = DEFAULT_TTL,
+        now: datetime | None = None,
+    ) -> list[str]:
+        """
+        Tickers never fetched or fetched more than ``ttl`` ago.
+
+        Returns:
+            Upper-case tickers in sorted order
+        """
+        cutoff = (now or datetime.now()) - ttl
+        fresh = {
+            ticker
+            for (ticker,) in self.conn.execute(
+                "SELECT ticker FROM companies WHERE fetched_at >= ?",
+                (cutoff.isoformat(timespec="seconds"),),
+            )
+        }
+        return sorted({t.upper() for t in tickers} - fresh)
+
+    def frame(self) -> pl.DataFrame:
+        """
+        Every stored company as a DataFrame.
+
+        Returns:
+            DataFrame with columns as in COMPANY_SCHEMA, one row per
+            ticker the source knows, sorted by ticker
+        """
+        rows = self.conn.execute(
+            "SELECT ticker, name, sector, industry, market_cap "
+            "FROM companies WHERE name IS NOT NULL ORDER BY ticker"
+        ).fetchall()
+        return pl.DataFrame(rows, schema=COMPANY_SCHEMA, orient="row")
+
+
+@dataclass
+class PrefetchResult:
+    """Outcome of a metadata prefetch."""
+
+    fetched: int = 0
+    missing: int = 0
+    failed: list[str] = field(default_factory=list)
+
+
+async def prefetch_company_info(
+    store: CompanyStore,
+    tickers: Iterable[str],
+    source: InfoSource = yahoo_company_info,
+    ttl: timedelta = DEFAULT_TTL,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE,
+    now: datetime | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> PrefetchResult:
+    """
+    Fetch metadata for every ticker without a fresh stored entry.
+
+    The source is blocking, so each call runs in a worker thread; calls
+    are bounded by ``concurrency`` and spaced by ``rate``.
+
+    Args:
+        store: Store to read freshness from and write into
+        tickers: ASX ticker symbols
+        source: Callable returning a ticker's metadata, None for an
+            unknown ticker (default: Yahoo Finance)
+        ttl: Age after which a stored entry is fetched again
+        concurrency: Maximum source calls in flight
+        rate: Maximum source calls per second
+        now: Reference time for freshness (default: now)
+        progress: Optional callback receiving (done, total)
+
+    Returns:
+        PrefetchResult with companies fetched, tickers the source did not
+        know, and the tickers whose fetch failed
+    """
+    pending = store.stale(tickers, ttl, now)
+    result = PrefetchResult()
+    limiter = HostRateLimiter(rate)
+    semaphore = asyncio.Semaphore(concurrency)
+    done = 0
+
+    async def fetch_one(ticker: str) -> None:
+        nonlocal done
+        async with semaphore:
+            await limiter.wait(YAHOO_URL)
+            try:
+                info = await asyncio.to_thread(source, ticker)
+            except Exception as e:
+                logger.warning(f"Company info fetch failed for {ticker}: {e}")
+                result.failed.append(ticker)
+            else:
+                store.put(ticker, info, now)
+                if info is None:
+                    result.missing += 1
+                else:
+                    result.fetched += 1
+        done += 1
+        if progress is not None:
+            progress(done, len(pending))
+
+    await asyncio.gather(*(fetch_one(ticker) for ticker in pending))
+    result.failed.sort()
+    return result
+
+
+def format_market_cap(market_cap: float | None) -> str:
+    """Market cap as $1.23B / $4.56M / $789,000."""
+    if market_cap is None:
+        return "N/A"
+    if market_cap >= 1e9:
+        return f"${market_cap / 1e9:.2f}B"
+    if market_cap >= 1e6:
+        return f"${market_cap / 1e6:.2f}M"
+    return f"${market_cap:,.0f}"
+
+
+def sector_performance(
+    performance: pl.DataFrame, companies: pl.DataFrame
+) -> pl.DataFrame:
+    """
+    Aggregate per-stock returns by sector.
+
+    Args:
+        performance: Frame with ``ticker`` and ``total_return`` columns
+        companies: Company metadata as returned by ``CompanyStore.frame``
+
+    Returns:
+        One row per sector (stocks without metadata under "Unknown") with
+        stock count, median and mean return, percentage of stocks up,
+        total market cap and the best performer; best median first
+    """
+    return (
+        performance.join(
+            companies.select("ticker", "sector", "market_cap"),
+            on="ticker",
+            how="left",
+        )
+        .with_columns(pl.col("sector").fill_null("Unknown"))
+        .group_by("sector")
+        .agg(
+            pl.len().alias("stocks"),
+            pl.col("total_return").median().alias("median_return"),
+            pl.col("total_return").mean().alias("mean_return"),
+            ((pl.col("total_return") > 0).mean() * 100).alias("up_pct"),
+            pl.col("market_cap").sum().alias("market_cap"),
+            pl.col("ticker").sort_by("total_return").last().alias("best"),
+            pl.col("total_return").max().alias("best_return"),
+        )
+        .sort(["median_return", "sector"], descending=[True, False])
+    )
+
+
+def display_sectors(sectors: pl.DataFrame, console: Console) -> None:
+    """Display sector performance in a formatted table."""
+    if sectors.is_empty():
+        console.print("[yellow]No results found[/yellow]")
+        return
+
+    table = Table(title="Sector Performance")
+    table.add_column("Sector", style="cyan")
+    table.add_column("Stocks", justify="right")
+    table.add_column("Median %", style="green", justify="right")
+    table.add_column("Mean %", justify="right")
+    table.add_column("Up %", justify="right")
+    table.add_column("Market Cap", justify="right")
+    table.add_column("Best", style="yellow")
+
+    for r in sectors.iter_rows(named=True):
+        table.add_row(
+            r["sector"],
+            str(r["stocks"]),
+            f"{r['median_return']:.2f}",
+            f"{r['mean_return']:.2f}",
+            f"{r['up_pct']:.0f}",
+            format_market_cap(r["market_cap"] or None),
+            f"{r['best']} ({r['best_return']:+.1f}%)",
+        )
+
+    console.print(table)
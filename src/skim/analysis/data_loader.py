@@ -2,12 +2,63 @@
 Data loader for loading and managing ASX stock data.
 """
 
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import polars as pl
 from tqdm import tqdm
 
-from skim.analysis.stock_data import StockData
+from skim.analysis.stock_data import CSV_COLUMNS, StockData
+from skim.analysis.universe import attach_universe, default_shared_path
+
+LIQUIDITY_LOOKBACK = 50
+
+
+def build_prefilter_plan(
+    filepath: Path,
+    min_price: float,
+    min_volume: int,
+    lookback: int = LIQUIDITY_LOOKBACK,
+) -> pl.LazyFrame:
+    """
+    Build a lazy liquidity screen for a single stock CSV.
+
+    Only the date, close and volume columns are read. Rows are sorted and
+    deduplicated by date exactly as ``StockData.load_from_csv`` does, so
+    the trailing ``lookback`` rows are the ones
+    ``StockData.filter_by_criteria`` tests, even in an unordered file or
+    one with repeated dates. The plan yields one row when the stock meets
+    those criteria and no rows otherwise.
+
+    Args:
+        filepath: Path to the stock CSV file
+        min_price: Minimum latest closing price
+        min_volume: Minimum average volume over the lookback window
+        lookback: Number of trailing rows used for the volume average
+
+    Returns:
+        LazyFrame with latest_close and avg_volume for passing stocks
+    """
+    return (
+        pl.scan_csv(filepath, has_header=False, new_columns=CSV_COLUMNS)
+        .select(
+            pl.col("date").str.strptime(pl.Date, "%d/%m/%Y"),
+            "close",
+            "volume",
+        )
+        .sort("date")
+        .unique(subset=["date"], maintain_order=True)
+        .tail(lookback)
+        .select(
+            pl.col("close").last().alias("latest_close"),
+            pl.col("volume").mean().fill_null(0.0).alias("avg_volume"),
+        )
+        .filter(
+            (pl.col("latest_close") >= min_price)
+            & (pl.col("avg_volume") >= min_volume)
+        )
+    )
 
 
 class DataLoader:
@@ -23,6 +74,7 @@ class DataLoader:
         min_volume: int = 50000,
         num_workers: int = 8,
         quiet: bool = False,
+        progress: Callable[[int, int], None] | None = None,
     ) -> dict[str, StockData]:
         """
         Load all CSV files from data directory.
@@ -31,6 +83,8 @@ class DataLoader:
             min_price: Minimum price filter (default $0.20)
             min_volume: Minimum average volume filter (default 50k)
             num_workers: Number of concurrent workers (default 8)
+            quiet: Suppress console output and the progress bar
+            progress: Optional callback receiving (files_done, files_total)
 
         Returns:
             Dictionary mapping ticker -> StockData
@@ -55,7 +109,9 @@ class DataLoader:
                     iterator, total=len(csv_files), desc="Loading stocks"
                 )
 
-            for future in iterator:
+            for done, future in enumerate(iterator, start=1):
+                if progress is not None:
+                    progress(done, len(csv_files))
                 try:
                     stock = future.result()
                     if stock:
@@ -68,15 +124,57 @@ class DataLoader:
             print(f"Loaded {len(stocks)} stocks meeting criteria")
         return stocks
 
+    def attach(self, shared_path: Path | None = None) -> dict[str, StockData]:
+        """
+        Attach to a universe published by a running dataset server.
+
+        The shared Arrow file is memory-mapped and each stock's frame is a
+        slice of it, so sessions start without parsing any CSVs and share
+        one physical copy of the price, volume and cumulative columns. The
+        ticker column is converted to Polars' string layout and so is
+        copied per session; a universe published without the cumulative
+        columns has them computed, and copied, on first use.
+
+        Args:
+            shared_path: Published file (default: the server's default path)
+
+        Returns:
+            Dictionary mapping ticker -> StockData
+        """
+        frame = attach_universe(shared_path or default_shared_path())
+
+        bounds = (
+            frame.select("ticker")
+            .with_row_index("offset")
+            .group_by("ticker", maintain_order=True)
+            .agg(pl.col("offset").first(), pl.len().alias("length"))
+        )
+
+        stocks = {}
+        for ticker, offset, length in bounds.iter_rows():
+            stock = StockData(ticker)
+            stock.df = frame.slice(offset, length)
+            stocks[ticker] = stock
+
+        self.stocks = stocks
+        return stocks
+
     @staticmethod
     def _load_single_stock(
         filepath: Path, min_price: float, min_volume: int
     ) -> StockData | None:
-        """Load a single stock from CSV file."""
+        """Load a single stock from CSV file.
+
+        Tickers are screened by name and by a cheap lazy pass over the
+        file tail before the full CSV is parsed.
+        """
         try:
             ticker = filepath.stem.upper()
             if len(ticker) != 3:
                 return None
+            prefilter = build_prefilter_plan(filepath, min_price, min_volume)
+            if prefilter.collect().is_empty():
+                return None
             stock = StockData(ticker)
             stock.load_from_csv(str(filepath))
             if stock.filter_by_criteria(min_price, min_volume):
@@ -0,0 +1,97 @@
+"""
+Resident dataset server sharing one in-memory copy of the stock universe.
+
+The server loads the universe once and publishes it as an uncompressed
+Arrow IPC file on a memory-backed filesystem (``/dev/shm`` where
+available). Analysis sessions attach with ``DataLoader.attach``, which
+memory-maps the file so every process reads the same physical pages
+for the numeric columns instead of parsing its own copy of the CSVs.
+"""
+
+import time
+from pathlib import Path
+
+from rich.console import Console
+
+from skim.analysis.data_loader import DataLoader
+from skim.analysis.universe import (
+    build_universe,
+    default_shared_path,
+    publish_universe,
+)
+
+
+class DatasetServer:
+    """Loads the universe once and keeps it published for other sessions."""
+
+    def __init__(
+        self,
+        data_dir: str = "data/processed/historical",
+        shared_path: Path | None = None,
+        min_price: float = 0.20,
+        min_volume: int = 50000,
+    ):
+        self.data_dir = Path(data_dir)
+        self.shared_path = shared_path or default_shared_path()
+        self.min_price = min_price
+        self.min_volume = min_volume
+        self.console = Console()
+
+    def publish(self) -> int:
+        """
+        Load the universe from CSV and publish it to shared memory.
+
+        Returns:
+            Number of stocks published
+        """
+        loader = DataLoader(str(self.data_dir))
+        stocks = loader.load_all(
+            min_price=self.min_price, min_volume=self.min_volume, quiet=True
+        )
+        frame = build_universe(dict(sorted(stocks.items())))
+        publish_universe(frame, self.shared_path)
+        return len(stocks)
+
+    def _source_state(self) -> frozenset[tuple[str, float]]:
+        """Name and modification time of every CSV in the source directory."""
+        return frozenset(
+            (p.name, p.stat().st_mtime) for p in self.data_dir.glob("*.csv")
+        )
+
+    def serve_forever(self, refresh_interval: float = 60.0) -> None:
+        """
+        Publish the universe and republish whenever the source data changes.
+
+        Any added, removed or rewritten CSV counts as a change, including a
+        file replaced by one with an older modification time.
+
+        Args:
+            refresh_interval: Seconds between checks for updated CSV files
+        """
+        self.console.print(
+            f"[cyan]→ Loading universe from {self.data_dir}...[/cyan]"
+        )
+        count = self.publish()
+        published_state = self._source_state()
+        self.console.print(
+            f"[green]✓ Published {count} stocks to {self.shared_path}[/green]"
+        )
+
+        try:
+            while True:
+                time.sleep(refresh_interval)
+                state = self._source_state()
+                if state != published_state:
+                    count = self.publish()
+                    published_state = state
+                    self.console.print(
+                        f"[green]✓ Republished {count} stocks[/green]"
+                    )
+        except KeyboardInterrupt:
+            self.console.print("\n[yellow]Stopping dataset server[/yellow]")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Remove the published file; attached sessions keep their mapping."""
+        self.shared_path.unlink(missing_ok=True)
@@ -0,0 +1,397 @@
+"""
+Persisted index of detected pattern events.
+
+Gap, momentum-burst and consolidation events are detected once over each
+ticker's full history and stored in SQLite, keyed by pattern type and
+detector parameters. When new bars land only each ticker's trailing
+window is re-evaluated: events that could still change (those ending in
+the trailing window) are replaced, and everything older is kept as is.
+Each ticker's covered bars are fingerprinted, so a ticker whose history
+was corrected is scanned again from scratch.
+"""
+
+import io
+import json
+import sqlite3
+from collections.abc import Callable
+from datetime import date, datetime
+from pathlib import Path
+
+import polars as pl
+
+DEFAULT_INDEX_PATH = Path("data/processed/pattern_events.db")
+
+# Bars before the last indexed bar whose events are re-evaluated on update
+TRAILING_BARS = 60
+# Extra history fed to the detector: the 50-bar volume baseline plus room
+# for detection windows that straddle the re-evaluation point
+WARMUP_BARS = 100
+
+# Columns holding each pattern's first and last bar (default: start/end)
+SPAN_COLUMNS = {"gap": ("date", "date")}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pattern_events (
+    pattern TEXT NOT NULL,
+    params TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pattern_events_period
+    ON pattern_events (pattern, params, start_date, end_date);
+CREATE INDEX IF NOT EXISTS idx_pattern_events_ticker
+    ON pattern_events (pattern, params, ticker, start_date);
+CREATE TABLE IF NOT EXISTS pattern_coverage (
+    pattern TEXT NOT NULL,
+    params TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    last_date TEXT NOT NULL,
+    fingerprint TEXT,
+    PRIMARY KEY (pattern, params, ticker)
+);
+"""
+
+# Price resolution of bar fingerprints (prices are summed as integers)
+FINGERPRINT_SCALE = 10_000
+
+Detector = Callable[..., pl.DataFrame]
+
+
+def _iso(value: date | datetime) -> str:
+    """ISO date string for a date or datetime."""
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.isoformat()
+
+
+def params_key(params: dict) -> str:
+    """Canonical string form of detector parameters."""
+    return json.dumps(params, sort_keys=True)
+
+
+def bar_fingerprint() -> pl.Expr:
+    """
+    Aggregate expression fingerprinting a ticker's bars.
+
+    Prices are scaled to integers before summing so the fingerprint does
+    not depend on summation order; a changed, added or removed bar
+    changes it.
+    """
+    prices = [
+        (pl.col(name) * FINGERPRINT_SCALE).round().cast(pl.Int64).sum()
+        for name in ("open", "high", "low", "close")
+    ]
+    return pl.concat_str(
+        pl.len(),
+        pl.col("date").cast(pl.Int64).sum(),
+        *prices,
+        pl.col("volume").cast(pl.Int64).sum(),
+        separator=":",
+    )
+
+
+class EventIndex:
+    """SQLite store of pattern events, extended incrementally."""
+
+    def __init__(self, db_path: str | Path = DEFAULT_INDEX_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        columns = {
+            row[1]
+            for row in self.conn.execute("PRAGMA table_info(pattern_coverage)")
+        }
+        if "fingerprint" not in columns:
+            # Tickers indexed before fingerprints are rescanned on update
+            self.conn.execute(
+                "ALTER TABLE pattern_coverage ADD COLUMN fingerprint TEXT"
+            )
+        self._synced: set[tuple] = set()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def events(
+        self,
+        pattern: str,
+        detector: Detector,
+        universe: pl.DataFrame,
+        start_date: date | datetime,
+        end_date: date | datetime,
+        params: dict,
+    ) -> pl.DataFrame:
+        """
+        Return indexed events of the universe lying within a period.
+
+        The index is brought up to date with the universe once per
+        session; later calls are plain indexed queries. Events are
+        detected over each ticker's full history, so an event is returned
+        only if it lies wholly within the period.
+
+        Args:
+            pattern: Pattern type, e.g. "gap" or "momentum_burst"
+            detector: Universe kernel that detects the pattern
+            universe: Long OHLCV frame grouped by ticker and sorted by date
+            start_date: First date an event may start on
+            end_date: Last date an event may end on
+            params: Detector parameters
+
+        Returns:
+            DataFrame of events in the detector's output schema
+        """
+        version = (pattern, params_key(params), universe.height)
+        if universe.height:
+            version += (universe["date"].max(),)
+        if version not in self._synced:
+            self.update(pattern, detector, universe, params)
+            self._synced.add(version)
+
+        return self.query(
+            pattern,
+            start_date,
+            end_date,
+            params,
+            self._schema(detector, universe, params),
+            tickers=universe["ticker"].unique().to_list(),
+        )
+
+    def query(
+        self,
+        pattern: str,
+        start_date: date | datetime,
+        end_date: date | datetime,
+        params: dict,
+        schema: pl.Schema | dict,
+        tickers: list[str] | None = None,
+    ) -> pl.DataFrame:
+        """
+        Read events that start and end within a period.
+
+        Args:
+            pattern: Pattern type
+            start_date: First date an event may start on
+            end_date: Last date an event may end on
+            params: Detector parameters
+            schema: Output schema of the pattern's detector
+            tickers: Only read events of these tickers (default: all)
+
+        Returns:
+            DataFrame of events ordered by ticker and start date
+        """
+        sql = """
+            SELECT payload FROM pattern_events
+            WHERE pattern = ? AND params = ?
+              AND start_date >= ? AND end_date <= ?
+        """
+        args = [pattern, params_key(params), _iso(start_date), _iso(end_date)]
+        if tickers is not None:
+            sql += "  AND ticker IN (SELECT value FROM json_each(?))\n"
+            args.append(json.dumps(tickers))
+        rows = self.conn.execute(sql + "ORDER BY ticker, start_date", args)
+        payload = "\n".join(row[0] for row in rows)
+        return pl.read_ndjson(io.StringIO(payload), schema=schema)
+
+    def update(
+        self,
+        pattern: str,
+        detector: Detector,
+        universe: pl.DataFrame,
+        params: dict,
+    ) -> int:
+        """
+        Index events for bars not yet covered, re-evaluating trailing windows.
+
+        Tickers never indexed, or whose covered bars no longer match their
+        fingerprint, are scanned over their full history. For tickers with
+        new bars, events starting at or after the ticker's
+        re-evaluation point are replaced; that point is ``TRAILING_BARS``
+        before the first new bar, moved back to the start of any event
+        still open there. The detector sees ``WARMUP_BARS`` of extra
+        history so its rolling baselines match a full-history scan.
+
+        Args:
+            pattern: Pattern type
+            detector: Universe kernel that detects the pattern
+            universe: Long OHLCV frame grouped by ticker and sorted by date
+            params: Detector parameters
+
+        Returns:
+            Number of tickers re-evaluated
+        """
+        key = params_key(params)
+        start_col, end_col = SPAN_COLUMNS.get(
+            pattern, ("start_date", "end_date")
+        )
+
+        coverage = pl.DataFrame(
+            self.conn.execute(
+                "SELECT ticker, last_date, fingerprint FROM pattern_coverage "
+                "WHERE pattern = ? AND params = ?",
+                (pattern, key),
+            ).fetchall(),
+            schema={
+                "ticker": pl.Utf8,
+                "last_date": pl.Utf8,
+                "fingerprint": pl.Utf8,
+            },
+            orient="row",
+        ).with_columns(pl.col("last_date").str.to_date())
+        # Corrected history drops a ticker's coverage, forcing a full rescan
+        covered_bars = (
+            universe.join(coverage, on="ticker")
+            .filter(pl.col("date") <= pl.col("last_date"))
+            .group_by("ticker")
+            .agg(bar_fingerprint().alias("current"))
+        )
+        coverage = (
+            coverage.join(covered_bars, on="ticker", how="left")
+            .filter(pl.col("fingerprint") == pl.col("current"))
+            .select("ticker", "last_date")
+        )
+
+        bars = (
+            universe.select("ticker", "date")
+            .with_columns(pl.int_range(pl.len()).over("ticker").alias("idx"))
+            .join(coverage, on="ticker", how="left", maintain_order="left")
+        )
+        is_new = pl.col("last_date").is_null() | (
+            pl.col("date") > pl.col("last_date")
+        )
+        trail = (
+            bars.group_by("ticker", maintain_order=True)
+            .agg(
+                pl.col("idx").filter(is_new).min().alias("first_new"),
+                pl.col("date").max().alias("latest_date"),
+                pl.col("last_date").first().is_null().alias("unindexed"),
+            )
+            .filter(pl.col("first_new").is_not_null())
+        )
+        if trail.is_empty():
+            return 0
+
+        trail = trail.with_columns(
+            (pl.col("first_new") - TRAILING_BARS)
+            .clip(lower_bound=0)
+            .alias("idx")
+        ).join(bars.select("ticker", "idx", "date"), on=["ticker", "idx"])
+
+        reevaluate_from = trail.select(pl.col("date").min()).item()
+        recent = pl.DataFrame(
+            self.conn.execute(
+                "SELECT ticker, start_date, end_date FROM pattern_events "
+                "WHERE pattern = ? AND params = ? AND end_date >= ?",
+                (pattern, key, _iso(reevaluate_from)),
+            ).fetchall(),
+            schema={"ticker": pl.Utf8, "start": pl.Utf8, "end": pl.Utf8},
+            orient="row",
+        ).with_columns(pl.col("start", "end").str.to_date())
+        open_events = (
+            recent.join(trail.select("ticker", "date"), on="ticker")
+            .filter(pl.col("end") >= pl.col("date"))
+            .group_by("ticker")
+            .agg(pl.col("start").min().alias("open_start"))
+        )
+
+        trail = (
+            trail.join(open_events, on="ticker", how="left")
+            .with_columns(
+                pl.when(pl.col("unindexed"))
+                .then(None)
+                .otherwise(pl.min_horizontal("date", "open_start"))
+                .alias("keep_from")
+            )
+            .select("ticker", "latest_date", "keep_from")
+        )
+
+        keep_idx = (
+            pl.col("idx")
+            .filter(
+                pl.col("keep_from").is_null()
+                | (pl.col("date") >= pl.col("keep_from"))
+            )
+            .min()
+            .over("ticker")
+        )
+        sliced = (
+            universe.with_columns(
+                pl.int_range(pl.len()).over("ticker").alias("idx")
+            )
+            .join(
+                trail.select("ticker", "keep_from"),
+                on="ticker",
+                maintain_order="left",
+            )
+            .filter(pl.col("idx") >= keep_idx - WARMUP_BARS)
+            .drop("idx", "keep_from")
+        )
+
+        found = detector(
+            sliced,
+            start_date=sliced["date"].min(),
+            end_date=sliced["date"].max(),
+            **params,
+        )
+        found = found.join(
+            trail.select("ticker", "keep_from"), on="ticker", how="left"
+        ).filter(
+            pl.col("keep_from").is_null()
+            | (pl.col(start_col) >= pl.col("keep_from"))
+        )
+        events = found.select(
+            "ticker",
+            pl.col(start_col).cast(pl.Utf8).alias("start"),
+            pl.col(end_col).cast(pl.Utf8).alias("end"),
+        ).rows()
+        payloads = found.drop("keep_from").write_ndjson().splitlines()
+        cleared = trail.select(
+            "ticker", pl.col("keep_from").cast(pl.Utf8).fill_null("")
+        ).rows()
+        covered = (
+            trail.join(
+                universe.group_by("ticker").agg(
+                    bar_fingerprint().alias("fingerprint")
+                ),
+                on="ticker",
+            )
+            .select(
+                "ticker", pl.col("latest_date").cast(pl.Utf8), "fingerprint"
+            )
+            .rows()
+        )
+
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM pattern_events WHERE pattern = ? AND params = ? "
+                "AND ticker = ? AND start_date >= ?",
+                [(pattern, key, *row) for row in cleared],
+            )
+            self.conn.executemany(
+                "INSERT INTO pattern_events "
+                "(pattern, params, ticker, start_date, end_date, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (pattern, key, *event, payload)
+                    for event, payload in zip(events, payloads, strict=True)
+                ],
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO pattern_coverage "
+                "(pattern, params, ticker, last_date, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(pattern, key, *row) for row in covered],
+            )
+
+        return trail.height
+
+    @staticmethod
+    def _schema(
+        detector: Detector, universe: pl.DataFrame, params: dict
+    ) -> pl.Schema:
+        """Output schema of a detector, from a scan of no rows."""
+        return detector(
+            universe.clear(), start_date=date.min, end_date=date.max, **params
+        ).schema
@@ -6,14 +6,114 @@ import polars as pl
 from rich.console import Console
 from rich.table import Table
 
+from skim.analysis.event_index import EventIndex
+from skim.analysis.results import Results, result_count, shown_rows
 from skim.analysis.stock_data import StockData
+from skim.analysis.universe import build_universe
+
+GAP_COLUMNS = [
+    "ticker",
+    "date",
+    "gap_percent",
+    "open",
+    "prev_close",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "avg_volume_50d",
+    "volume_multiple",
+]
+
+
+def gap_events(
+    universe: pl.DataFrame | pl.LazyFrame,
+    start_date,
+    end_date,
+    gap_threshold: float = 10.0,
+    volume_multiplier: float = 2.0,
+    min_volume: int = 50000,
+) -> pl.DataFrame:
+    """
+    Detect gap-up days across every ticker in a universe frame.
+
+    Prior close and the 50-bar average volume (excluding the gap day) are
+    window expressions over each ticker's full history, so the whole
+    universe is scanned in one pass. A gap is only reported when the
+    previous bar also falls inside the period.
+
+    Args:
+        universe: Long OHLCV frame grouped by ticker and sorted by date
+        start_date: Start date for scanning
+        end_date: End date for scanning
+        gap_threshold: Minimum gap percentage
+        volume_multiplier: Minimum volume multiple vs 50-day average
+        min_volume: Minimum daily volume
+
+    Returns:
+        DataFrame with one row per gap, columns as in GAP_COLUMNS
+    """
+    prev_close = pl.col("close").shift(1).over("ticker")
+    prev_date = pl.col("date").shift(1).over("ticker")
+    avg_volume = (
+        pl.col("volume")
+        .cast(pl.Float64)
+        .rolling_mean(window_size=50, min_samples=50)
+        .shift(1)
+        .over("ticker")
+        .fill_null(0.0)
+    )
+
+    return (
+        universe.lazy()
+        .filter(pl.col("date") <= end_date)
+        .with_columns(
+            prev_close.alias("prev_close"),
+            prev_date.alias("prev_date"),
+            avg_volume.alias("avg_volume_50d"),
+        )
+        .filter(
+            (pl.col("prev_date") >= start_date) & (pl.col("prev_close") != 0)
+        )
+        .with_columns(
+            (
+                (pl.col("open") - pl.col("prev_close"))
+                / pl.col("prev_close")
+                * 100
+            ).alias("gap_percent"),
+            pl.when(pl.col("avg_volume_50d") > 0)
+            .then(pl.col("volume") / pl.col("avg_volume_50d"))
+            .otherwise(0.0)
+            .alias("volume_multiple"),
+        )
+        .filter(
+            (pl.col("gap_percent") >= gap_threshold)
+            & (pl.col("volume") >= min_volume)
+            & (pl.col("volume_multiple") >= volume_multiplier)
+        )
+        .select(GAP_COLUMNS)
+        .collect()
+    )
 
 
 class GapScanner:
     """Scans for significant price gaps in stock data."""
 
-    def __init__(self, stocks: dict[str, StockData]):
+    def __init__(
+        self,
+        stocks: dict[str, StockData],
+        index: EventIndex | None = None,
+    ):
         self.stocks = stocks
+        self.index = index
+        self._universe: pl.DataFrame | None = None
+
+    @property
+    def universe(self) -> pl.DataFrame:
+        """Long OHLCV frame of all stocks, built on first use."""
+        if self._universe is None:
+            self._universe = build_universe(self.stocks)
+        return self._universe
 
     def find_gaps(
         self,
@@ -22,10 +122,13 @@ class GapScanner:
         gap_threshold: float = 10.0,
         volume_multiplier: float = 2.0,
         min_volume: int = 50000,
-    ) -> list[dict]:
+    ) -> pl.DataFrame:
         """
         Find gaps over a period.
 
+        With an event index attached, gaps are read from the index, which
+        is first extended with any bars added since it was last updated.
+
         Args:
             start_date: Start date for scanning
             end_date: End date for scanning
@@ -34,101 +137,42 @@ class GapScanner:
             min_volume: Minimum daily volume (default 50k)
 
         Returns:
-            List of gap dictionaries with details
+            DataFrame with one row per gap, largest gap first
         """
-        gaps = []
-
-        for _ticker, stock in self.stocks.items():
-            stock_gaps = self._find_gaps_in_stock(
-                stock,
+        params = {
+            "gap_threshold": gap_threshold,
+            "volume_multiplier": volume_multiplier,
+            "min_volume": min_volume,
+        }
+        if self.index is not None:
+            gaps = self.index.events(
+                "gap",
+                gap_events,
+                self.universe,
                 start_date,
                 end_date,
-                gap_threshold,
-                volume_multiplier,
-                min_volume,
+                params,
             )
-            gaps.extend(stock_gaps)
-
-        gaps.sort(key=lambda x: x["gap_percent"], reverse=True)
-        return gaps
-
-    def _find_gaps_in_stock(
-        self,
-        stock: StockData,
-        start_date,
-        end_date,
-        gap_threshold: float,
-        volume_multiplier: float,
-        min_volume: int,
-    ) -> list[dict]:
-        """Find gaps in a single stock."""
-        gaps = []
-
-        if stock.df is None:
-            return gaps
-
-        period_df = stock.df.filter(
-            (pl.col("date") >= start_date) & (pl.col("date") <= end_date)
-        )
-
-        if len(period_df) < 2:
-            return gaps
-
-        for i in range(1, len(period_df)):
-            current = period_df.row(i, named=True)
-            previous = period_df.row(i - 1, named=True)
-
-            gap = (
-                (current["open"] - previous["close"]) / previous["close"] * 100
+        else:
+            gaps = gap_events(
+                self.universe,
+                start_date=start_date,
+                end_date=end_date,
+                **params,
             )
+        return gaps.sort(
+            ["gap_percent", "ticker", "date"], descending=[True, False, False]
+        )
 
-            if gap >= gap_threshold:
-                filtered_df = stock.df.filter(pl.col("date") < current["date"])
-                if len(filtered_df) >= 50:
-                    volume_mean = filtered_df["volume"].tail(50).mean()
-                    avg_volume = (
-                        float(volume_mean)
-                        if volume_mean is not None
-                        and isinstance(volume_mean, (int, float))
-                        else 0.0
-                    )
-                else:
-                    avg_volume = 0.0
-
-                if avg_volume > 0:
-                    vol_multiple = current["volume"] / avg_volume
-                else:
-                    vol_multiple = 0
-
-                if (
-                    current["volume"] >= min_volume
-                    and vol_multiple >= volume_multiplier
-                ):
-                    gaps.append(
-                        {
-                            "ticker": stock.ticker,
-                            "date": current["date"],
-                            "gap_percent": gap,
-                            "open": current["open"],
-                            "prev_close": previous["close"],
-                            "high": current["high"],
-                            "low": current["low"],
-                            "close": current["close"],
-                            "volume": current["volume"],
-                            "avg_volume_50d": avg_volume,
-                            "volume_multiple": vol_multiple,
-                        }
-                    )
-
-        return gaps
-
-    def display_gaps(self, gaps: list[dict], console: Console) -> None:
-        """Display gaps in a formatted table."""
-        if not gaps:
+    def display_gaps(self, gaps: Results, console: Console) -> None:
+        """Display gaps, with linked announcements when present."""
+        if not result_count(gaps):
             console.print("[yellow]No gaps found[/yellow]")
             return
 
-        table = Table(title=f"Significant Gaps (showing top {len(gaps)})")
+        table = Table(
+            title=f"Significant Gaps (showing top {result_count(gaps)})"
+        )
         table.add_column("Ticker", style="cyan", width=8)
         table.add_column("Date", style="yellow", width=12)
         table.add_column("Gap %", style="green", width=8)
@@ -136,9 +180,16 @@ class GapScanner:
         table.add_column("Close", width=8)
         table.add_column("Vol", width=10)
         table.add_column("Vol x50d", width=8)
+        news = "headline" in (
+            gaps.columns if isinstance(gaps, pl.DataFrame) else gaps[0]
+        )
+        if news:
+            table.add_column("Announcement", width=40)
+            table.add_column("PS", width=3)
+            table.add_column("Lag (h)", justify="right", width=7)
 
-        for g in gaps[:50]:
-            table.add_row(
+        for g in shown_rows(gaps, 50):
+            row = [
                 g["ticker"],
                 g["date"].strftime("%Y-%m-%d"),
                 f"{g['gap_percent']:.2f}%",
@@ -146,6 +197,15 @@ class GapScanner:
                 f"{g['close']:.3f}",
                 f"{g['volume']:,.0f}",
                 f"{g['volume_multiple']:.1f}x",
-            )
+            ]
+            if news and g["headline"] is None:
+                row += ["-", "", ""]
+            elif news:
+                row += [
+                    g["headline"],
+                    "✓" if g["price_sensitive"] else "✗",
+                    f"{g['lag_hours']:.1f}",
+                ]
+            table.add_row(*row)
 
         console.print(table)
@@ -2,21 +2,688 @@
 Momentum and consolidation pattern detection for ASX stocks.
 """
 
-import statistics
+from collections import OrderedDict
+from collections.abc import Hashable
 from datetime import datetime
 
 import polars as pl
 from rich.console import Console
 from rich.table import Table
 
+from skim.analysis.event_index import EventIndex
+from skim.analysis.results import Results, result_count, shown_rows
 from skim.analysis.stock_data import StockData
+from skim.analysis.universe import build_universe, filter_period
+
+
+def momentum_bursts(
+    universe: pl.DataFrame | pl.LazyFrame,
+    min_days: int = 3,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> pl.DataFrame:
+    """
+    Detect momentum bursts across every ticker in a universe frame.
+
+    Up-days (close above the previous close) are run-length encoded per
+    ticker; a missing close on either side breaks a run. Each run of at
+    least ``min_days`` up-days becomes a burst starting at the bar before
+    its first up-day. Burst volume and the 50-bar baseline volume before
+    the burst are read from cumulative and rolling window sums rather
+    than re-summed per burst.
+
+    Args:
+        universe: Long OHLCV frame grouped by ticker and sorted by date
+        min_days: Minimum consecutive up days
+        start_date: Start date for analysis (optional)
+        end_date: End date for analysis (optional)
+
+    Returns:
+        DataFrame with one row per burst, including a daily_gains list column
+    """
+    frame = universe.lazy()
+    if start_date and end_date:
+        frame = filter_period(frame, start_date, end_date)
+
+    prev_close = pl.col("close").shift(1).over("ticker")
+    volume = pl.col("volume").fill_null(0)
+
+    rows = frame.with_columns(
+        pl.int_range(pl.len()).over("ticker").alias("idx"),
+        (pl.col("close") > prev_close).fill_null(False).alias("up"),
+        pl.when(prev_close > 0)
+        .then((pl.col("close") - prev_close) / prev_close * 100)
+        .alias("daily_gain"),
+        volume.alias("volume_filled"),
+        volume.cum_sum().over("ticker").alias("cum_volume_run"),
+        volume.rolling_sum(window_size=50, min_samples=1)
+        .shift(1)
+        .over("ticker")
+        .alias("baseline_sum"),
+    ).with_columns(pl.col("up").rle_id().over("ticker").alias("run_id"))
+
+    runs = (
+        rows.filter(pl.col("up"))
+        .group_by("ticker", "run_id")
+        .agg(
+            pl.len().alias("consecutive_up_days"),
+            (pl.col("idx").min() - 1).alias("start_idx"),
+            pl.col("date").last().alias("end_date"),
+            pl.col("close").last().alias("end_price"),
+            pl.col("cum_volume_run").last().alias("cum_volume_end"),
+            pl.col("daily_gain").drop_nulls().alias("daily_gains"),
+        )
+        .filter(pl.col("consecutive_up_days") >= min_days)
+    )
+
+    starts = rows.select(
+        "ticker",
+        pl.col("idx").alias("start_idx"),
+        pl.col("date").alias("start_date"),
+        pl.col("close").alias("start_price"),
+        (pl.col("cum_volume_run") - pl.col("volume_filled")).alias(
+            "cum_volume_before"
+        ),
+        pl.col("baseline_sum"),
+        pl.min_horizontal(pl.col("idx"), 50).alias("baseline_count"),
+    )
+
+    avg_volume = (pl.col("cum_volume_end") - pl.col("cum_volume_before")) / (
+        pl.col("consecutive_up_days") + 1
+    )
+    baseline_volume = (
+        pl.when(pl.col("baseline_count") > 0)
+        .then(pl.col("baseline_sum") / pl.col("baseline_count"))
+        .otherwise(avg_volume)
+    )
+
+    return (
+        runs.join(starts, on=["ticker", "start_idx"], how="inner")
+        .filter(pl.col("start_price") > 0)
+        .with_columns(
+            avg_volume.alias("avg_volume"),
+            baseline_volume.alias("baseline_volume"),
+        )
+        .select(
+            "ticker",
+            pl.lit("momentum_burst").alias("pattern_type"),
+            "start_date",
+            "end_date",
+            pl.col("consecutive_up_days").alias("duration_days"),
+            "consecutive_up_days",
+            pl.col("start_price").cast(pl.Float64),
+            pl.col("end_price").cast(pl.Float64),
+            (
+                (pl.col("end_price") - pl.col("start_price"))
+                / pl.col("start_price")
+                * 100
+            ).alias("total_gain_pct"),
+            "daily_gains",
+            pl.col("avg_volume").cast(pl.Int64),
+            pl.when(pl.col("baseline_volume") > 0)
+            .then(pl.col("avg_volume") / pl.col("baseline_volume"))
+            .otherwise(1.0)
+            .round(2)
+            .alias("volume_spike_multiple"),
+        )
+        .collect()
+    )
+
+
+def consolidations(
+    universe: pl.DataFrame | pl.LazyFrame,
+    max_range_pct: float = 10.0,
+    min_days: int = 5,
+    volume_threshold: float = 0.5,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    merge: bool = True,
+) -> pl.DataFrame:
+    """
+    Detect consolidation patterns across every ticker in a universe frame.
+
+    Every ``min_days``-bar window is scored with rolling max/min/sum
+    expressions: it qualifies when its high-low range is within
+    ``max_range_pct`` and its average volume is at most
+    ``volume_threshold`` times the average of the (up to) 50 bars before
+    it. Overlapping qualifying windows are merged into maximal intervals
+    whose metrics are recomputed over the whole interval; an interval
+    that no longer qualifies as a whole is split into pieces that do. That
+    split is a greedy walk and the one step run in Python, over the
+    failing intervals only.
+
+    Args:
+        universe: Long OHLCV frame grouped by ticker and sorted by date
+        max_range_pct: Maximum price range percentage
+        min_days: Window length in bars
+        volume_threshold: Maximum volume ratio to the baseline
+        start_date: Start date for analysis (optional)
+        end_date: End date for analysis (optional)
+        merge: Merge overlapping windows (False keeps every raw window)
+
+    Returns:
+        DataFrame with one row per consolidation
+    """
+    frame = universe.lazy()
+    if start_date and end_date:
+        frame = filter_period(frame, start_date, end_date)
+
+    lead = min_days - 1
+    volume = pl.col("volume").fill_null(0)
+
+    def ahead(expr: pl.Expr) -> pl.Expr:
+        """Align a trailing window value to the window's first bar."""
+        return expr.shift(-lead).over("ticker")
+
+    rows = frame.with_columns(
+        pl.int_range(pl.len()).over("ticker").alias("idx"),
+        volume.alias("volume_filled"),
+        volume.rolling_sum(window_size=50, min_samples=1)
+        .shift(1)
+        .over("ticker")
+        .alias("baseline_sum"),
+    ).with_columns(
+        ahead(pl.col("high").rolling_max(window_size=min_days)).alias(
+            "window_high"
+        ),
+        ahead(pl.col("low").rolling_min(window_size=min_days)).alias(
+            "window_low"
+        ),
+        ahead(pl.col("volume_filled").rolling_mean(window_size=min_days)).alias(
+            "window_volume"
+        ),
+        ahead(pl.col("date")).alias("window_end_date"),
+        ahead(pl.col("close")).alias("window_end_price"),
+        pl.min_horizontal(pl.col("idx"), 50).alias("baseline_count"),
+    )
+
+    baseline = (
+        pl.when(pl.col("baseline_count") > 0)
+        .then(pl.col("baseline_sum") / pl.col("baseline_count"))
+        .otherwise(pl.col("window_volume"))
+    )
+    windows = (
+        rows.filter(pl.col("window_high").is_not_null())
+        .with_columns(
+            _range_pct(pl.col("window_high"), pl.col("window_low")).alias(
+                "price_range_pct"
+            ),
+            baseline.alias("baseline_volume"),
+        )
+        .filter(
+            (pl.col("price_range_pct") <= max_range_pct)
+            & (_volume_ratio(pl.col("window_volume")) <= volume_threshold)
+        )
+    )
+
+    if not merge:
+        result = windows.select(
+            "ticker",
+            "idx",
+            "date",
+            pl.col("window_end_date").alias("end_date"),
+            pl.lit(min_days).alias("duration_days"),
+            "price_range_pct",
+            "close",
+            pl.col("window_end_price").alias("end_price"),
+            pl.col("window_high").alias("high"),
+            pl.col("window_low").alias("low"),
+            pl.col("window_volume").alias("avg_volume"),
+            "baseline_volume",
+        )
+    else:
+        bars = rows.select(
+            "ticker", "idx", "date", "high", "low", "close", "volume_filled"
+        )
+        spans = (
+            windows.select("ticker", "idx", "baseline_volume")
+            .with_columns(
+                (pl.col("idx") - pl.col("idx").shift(1).over("ticker"))
+                .fill_null(min_days)
+                .ge(min_days)
+                .cum_sum()
+                .over("ticker")
+                .alias("span")
+            )
+            .group_by("ticker", "span")
+            .agg(
+                pl.col("idx").min().alias("span_start"),
+                (pl.col("idx").max() + lead).alias("span_end"),
+                pl.col("baseline_volume").first(),
+            )
+            .drop("span")
+        )
+        merged = _span_metrics(
+            bars.join(
+                spans,
+                left_on=["ticker", "idx"],
+                right_on=["ticker", "span_start"],
+                how="left",
+                maintain_order="left",
+            )
+            .with_columns(
+                pl.when(pl.col("span_end").is_not_null())
+                .then(pl.col("idx"))
+                .alias("span_start"),
+            )
+            .with_columns(
+                pl.col("span_start", "span_end", "baseline_volume")
+                .forward_fill()
+                .over("ticker")
+            )
+            .filter(pl.col("idx") <= pl.col("span_end"))
+        ).collect()
+
+        # A merged interval can drift out of range or pick up volume even
+        # though every window in it qualifies, so recheck it as a whole
+        qualifies = (pl.col("price_range_pct") <= max_range_pct) & (
+            _volume_ratio(pl.col("avg_volume")) <= volume_threshold
+        )
+        failed = merged.filter(~qualifies)
+        if not failed.is_empty():
+            pieces = _split_spans(
+                bars.collect(),
+                windows.select("ticker", "idx", "baseline_volume").collect(),
+                failed,
+                lead,
+                max_range_pct,
+                volume_threshold,
+            )
+            # Pieces of one span may overlap, so bars join every piece
+            split = _span_metrics(
+                bars.join(
+                    pieces.lazy(), on="ticker", maintain_order="left"
+                ).filter(
+                    pl.col("idx").is_between(
+                        pl.col("span_start"), pl.col("span_end")
+                    )
+                )
+            ).collect()
+            merged = pl.concat([merged.filter(qualifies), split])
+        result = merged.lazy()
+
+    return (
+        result.with_columns(
+            _volume_ratio(pl.col("avg_volume")).alias("volume_ratio_to_avg"),
+            pl.when(pl.col("baseline_volume") > 0)
+            .then(
+                (pl.col("baseline_volume") - pl.col("avg_volume"))
+                / pl.col("baseline_volume")
+                * 100
+            )
+            .otherwise(0.0)
+            .alias("volume_decline_pct"),
+        )
+        .select(
+            "ticker",
+            pl.lit("consolidation").alias("pattern_type"),
+            pl.col("date").alias("start_date"),
+            "end_date",
+            pl.col("duration_days").cast(pl.Int64),
+            pl.col("price_range_pct").round(2),
+            pl.col("close").cast(pl.Float64).alias("start_price"),
+            pl.col("end_price").cast(pl.Float64),
+            pl.col("high").cast(pl.Float64),
+            pl.col("low").cast(pl.Float64),
+            pl.col("avg_volume").cast(pl.Int64),
+            pl.col("volume_decline_pct").round(2),
+            pl.col("volume_ratio_to_avg").round(2),
+        )
+        .collect()
+    )
+
+
+def _span_metrics(assigned: pl.LazyFrame) -> pl.LazyFrame:
+    """
+    Price and volume metrics of consolidation spans.
+
+    Args:
+        assigned: Bars in date order with the span_start and
+            baseline_volume of the span each belongs to
+
+    Returns:
+        LazyFrame with one row per span, keyed by ticker and first idx
+    """
+    return (
+        assigned.group_by("ticker", "span_start")
+        .agg(
+            pl.col("idx").first(),
+            pl.col("date").first(),
+            pl.col("date").last().alias("end_date"),
+            pl.len().alias("duration_days"),
+            pl.col("close").first(),
+            pl.col("close").last().alias("end_price"),
+            pl.col("high").max(),
+            pl.col("low").min(),
+            pl.col("volume_filled").mean().alias("avg_volume"),
+            pl.col("baseline_volume").first(),
+        )
+        .with_columns(
+            _range_pct(pl.col("high"), pl.col("low")).alias("price_range_pct"),
+            pl.when(pl.col("idx") > 0)
+            .then(pl.col("baseline_volume"))
+            .otherwise(pl.col("avg_volume"))
+            .alias("baseline_volume"),
+        )
+    )
+
+
+def _split_spans(
+    bars: pl.DataFrame,
+    windows: pl.DataFrame,
+    failed: pl.DataFrame,
+    lead: int,
+    max_range_pct: float,
+    volume_threshold: float,
+) -> pl.DataFrame:
+    """
+    Split merged spans that do not qualify as a whole.
+
+    Each piece starts at a qualifying window and takes in the following
+    windows of the span while the combined bars stay within the range and
+    volume limits, so every piece qualifies and every qualifying window
+    lies in a piece. A window that does not fit starts the next piece,
+    which may overlap the previous one.
+
+    Where a piece ends depends on where it started, so the walk is a
+    Python loop over each span's windows rather than a window expression.
+    It only sees the tickers with failing spans, whose bars are
+    partitioned once.
+
+    Args:
+        bars: Per-bar frame with ticker, idx, high, low and volume_filled
+        windows: Qualifying windows with ticker, idx and baseline_volume
+        failed: Merged spans to split, with ticker, idx and duration_days
+        lead: Bars in a window after its first bar
+        max_range_pct: Maximum price range percentage
+        volume_threshold: Maximum volume ratio to the baseline
+
+    Returns:
+        DataFrame of ticker, span_start, span_end and baseline_volume
+    """
+    spans = failed.select(
+        "ticker",
+        pl.col("idx").alias("span_start"),
+        (pl.col("idx") + pl.col("duration_days") - 1).alias("span_end"),
+    )
+    members = (
+        windows.join(spans, on="ticker")
+        .filter(pl.col("idx").is_between("span_start", "span_end"))
+        .sort("ticker", "idx")
+    )
+
+    by_ticker = bars.filter(
+        pl.col("ticker").is_in(spans["ticker"].unique().to_list())
+    ).partition_by("ticker", as_dict=True)
+
+    pieces = []
+    for ticker, ticker_windows in members.group_by(
+        "ticker", maintain_order=True
+    ):
+        ticker_bars = by_ticker[ticker]
+        high = ticker_bars["high"].to_numpy()
+        low = ticker_bars["low"].to_numpy()
+        volume = ticker_bars["volume_filled"].to_numpy()
+
+        for _, span_windows in ticker_windows.group_by(
+            "span_start", maintain_order=True
+        ):
+            rows = span_windows.select("idx", "baseline_volume").rows()
+            start, baseline = rows[0]
+            end = start + lead
+            for idx, window_baseline in rows[1:]:
+                top = high[start : idx + lead + 1].max()
+                bottom = low[start : idx + lead + 1].min()
+                avg_volume = volume[start : idx + lead + 1].mean()
+                span_baseline = baseline if start > 0 else avg_volume
+                ratio = avg_volume / span_baseline if span_baseline > 0 else 1.0
+                range_pct = (top - bottom) / ((top + bottom) / 2) * 100
+                if range_pct <= max_range_pct and ratio <= volume_threshold:
+                    end = idx + lead
+                    continue
+                pieces.append((ticker[0], start, end, baseline))
+                start, end, baseline = idx, idx + lead, window_baseline
+            pieces.append((ticker[0], start, end, baseline))
+
+    return pl.DataFrame(
+        pieces,
+        schema={
+            "ticker": pl.String,
+            "span_start": pl.Int64,
+            "span_end": pl.Int64,
+            "baseline_volume": pl.Float64,
+        },
+        orient="row",
+    )
+
+
+def _range_pct(high: pl.Expr, low: pl.Expr) -> pl.Expr:
+    """High-low range as a percentage of the range midpoint."""
+    return (high - low) / ((high + low) / 2) * 100
+
+
+def _volume_ratio(avg_volume: pl.Expr) -> pl.Expr:
+    """Average volume relative to the baseline (1.0 without a baseline)."""
+    return (
+        pl.when(pl.col("baseline_volume") > 0)
+        .then(avg_volume / pl.col("baseline_volume"))
+        .otherwise(1.0)
+    )
+
+
+def move_statistics_frame(stats: dict) -> pl.DataFrame:
+    """
+    Flatten move statistics into one row per pattern and metric.
+
+    Args:
+        stats: Statistics as returned by ``get_move_statistics``
+
+    Returns:
+        DataFrame with pattern, metric and value columns; duration
+        distribution bins appear as ``duration_<bin>`` metrics
+    """
+    rows = []
+    for pattern, key in (
+        ("momentum_burst", "momentum_bursts"),
+        ("consolidation", "consolidation"),
+    ):
+        for metric, value in stats[key].items():
+            if metric == "duration_distribution":
+                rows.extend(
+                    (pattern, f"duration_{label}", float(count))
+                    for label, count in value.items()
+                )
+            else:
+                rows.append((pattern, metric, float(value)))
+    return pl.DataFrame(
+        rows,
+        schema={"pattern": pl.String, "metric": pl.String, "value": pl.Float64},
+        orient="row",
+    )
+
+
+PATTERN_DETECTORS = {
+    "momentum_burst": momentum_bursts,
+    "consolidation": consolidations,
+}
+
+
+def analyze_distribution(values: pl.Series, bins: list[int]) -> dict:
+    """
+    Count values into duration bins with a vectorized histogram.
+
+    Bins are right-closed at each threshold, with a final open-ended bin
+    above the last threshold. Only non-empty bins are returned, in bin
+    order.
+
+    Args:
+        values: Durations to bin
+        bins: Ascending upper bounds, e.g. [3, 4, 5, 10]
+
+    Returns:
+        Dictionary mapping bin label (e.g. "1-3_days") -> count
+    """
+    labels = []
+    for i, threshold in enumerate(bins):
+        if i == len(bins) - 1:
+            labels.append(
+                f"{bins[i - 1] + 1}+_days" if i > 0 else f"{threshold}+_days"
+            )
+        elif i == 0:
+            labels.append(f"1-{threshold}_days")
+        else:
+            labels.append(f"{bins[i - 1] + 1}_days")
+    labels.append(f"{bins[-1] + 1}+_days")
+
+    bin_index = pl.Series(bins, dtype=pl.Float64).search_sorted(
+        values.drop_nulls().cast(pl.Float64), side="left"
+    )
+    counts = bin_index.value_counts()
+    found = dict(
+        zip(
+            counts[:, 0].to_list(),
+            counts["count"].to_list(),
+            strict=True,
+        )
+    )
+    return {label: found[i] for i, label in enumerate(labels) if i in found}
+
+
+class PatternCache:
+    """LRU cache of pattern result frames, capped by entries and memory."""
+
+    def __init__(
+        self, max_entries: int = 32, max_bytes: int = 256 * 1024 * 1024
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, pl.DataFrame] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: Hashable) -> pl.DataFrame | None:
+        """Return a cached frame and mark it most recently used."""
+        frame = self._entries.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return frame
+
+    def put(self, key: Hashable, frame: pl.DataFrame) -> None:
+        """Store a frame, evicting least recently used entries over the caps."""
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key).estimated_size()
+        self._entries[key] = frame
+        self._bytes += frame.estimated_size()
+
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.estimated_size()
+
+    def clear(self) -> None:
+        """Drop every cached frame."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class MomentumScanner:
     """Detects momentum bursts and consolidation patterns in stock price data."""
 
-    def __init__(self, stocks: dict[str, StockData]):
+    def __init__(
+        self,
+        stocks: dict[str, StockData],
+        cache: PatternCache | None = None,
+        index: EventIndex | None = None,
+    ):
         self.stocks = stocks
+        self.cache = cache or PatternCache()
+        self.index = index
+        self._universe: pl.DataFrame | None = None
+        self._dataset_version: tuple | None = None
+
+    @property
+    def universe(self) -> pl.DataFrame:
+        """Long OHLCV frame of all stocks, built on first use."""
+        if self._universe is None:
+            self._universe = build_universe(self.stocks)
+        return self._universe
+
+    @property
+    def dataset_version(self) -> tuple:
+        """Fingerprint of the loaded data used to key cached patterns."""
+        if self._dataset_version is None:
+            universe = self.universe
+            self._dataset_version = (
+                universe.height,
+                universe["ticker"].n_unique(),
+                universe["date"].max(),
+            )
+        return self._dataset_version
+
+    def find_patterns(
+        self,
+        pattern_type: str,
+        start_date: datetime,
+        end_date: datetime,
+        **params,
+    ) -> pl.DataFrame:
+        """
+        Detect a pattern across all stocks, reusing cached results.
+
+        Results are keyed by pattern type, parameters, date range and
+        dataset version, so repeated commands over the same period share
+        one computation. With an event index attached, patterns are read
+        from the index (events lying wholly within the period); otherwise
+        the universe is scanned.
+
+        Args:
+            pattern_type: "momentum_burst" or "consolidation"
+            start_date: Start date for analysis
+            end_date: End date for analysis
+            **params: Detector parameters (e.g. min_days, max_range_pct)
+
+        Returns:
+            DataFrame of every detected pattern (unsorted, unlimited)
+        """
+        key = (
+            pattern_type,
+            tuple(sorted(params.items())),
+            start_date,
+            end_date,
+            self.dataset_version,
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        detector = PATTERN_DETECTORS[pattern_type]
+        if self.index is not None:
+            found = self.index.events(
+                pattern_type,
+                detector,
+                self.universe,
+                start_date,
+                end_date,
+                params,
+            )
+        else:
+            found = detector(
+                self.universe,
+                start_date=start_date,
+                end_date=end_date,
+                **params,
+            )
+        self.cache.put(key, found)
+        return found
 
     def detect_momentum_bursts(
         self,
@@ -40,138 +707,13 @@ class MomentumScanner:
         if stock.df is None:
             return []
 
-        df = stock.df
-        if start_date and end_date:
-            df = df.filter(
-                (pl.col("date") >= start_date) & (pl.col("date") <= end_date)
-            )
-
-        bursts = []
-        consecutive_up = 0
-        burst_start_idx = None
-
-        close_prices = df["close"].to_list()
-        volumes = df["volume"].to_list()
-        dates = df["date"].to_list()
-
-        for i in range(1, len(close_prices)):
-            if close_prices[i] is None or close_prices[i - 1] is None:
-                if consecutive_up >= min_days and burst_start_idx is not None:
-                    end_idx = i - 1
-                    self._add_momentum_burst(
-                        bursts,
-                        stock,
-                        dates,
-                        close_prices,
-                        volumes,
-                        burst_start_idx,
-                        end_idx,
-                        consecutive_up,
-                    )
-                consecutive_up = 0
-                burst_start_idx = None
-                continue
-
-            if close_prices[i] > close_prices[i - 1]:
-                consecutive_up += 1
-                if burst_start_idx is None:
-                    burst_start_idx = i - 1
-            else:
-                if consecutive_up >= min_days and burst_start_idx is not None:
-                    end_idx = i - 1
-                    self._add_momentum_burst(
-                        bursts,
-                        stock,
-                        dates,
-                        close_prices,
-                        volumes,
-                        burst_start_idx,
-                        end_idx,
-                        consecutive_up,
-                    )
-                consecutive_up = 0
-                burst_start_idx = None
-
-        if consecutive_up >= min_days and burst_start_idx is not None:
-            end_idx = len(close_prices) - 1
-            self._add_momentum_burst(
-                bursts,
-                stock,
-                dates,
-                close_prices,
-                volumes,
-                burst_start_idx,
-                end_idx,
-                consecutive_up,
-            )
-
-        return bursts
-
-    def _add_momentum_burst(
-        self,
-        bursts: list[dict],
-        stock: StockData,
-        dates: list,
-        close_prices: list,
-        volumes: list,
-        start_idx: int,
-        end_idx: int,
-        consecutive_up: int,
-    ) -> None:
-        """Helper method to add a momentum burst to the list."""
-        if close_prices[start_idx] is None or close_prices[end_idx] is None:
-            return
-
-        start_price = close_prices[start_idx]
-        end_price = close_prices[end_idx]
-        total_gain = ((end_price - start_price) / start_price) * 100
-
-        avg_volume = sum(
-            v for v in volumes[start_idx : end_idx + 1] if v is not None
-        ) / (end_idx - start_idx + 1)
-        baseline_start = max(0, start_idx - 50)
-        baseline_count = start_idx - baseline_start
-        baseline_volume = (
-            sum(v for v in volumes[baseline_start:start_idx] if v is not None)
-            / baseline_count
-            if baseline_count > 0
-            else avg_volume
-        )
-        volume_multiple = (
-            avg_volume / baseline_volume if baseline_volume > 0 else 1.0
-        )
-
-        daily_gains = []
-        for j in range(start_idx + 1, end_idx + 1):
-            if (
-                close_prices[j - 1] is not None
-                and close_prices[j] is not None
-                and close_prices[j - 1] > 0
-            ):
-                daily_gains.append(
-                    (
-                        (close_prices[j] - close_prices[j - 1])
-                        / close_prices[j - 1]
-                    )
-                    * 100
-                )
-
-        bursts.append(
-            {
-                "ticker": stock.ticker,
-                "pattern_type": "momentum_burst",
-                "start_date": dates[start_idx],
-                "end_date": dates[end_idx],
-                "duration_days": consecutive_up,
-                "consecutive_up_days": consecutive_up,
-                "start_price": float(start_price),
-                "end_price": float(end_price),
-                "total_gain_pct": total_gain,
-                "daily_gains": daily_gains,
-                "avg_volume": int(avg_volume),
-                "volume_spike_multiple": round(volume_multiple, 2),
-            }
+        bursts = momentum_bursts(
+            build_universe({stock.ticker: stock}),
+            min_days=min_days,
+            start_date=start_date,
+            end_date=end_date,
         )
+        return bursts.sort("start_date").to_dicts()
 
     def detect_consolidation(
         self,
@@ -181,6 +723,7 @@ class MomentumScanner:
         volume_threshold: float = 0.5,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        merge: bool = True,
     ) -> list[dict]:
         """
         Detect consolidation patterns (flat price + low volume) for a stock.
@@ -192,6 +735,7 @@ class MomentumScanner:
             volume_threshold: Volume ratio threshold (default: 0.5 = 50% of baseline)
             start_date: Start date for analysis (optional)
             end_date: End date for analysis (optional)
+            merge: Merge overlapping windows into intervals (default: True)
 
         Returns:
             List of consolidation dictionaries
@@ -199,66 +743,16 @@ class MomentumScanner:
         if stock.df is None:
             return []
 
-        df = stock.df
-        if start_date and end_date:
-            df = df.filter(
-                (pl.col("date") >= start_date) & (pl.col("date") <= end_date)
-            )
-
-        consolidations = []
-        close_prices = df["close"].to_list()
-        volumes = df["volume"].to_list()
-        dates = df["date"].to_list()
-        highs = df["high"].to_list()
-        lows = df["low"].to_list()
-
-        window_size = min_days
-        for i in range(len(close_prices) - window_size + 1):
-            window_end = min(i + window_size, len(close_prices))
-
-            max_price = max(highs[i:window_end])
-            min_price = min(lows[i:window_end])
-            avg_price = (max_price + min_price) / 2
-
-            price_range_pct = ((max_price - min_price) / avg_price) * 100
-
-            if price_range_pct <= max_range_pct:
-                avg_volume = sum(volumes[i:window_end]) / (window_end - i)
-                baseline_volume = (
-                    sum(volumes[max(0, i - 50) : i]) / min(50, i)
-                    if i > 0
-                    else avg_volume
-                )
-                volume_ratio = (
-                    avg_volume / baseline_volume if baseline_volume > 0 else 1.0
-                )
-
-                if volume_ratio <= volume_threshold:
-                    volume_decline_pct = (
-                        ((baseline_volume - avg_volume) / baseline_volume) * 100
-                        if baseline_volume > 0
-                        else 0
-                    )
-
-                    consolidations.append(
-                        {
-                            "ticker": stock.ticker,
-                            "pattern_type": "consolidation",
-                            "start_date": dates[i],
-                            "end_date": dates[window_end - 1],
-                            "duration_days": window_end - i,
-                            "price_range_pct": round(price_range_pct, 2),
-                            "start_price": float(close_prices[i]),
-                            "end_price": float(close_prices[window_end - 1]),
-                            "high": float(max_price),
-                            "low": float(min_price),
-                            "avg_volume": int(avg_volume),
-                            "volume_decline_pct": round(volume_decline_pct, 2),
-                            "volume_ratio_to_avg": round(volume_ratio, 2),
-                        }
-                    )
-
-        return consolidations
+        found = consolidations(
+            build_universe({stock.ticker: stock}),
+            max_range_pct=max_range_pct,
+            min_days=min_days,
+            volume_threshold=volume_threshold,
+            start_date=start_date,
+            end_date=end_date,
+            merge=merge,
+        )
+        return found.sort("start_date").to_dicts()
 
     def analyze_stock_patterns(
         self,
@@ -301,8 +795,8 @@ class MomentumScanner:
         start_date: datetime,
         end_date: datetime,
         min_days: int = 3,
-        limit: int = 50,
-    ) -> list[dict]:
+        limit: int | None = 50,
+    ) -> pl.DataFrame:
         """
         Find all momentum bursts across all stocks.
 
@@ -310,24 +804,21 @@ class MomentumScanner:
             start_date: Start date for analysis
             end_date: End date for analysis
             min_days: Minimum consecutive up days (default: 3)
-            limit: Maximum number of results
+            limit: Maximum number of results (None for every burst)
 
         Returns:
-            List of all momentum bursts
+            DataFrame of the top bursts by total gain, with a daily_gains
+            list column
         """
-        all_bursts = []
-
-        for _ticker, stock in self.stocks.items():
-            bursts = self.detect_momentum_bursts(
-                stock,
-                min_days=min_days,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            all_bursts.extend(bursts)
-
-        all_bursts.sort(key=lambda x: x["total_gain_pct"], reverse=True)
-        return all_bursts[:limit]
+        bursts = self.find_patterns(
+            "momentum_burst", start_date, end_date, min_days=min_days
+        )
+        if limit is not None:
+            bursts = bursts.top_k(limit, by="total_gain_pct")
+        return bursts.sort(
+            ["total_gain_pct", "ticker", "start_date"],
+            descending=[True, False, False],
+        )
 
     def find_all_consolidations(
         self,
@@ -335,8 +826,9 @@ class MomentumScanner:
         end_date: datetime,
         max_range_pct: float = 10.0,
         min_days: int = 5,
-        limit: int = 50,
-    ) -> list[dict]:
+        limit: int | None = 50,
+        merge: bool = True,
+    ) -> pl.DataFrame:
         """
         Find all consolidations across all stocks.
 
@@ -345,25 +837,26 @@ class MomentumScanner:
             end_date: End date for analysis
             max_range_pct: Maximum price range percentage (default: 10%)
             min_days: Minimum consolidation duration (default: 5 days)
-            limit: Maximum number of results
+            limit: Maximum number of results (None for every consolidation)
+            merge: Merge overlapping windows into intervals (default: True)
 
         Returns:
-            List of all consolidations
+            DataFrame of the longest consolidations
         """
-        all_consolidations = []
-
-        for _ticker, stock in self.stocks.items():
-            consolidations = self.detect_consolidation(
-                stock,
-                max_range_pct=max_range_pct,
-                min_days=min_days,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            all_consolidations.extend(consolidations)
-
-        all_consolidations.sort(key=lambda x: x["duration_days"], reverse=True)
-        return all_consolidations[:limit]
+        found = self.find_patterns(
+            "consolidation",
+            start_date,
+            end_date,
+            max_range_pct=max_range_pct,
+            min_days=min_days,
+            merge=merge,
+        )
+        if limit is not None:
+            found = found.top_k(limit, by="duration_days")
+        return found.sort(
+            ["duration_days", "ticker", "start_date"],
+            descending=[True, False, False],
+        )
 
     def get_move_statistics(
         self, start_date: datetime, end_date: datetime
@@ -371,6 +864,10 @@ class MomentumScanner:
         """
         Calculate move duration statistics across all stocks.
 
+        Statistics are derived from the cached burst and consolidation
+        results, so running bursts, consolidations and move statistics for
+        the same period detects each pattern set once.
+
         Args:
             start_date: Start date for analysis
             end_date: End date for analysis
@@ -378,112 +875,66 @@ class MomentumScanner:
         Returns:
             Dictionary with statistical summaries
         """
-        all_bursts = self.find_all_momentum_bursts(
-            start_date, end_date, limit=1000
-        )
-        all_consolidations = self.find_all_consolidations(
-            start_date, end_date, limit=1000
-        )
-
-        momentum_durations = [b["duration_days"] for b in all_bursts]
-        momentum_gains = [b["total_gain_pct"] for b in all_bursts]
-
-        consolidation_durations = [
-            c["duration_days"] for c in all_consolidations
-        ]
-        consolidation_ranges = [
-            c["price_range_pct"] for c in all_consolidations
-        ]
-
-        def analyze_distribution(values: list[int], bins: list[int]) -> dict:
-            """Create distribution bins."""
-            distribution = {}
-            for value in values:
-                for i, bin_threshold in enumerate(bins):
-                    if value <= bin_threshold:
-                        bin_label = (
-                            f"{bins[i - 1] + 1}_days"
-                            if i > 0
-                            else f"1-{bins[0]}_days"
-                        )
-                        if i == len(bins) - 1:
-                            bin_label = (
-                                f"{bins[i - 1] + 1}+_days"
-                                if i > 0
-                                else f"{bins[0]}+_days"
-                            )
-                        distribution[bin_label] = (
-                            distribution.get(bin_label, 0) + 1
-                        )
-                        break
-                else:
-                    bin_label = f"{bins[-1] + 1}+_days"
-                    distribution[bin_label] = distribution.get(bin_label, 0) + 1
-            return distribution
-
-        momentum_dist = analyze_distribution(momentum_durations, [3, 4, 5, 10])
-        consolidation_dist = analyze_distribution(
-            consolidation_durations, [5, 10, 15]
-        )
+        all_bursts = self.find_patterns(
+            "momentum_burst", start_date, end_date, min_days=3
+        ).top_k(1000, by="total_gain_pct")
+        all_consolidations = self.find_patterns(
+            "consolidation",
+            start_date,
+            end_date,
+            max_range_pct=10.0,
+            min_days=5,
+            merge=True,
+        ).top_k(1000, by="duration_days")
+
+        momentum_durations = all_bursts["duration_days"]
+        consolidation_durations = all_consolidations["duration_days"]
+
+        def summarise(series: pl.Series, statistic: str) -> float:
+            """Rounded summary statistic, 0 for an empty series."""
+            if series.is_empty():
+                return 0
+            value = getattr(series, statistic)()
+            return round(value, 2) if statistic in ("mean", "median") else value
 
         return {
             "period": f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
             "total_stocks": len(self.stocks),
             "momentum_bursts": {
-                "total_count": len(all_bursts),
-                "avg_duration_days": round(
-                    statistics.mean(momentum_durations), 2
-                )
-                if momentum_durations
-                else 0,
-                "median_duration_days": round(
-                    statistics.median(momentum_durations), 2
-                )
-                if momentum_durations
-                else 0,
-                "max_duration_days": max(momentum_durations)
-                if momentum_durations
-                else 0,
-                "min_duration_days": min(momentum_durations)
-                if momentum_durations
-                else 0,
-                "total_gain_avg_pct": round(statistics.mean(momentum_gains), 2)
-                if momentum_gains
-                else 0,
-                "duration_distribution": momentum_dist,
+                "total_count": all_bursts.height,
+                "avg_duration_days": summarise(momentum_durations, "mean"),
+                "median_duration_days": summarise(momentum_durations, "median"),
+                "max_duration_days": summarise(momentum_durations, "max"),
+                "min_duration_days": summarise(momentum_durations, "min"),
+                "total_gain_avg_pct": summarise(
+                    all_bursts["total_gain_pct"], "mean"
+                ),
+                "duration_distribution": analyze_distribution(
+                    momentum_durations, [3, 4, 5, 10]
+                ),
             },
             "consolidation": {
-                "total_count": len(all_consolidations),
-                "avg_duration_days": round(
-                    statistics.mean(consolidation_durations), 2
-                )
-                if consolidation_durations
-                else 0,
-                "median_duration_days": round(
-                    statistics.median(consolidation_durations), 2
-                )
-                if consolidation_durations
-                else 0,
-                "max_duration_days": max(consolidation_durations)
-                if consolidation_durations
-                else 0,
-                "min_duration_days": min(consolidation_durations)
-                if consolidation_durations
-                else 0,
-                "avg_price_range_pct": round(
-                    statistics.mean(consolidation_ranges), 2
-                )
-                if consolidation_ranges
-                else 0,
-                "duration_distribution": consolidation_dist,
+                "total_count": all_consolidations.height,
+                "avg_duration_days": summarise(consolidation_durations, "mean"),
+                "median_duration_days": summarise(
+                    consolidation_durations, "median"
+                ),
+                "max_duration_days": summarise(consolidation_durations, "max"),
+                "min_duration_days": summarise(consolidation_durations, "min"),
+                "avg_price_range_pct": summarise(
+                    all_consolidations["price_range_pct"], "mean"
+                ),
+                "duration_distribution": analyze_distribution(
+                    consolidation_durations, [5, 10, 15]
+                ),
             },
         }
 
     def display_momentum_bursts(
-        self, bursts: list[dict], console: Console
+        self, bursts: Results, console: Console
     ) -> None:
         """Display momentum bursts in a formatted table."""
-        if not bursts:
+        if not result_count(bursts):
             console.print("[yellow]No momentum bursts found[/yellow]")
             return
 
@@ -497,7 +948,7 @@ class MomentumScanner:
         table.add_column("End $", width=10)
         table.add_column("Vol Multiple", width=12)
 
-        for b in bursts:
+        for b in shown_rows(bursts):
             table.add_row(
                 b["ticker"],
                 b["start_date"].strftime("%Y-%m-%d"),
@@ -512,10 +963,10 @@ class MomentumScanner:
         console.print(table)
 
     def display_consolidations(
-        self, consolidations: list[dict], console: Console
+        self, consolidations: Results, console: Console
     ) -> None:
         """Display consolidations in a formatted table."""
-        if not consolidations:
+        if not result_count(consolidations):
             console.print("[yellow]No consolidations found[/yellow]")
             return
 
@@ -529,7 +980,7 @@ class MomentumScanner:
         table.add_column("High $", width=10)
         table.add_column("Vol Ratio", width=10)
 
-        for c in consolidations:
+        for c in shown_rows(consolidations):
             table.add_row(
                 c["ticker"],
                 c["start_date"].strftime("%Y-%m-%d"),
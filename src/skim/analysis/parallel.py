@@ -0,0 +1,27 @@
+"""
+Frame transport for process-pool workers.
+
+Frames travel to and from workers as uncompressed Arrow IPC bytes rather
+than pickled DataFrames.
+
+Universe-wide scans are not sharded across processes: each scanner is
+one Polars plan, already run on Polars' thread pool, and spawning workers
+and shipping every shard through IPC made them several times slower (see
+``python -m skim.analysis.bench``).
+"""
+
+import io
+
+import polars as pl
+
+
+def to_ipc_bytes(frame: pl.DataFrame) -> bytes:
+    """Serialize a frame to uncompressed Arrow IPC bytes."""
+    buffer = io.BytesIO()
+    frame.write_ipc(buffer, compression="uncompressed")
+    return buffer.getvalue()
+
+
+def from_ipc_bytes(payload: bytes) -> pl.DataFrame:
+    """Deserialize a frame written by ``to_ipc_bytes``."""
+    return pl.read_ipc(io.BytesIO(payload))
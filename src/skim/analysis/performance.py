@@ -2,12 +2,17 @@
 Performance calculation utilities for ranking stocks.
 """
 
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import date, datetime, time
 
+import polars as pl
 from rich.console import Console
 from rich.table import Table
 
+from skim.analysis.date_parser import parse_date_range
+from skim.analysis.results import Results, result_count, shown_rows
 from skim.analysis.stock_data import StockData
+from skim.analysis.universe import build_universe, filter_period
 
 
 class PerformanceCalculator:
@@ -15,49 +20,153 @@ class PerformanceCalculator:
 
     def __init__(self, stocks: dict[str, StockData]):
         self.stocks = stocks
+        self._universe: pl.DataFrame | None = None
+
+    @property
+    def universe(self) -> pl.DataFrame:
+        """Long OHLCV frame of all stocks, built on first use."""
+        if self._universe is None:
+            self._universe = build_universe(self.stocks)
+        return self._universe
 
     def find_top_performers(
         self,
         start_date: datetime,
         end_date: datetime,
-        limit: int = 20,
+        limit: int | None = 20,
         min_price: float = 0.20,
         min_volume: int = 50000,
-    ) -> list[dict]:
+    ) -> pl.DataFrame:
         """
         Find top performing stocks over a period.
 
+        Metrics for the whole universe are computed in a single group-by
+        over the period window, and only the top ``limit`` rows are sorted.
+
         Args:
             start_date: Start date for analysis
             end_date: End date for analysis
-            limit: Maximum number of results
+            limit: Maximum number of results (None for every stock)
             min_price: Minimum price filter
             min_volume: Minimum volume filter
 
         Returns:
-            List of dictionaries with performance data
+            DataFrame with one row per stock, best total return first
+        """
+        prev_close = pl.col("close").shift(1).over("ticker")
+        pct_change = (
+            pl.when(prev_close != 0)
+            .then((pl.col("close") - prev_close) / prev_close * 100)
+            .otherwise(None)
+        )
+
+        metrics = (
+            filter_period(self.universe.lazy(), start_date, end_date)
+            .with_columns(pct_change.alias("pct_change"))
+            .group_by("ticker")
+            .agg(
+                pl.col("close").first().alias("start_price"),
+                pl.col("close").last().alias("end_price"),
+                pl.col("volume").mean().fill_null(0.0).alias("avg_volume"),
+                pl.col("pct_change")
+                .std()
+                .fill_nan(None)
+                .fill_null(0.0)
+                .alias("volatility"),
+                pl.len().alias("days"),
+            )
+            .filter(
+                (pl.col("days") >= 2)
+                & (pl.col("end_price").is_not_null())
+                & (pl.col("start_price") > 0)
+                & (pl.col("start_price") >= min_price)
+                & (pl.col("avg_volume") >= min_volume)
+            )
+            .with_columns(
+                (
+                    (pl.col("end_price") - pl.col("start_price"))
+                    / pl.col("start_price")
+                    * 100
+                ).alias("total_return")
+            )
+            .select(
+                "ticker",
+                "total_return",
+                "start_price",
+                "end_price",
+                "avg_volume",
+                "volatility",
+                "days",
+            )
+            .collect()
+        )
+
+        if limit is not None:
+            metrics = metrics.top_k(limit, by="total_return")
+        return metrics.sort(
+            ["total_return", "ticker"], descending=[True, False]
+        )
+
+    def returns_matrix(
+        self,
+        tickers: Sequence[str] | None = None,
+        periods: Sequence[str] = ("1M", "3M", "6M", "1Y"),
+        reference_date: datetime | None = None,
+    ) -> pl.DataFrame:
         """
-        results = []
+        Build a tickers x periods table of percentage returns.
+
+        Each return is the difference of the cumulative log-return column
+        at the first and last bar of the period, so every period for every
+        ticker is resolved in a single group-by.
 
-        for _ticker, stock in self.stocks.items():
-            metrics = stock.calculate_returns_over_period(start_date, end_date)
+        Args:
+            tickers: Tickers to include (default: all loaded stocks)
+            periods: Period strings understood by parse_date_range
+            reference_date: Anchor for relative periods (default: latest bar)
 
-            if (
-                metrics
-                and metrics.get("total_return") is not None
-                and metrics["start_price"] >= min_price
-                and metrics["avg_volume"] >= min_volume
-            ):
-                results.append(metrics)
+        Returns:
+            DataFrame with a ticker column and one return column per period
+        """
+        frame = self.universe.lazy()
+        if tickers is not None:
+            frame = frame.filter(
+                pl.col("ticker").is_in([t.upper() for t in tickers])
+            )
+
+        if reference_date is None:
+            latest = self.universe["date"].max()
+            if not isinstance(latest, date):
+                return pl.DataFrame(
+                    schema={"ticker": pl.Utf8}
+                    | dict.fromkeys(periods, pl.Float64)
+                )
+            reference_date = datetime.combine(latest, time())
+
+        returns = []
+        for period in periods:
+            start_date, end_date = parse_date_range(period, reference_date)
+            in_window = (pl.col("date") >= start_date) & (
+                pl.col("date") <= end_date
+            )
+            cum_log_return = pl.col("cum_log_return").filter(in_window)
+            returns.append(
+                pl.when(in_window.sum() >= 2)
+                .then(
+                    (cum_log_return.last() - cum_log_return.first()).exp() - 1
+                )
+                .otherwise(None)
+                .mul(100)
+                .alias(period)
+            )
 
-        results.sort(key=lambda x: x["total_return"], reverse=True)
-        return results[:limit]
+        return frame.group_by("ticker").agg(returns).sort("ticker").collect()
 
     def display_top_performers(
-        self, results: list[dict], console: Console
+        self, results: Results, console: Console
     ) -> None:
         """Display top performers in a formatted table."""
-        if not results:
+        if not result_count(results):
             console.print("[yellow]No results found[/yellow]")
             return
 
@@ -69,7 +178,7 @@ class PerformanceCalculator:
         table.add_column("Avg Volume", width=12)
         table.add_column("Volatility %", width=12)
 
-        for r in results:
+        for r in shown_rows(results):
             table.add_row(
                 r["ticker"],
                 f"{r['total_return']:.2f}" if r["total_return"] else "N/A",
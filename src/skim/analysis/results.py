@@ -0,0 +1,55 @@
+"""
+Helpers for columnar scanner results.
+
+Scanners return Polars DataFrames; these helpers adapt them for callers
+that still expect lists of dictionaries and for the Rich renderers,
+which only materialise the rows they display.
+"""
+
+from collections.abc import Iterator
+
+import polars as pl
+
+Results = pl.DataFrame | list[dict]
+
+
+def to_records(results: Results) -> list[dict]:
+    """
+    Convert a result set to the legacy list-of-dictionaries form.
+
+    Args:
+        results: Scanner result frame (lists are returned unchanged)
+
+    Returns:
+        One dictionary per row, with list columns as Python lists
+    """
+    if isinstance(results, pl.DataFrame):
+        return results.to_dicts()
+    return results
+
+
+def result_count(results: Results) -> int:
+    """Number of rows in a result set."""
+    if isinstance(results, pl.DataFrame):
+        return results.height
+    return len(results)
+
+
+def shown_rows(results: Results, limit: int | None = None) -> Iterator[dict]:
+    """
+    Iterate over the first ``limit`` rows of a result set as dictionaries.
+
+    Only the displayed rows are converted to Python objects.
+
+    Args:
+        results: Scanner result frame or legacy list of dictionaries
+        limit: Maximum rows to yield (default: all)
+
+    Yields:
+        One dictionary per displayed row
+    """
+    if isinstance(results, pl.DataFrame):
+        frame = results if limit is None else results.head(limit)
+        yield from frame.iter_rows(named=True)
+    else:
+        yield from results[:limit]
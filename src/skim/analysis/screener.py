@@ -0,0 +1,332 @@
+"""
+Stock screens written in a small expression language.
+
+A screen is a list of conditions over named per-ticker features, e.g.::
+
+    return_3m > 30%, avg_volume_50d > 200k, max_gap_10d > 5%
+
+Conditions are joined with ``,`` or ``and``, combined with ``or`` and
+``not``, and grouped with parentheses. Either side of a comparison may
+be a feature or a number; numbers accept ``%``, ``k``, ``m`` and ``b``
+suffixes. Windowed features take a ``_<n><unit>`` suffix counted in
+trading bars: ``d`` (1), ``w`` (5), ``m`` (21) or ``y`` (252).
+
+The whole screen compiles to one Polars lazy query over the universe
+frame: each distinct feature is computed once per ticker in a single
+group-by, and only the trailing bars the screen needs are aggregated.
+"""
+
+import re
+from collections.abc import Callable
+from datetime import date, datetime
+
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+from skim.analysis.stock_data import StockData
+from skim.analysis.universe import build_universe
+
+WINDOW_UNITS = {"d": 1, "w": 5, "m": 21, "y": 252}
+
+NUMBER_SUFFIXES = {"%": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+COMPARISONS: dict[str, Callable[[pl.Expr, pl.Expr], pl.Expr]] = {
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+
+
+def _window_return(n: int) -> pl.Expr:
+    """Percent return over the last n bars, null with too little history."""
+    log_return = pl.col("cum_log_return")
+    return (
+        pl.when(pl.len() > n)
+        .then((log_return.last() - log_return.tail(n + 1).first()).exp() - 1)
+        .mul(100)
+    )
+
+
+# name -> (aggregation for a window of n bars, bars needed for that window)
+WINDOW_FEATURES: dict[str, tuple[Callable[[int], pl.Expr], int]] = {
+    "return": (_window_return, 1),
+    "avg_volume": (lambda n: pl.col("volume").tail(n).mean(), 0),
+    "max_gap": (lambda n: pl.col("gap_pct").tail(n).max(), 0),
+    "high": (lambda n: pl.col("high").tail(n).max(), 0),
+    "low": (lambda n: pl.col("low").tail(n).min(), 0),
+    "from_high": (
+        lambda n: (
+            (pl.col("close").last() / pl.col("high").tail(n).max() - 1) * 100
+        ),
+        0,
+    ),
+    "volatility": (lambda n: pl.col("pct_change").tail(n).std(), 0),
+    "up_days": (lambda n: (pl.col("pct_change").tail(n) > 0).sum(), 0),
+}
+
+LATEST_FEATURES: dict[str, pl.Expr] = {
+    "close": pl.col("close").last(),
+    "open": pl.col("open").last(),
+    "volume": pl.col("volume").last(),
+    "gap": pl.col("gap_pct").last(),
+    "change": pl.col("pct_change").last(),
+}
+
+TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<number>-?\d+(?:\.\d+)?(?:[%kKmMbB](?![A-Za-z0-9_]))?)"
+    r"|(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<op>>=|<=|==|!=|>|<)"
+    r"|(?P<punct>[(),]))"
+)
+WINDOW_PATTERN = re.compile(r"^(?P<base>[a-z_]+?)_(?P<n>\d+)(?P<unit>[dwmy])$")
+
+
+def _tokenize(expression: str) -> list[tuple[str, str]]:
+    """Split a screen into (kind, text) tokens."""
+    tokens = []
+    pos = 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        match = TOKEN_PATTERN.match(expression, pos)
+        if match is None or match.end() == pos or match.lastgroup is None:
+            raise ValueError(
+                f"Unexpected character {expression[pos:].strip()[:1]!r} "
+                f"at position {pos}"
+            )
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+def parse_feature(name: str) -> tuple[pl.Expr, int]:
+    """
+    Resolve a feature name to its per-ticker aggregation.
+
+    Args:
+        name: Feature name, e.g. "close" or "avg_volume_50d"
+
+    Returns:
+        Tuple of (aggregation expression, trailing bars required)
+
+    Raises:
+        ValueError: If the feature is unknown
+    """
+    name = name.lower()
+    if name in LATEST_FEATURES:
+        return LATEST_FEATURES[name], 1
+
+    match = WINDOW_PATTERN.match(name)
+    if match and match["base"] in WINDOW_FEATURES:
+        build, extra = WINDOW_FEATURES[match["base"]]
+        bars = int(match["n"]) * WINDOW_UNITS[match["unit"]]
+        if bars < 1:
+            raise ValueError(f"Window must be at least one bar: {name}")
+        return build(bars), bars + extra
+
+    known = sorted(LATEST_FEATURES) + [
+        f"{base}_<n>[dwmy]" for base in sorted(WINDOW_FEATURES)
+    ]
+    raise ValueError(f"Unknown feature '{name}'. Available: {', '.join(known)}")
+
+
+class Screen:
+    """A parsed screen: a predicate over named per-ticker features."""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.features: dict[str, pl.Expr] = {}
+        self.lookback = 1
+        self._tokens = _tokenize(expression)
+        self._pos = 0
+        if not self._tokens:
+            raise ValueError("Empty screen")
+        self.predicate = self._parse_or()
+        if self._pos != len(self._tokens):
+            raise ValueError(f"Unexpected '{self._tokens[self._pos][1]}'")
+        if not self.features:
+            raise ValueError("Screen must reference at least one feature")
+
+    def _peek(self) -> tuple[str, str] | None:
+        """Next token without consuming it, or None at the end."""
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos]
+        return None
+
+    def _take(self) -> tuple[str, str]:
+        """Consume and return the next token."""
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of screen")
+        self._pos += 1
+        return token
+
+    def _accept(self, *values: str) -> bool:
+        """Consume the next token if it is one of the given keywords."""
+        token = self._peek()
+        if token is not None and token[1].lower() in values:
+            self._pos += 1
+            return True
+        return False
+
+    def _parse_or(self) -> pl.Expr:
+        """Parse conditions joined with ``or``."""
+        expr = self._parse_and()
+        while self._accept("or"):
+            expr = expr | self._parse_and()
+        return expr
+
+    def _parse_and(self) -> pl.Expr:
+        """Parse conditions joined with ``and`` or ``,``."""
+        expr = self._parse_not()
+        while self._accept("and", ","):
+            expr = expr & self._parse_not()
+        return expr
+
+    def _parse_not(self) -> pl.Expr:
+        """Parse a negated, parenthesised or single condition."""
+        if self._accept("not"):
+            return ~self._parse_not()
+        if self._accept("("):
+            expr = self._parse_or()
+            if not self._accept(")"):
+                raise ValueError("Missing closing parenthesis")
+            return expr
+        return self._parse_comparison()
+
+    def _parse_comparison(self) -> pl.Expr:
+        """Parse ``operand <op> operand``."""
+        left = self._parse_operand()
+        kind, op = self._take()
+        if kind != "op":
+            raise ValueError(f"Expected a comparison, got '{op}'")
+        return COMPARISONS[op](left, self._parse_operand())
+
+    def _parse_operand(self) -> pl.Expr:
+        """Parse a feature name or number, registering any new feature."""
+        kind, value = self._take()
+        if kind == "number":
+            suffix = value[-1].lower()
+            if suffix in NUMBER_SUFFIXES:
+                return pl.lit(float(value[:-1]) * NUMBER_SUFFIXES[suffix])
+            return pl.lit(float(value))
+        if kind == "name":
+            name = value.lower()
+            if name not in self.features:
+                expr, bars = parse_feature(name)
+                self.features[name] = expr.alias(name)
+                self.lookback = max(self.lookback, bars)
+            return pl.col(name)
+        raise ValueError(f"Expected a feature or number, got '{value}'")
+
+    def plan(
+        self,
+        universe: pl.DataFrame | pl.LazyFrame,
+        as_of: date | datetime | None = None,
+    ) -> pl.LazyFrame:
+        """
+        Compile the screen to a lazy query over a universe frame.
+
+        Args:
+            universe: Long OHLCV frame grouped by ticker and sorted by date
+            as_of: Evaluate features as of this date (default: latest bar)
+
+        Returns:
+            LazyFrame of matching tickers with one column per feature
+        """
+        frame = universe.lazy()
+        if as_of is not None:
+            frame = frame.filter(pl.col("date") <= as_of)
+
+        prev_close = pl.col("close").shift(1).over("ticker")
+        bar = pl.int_range(pl.len()).over("ticker")
+        return (
+            frame.with_columns(
+                pl.when(prev_close > 0)
+                .then((pl.col("close") - prev_close) / prev_close * 100)
+                .alias("pct_change"),
+                pl.when(prev_close > 0)
+                .then((pl.col("open") - prev_close) / prev_close * 100)
+                .alias("gap_pct"),
+            )
+            .filter(bar >= pl.len().over("ticker") - self.lookback)
+            .group_by("ticker")
+            .agg(pl.col("date").last(), *self.features.values())
+            .filter(self.predicate)
+        )
+
+
+class Screener:
+    """Runs expression screens across all loaded stocks."""
+
+    def __init__(self, stocks: dict[str, StockData]):
+        self.stocks = stocks
+        self._universe: pl.DataFrame | None = None
+
+    @property
+    def universe(self) -> pl.DataFrame:
+        """Long OHLCV frame of all stocks, built on first use."""
+        if self._universe is None:
+            self._universe = build_universe(self.stocks)
+        return self._universe
+
+    def screen(
+        self,
+        expression: str,
+        as_of: date | datetime | None = None,
+        limit: int | None = None,
+    ) -> pl.DataFrame:
+        """
+        Find stocks matching a screen expression.
+
+        Args:
+            expression: Screen, e.g. "return_3m > 30%, avg_volume_50d > 200k"
+            as_of: Evaluate features as of this date (default: latest bar)
+            limit: Maximum number of results
+
+        Returns:
+            DataFrame of matching tickers and the features the screen uses,
+            ordered by the first feature (highest first)
+
+        Raises:
+            ValueError: If the expression cannot be parsed
+        """
+        screen = Screen(expression)
+        first = next(iter(screen.features))
+        result = (
+            screen.plan(self.universe, as_of)
+            .sort([first, "ticker"], descending=[True, False], nulls_last=True)
+            .collect()
+        )
+        return result if limit is None else result.head(limit)
+
+    def display_results(
+        self, results: pl.DataFrame, console: Console, limit: int = 50
+    ) -> None:
+        """Display screen results in a formatted table."""
+        if results.is_empty():
+            console.print("[yellow]No stocks match the screen[/yellow]")
+            return
+
+        table = Table(title=f"Screen Results ({results.height} matches)")
+        table.add_column("Ticker", style="cyan", width=8)
+        table.add_column("Date", width=12)
+        features = [c for c in results.columns if c not in ("ticker", "date")]
+        for name in features:
+            table.add_column(name, justify="right")
+
+        for row in results.head(limit).iter_rows(named=True):
+            table.add_row(
+                row["ticker"],
+                row["date"].strftime("%Y-%m-%d"),
+                *(
+                    "N/A" if row[name] is None else f"{row[name]:,.2f}"
+                    for name in features
+                ),
+            )
+
+        console.print(table)
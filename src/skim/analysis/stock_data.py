@@ -2,11 +2,67 @@
 Stock data model for representing ASX stock price history.
 """
 
-import statistics
-from datetime import datetime
+import math
+from datetime import date, datetime
 
 import polars as pl
 
+CSV_COLUMNS = [
+    "ticker",
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+]
+
+CUMULATIVE_COLUMNS = ["cum_log_return", "cum_volume", "cum_traded_days"]
+
+
+def with_cumulative_columns(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Append cumulative log-return, volume and traded-day columns.
+
+    The return between any two rows is then
+    ``exp(cum_log_return[end] - cum_log_return[start]) - 1`` and the volume
+    traded over rows ``start..end`` is
+    ``cum_volume[end] - cum_volume[start] + volume[start]``; days with a
+    volume are counted the same way from ``cum_traded_days``. Missing or
+    non-positive closes are carried forward from the last valid close and
+    missing volumes add nothing to the running totals.
+
+    Args:
+        df: OHLCV frame for a single stock, sorted by date
+
+    Returns:
+        DataFrame with cum_log_return, cum_volume and cum_traded_days
+        columns added
+    """
+    valid_close = (
+        pl.when(pl.col("close") > 0).then(pl.col("close")).forward_fill()
+    )
+    log_return = (valid_close / valid_close.shift(1)).log().fill_null(0.0)
+
+    return df.with_columns(
+        log_return.cum_sum().alias("cum_log_return"),
+        pl.col("volume")
+        .fill_null(0)
+        .cum_sum()
+        .cast(pl.Int64)
+        .alias("cum_volume"),
+        pl.col("volume")
+        .is_not_null()
+        .cum_sum()
+        .cast(pl.Int64)
+        .alias("cum_traded_days"),
+    )
+
+
+def _as_date(value: date | datetime) -> date:
+    """Normalise a datetime boundary to a calendar date."""
+    return value.date() if isinstance(value, datetime) else value
+
 
 class StockData:
     """Represents a single stock with OHLCV data."""
@@ -22,46 +78,91 @@ class StockData:
         Expected format: Ticker,Date,Open,High,Low,Close,Volume
         Date format: DD/MM/YYYY
         """
-        df = pl.read_csv(
-            filepath,
-            has_header=False,
-            new_columns=[
-                "ticker",
-                "date",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-            ],
-        )
+        df = pl.read_csv(filepath, has_header=False, new_columns=CSV_COLUMNS)
 
         df = df.with_columns(pl.col("date").str.strptime(pl.Date, "%d/%m/%Y"))
         df = df.sort("date").unique(subset=["date"], maintain_order=True)
 
-        self.df = df
+        self.df = with_cumulative_columns(df)
+
+    def ensure_cumulative_columns(self) -> pl.DataFrame:
+        """Return the price frame, adding cumulative columns if missing."""
+        if self.df is None:
+            raise ValueError(f"No price data loaded for {self.ticker}")
+        if not set(CUMULATIVE_COLUMNS).issubset(self.df.columns):
+            self.df = with_cumulative_columns(self.df)
+        return self.df
+
+    def window_bounds(
+        self, start_date: date | datetime, end_date: date | datetime
+    ) -> tuple[int, int] | None:
+        """
+        Locate the first and last row indices inside a date window.
+
+        Args:
+            start_date: Start of the window (inclusive)
+            end_date: End of the window (inclusive)
+
+        Returns:
+            Tuple of (start_index, end_index), or None if the window is empty
+        """
+        if self.df is None:
+            return None
+
+        dates = self.df["date"]
+        start_idx = dates.search_sorted(_as_date(start_date), side="left")
+        end_idx = dates.search_sorted(_as_date(end_date), side="right") - 1
+
+        if end_idx < start_idx:
+            return None
+        return int(start_idx), int(end_idx)
 
     def calculate_return(
         self, start_date: datetime, end_date: datetime
     ) -> float | None:
         """Calculate percentage return between two dates."""
-        if self.df is None:
+        bounds = self.window_bounds(start_date, end_date)
+        if bounds is None or bounds[1] - bounds[0] < 1:
             return None
 
-        period_df = self.df.filter(
-            (pl.col("date") >= start_date) & (pl.col("date") <= end_date)
-        )
+        return self._window_return(*bounds)
+
+    def _window_return(self, start_idx: int, end_idx: int) -> float | None:
+        """Percentage return between two row indices from cumulative logs."""
+        df = self.ensure_cumulative_columns()
+        start_price = df["close"][start_idx]
+        end_price = df["close"][end_idx]
 
-        if len(period_df) < 2:
+        if start_price is None or end_price is None or start_price <= 0:
             return None
+        if end_price <= 0:
+            return ((end_price - start_price) / start_price) * 100
 
-        start_price = period_df["close"][0]
-        end_price = period_df["close"][-1]
+        cum_log_return = df["cum_log_return"]
+        log_change = cum_log_return[end_idx] - cum_log_return[start_idx]
+        return math.expm1(log_change) * 100
 
-        if start_price is None or end_price is None or start_price == 0:
-            return None
+    def _window_avg_volume(self, start_idx: int, end_idx: int) -> float:
+        """
+        Average daily volume between two row indices from cumulative sums.
 
-        return ((end_price - start_price) / start_price) * 100
+        Like ``mean()``, days without a volume are left out of the average.
+        """
+        df = self.ensure_cumulative_columns()
+        first_volume = df["volume"][start_idx]
+        cum_traded_days = df["cum_traded_days"]
+        traded_days = (
+            cum_traded_days[end_idx]
+            - cum_traded_days[start_idx]
+            + (first_volume is not None)
+        )
+        if traded_days == 0:
+            return 0.0
+        cum_volume = df["cum_volume"]
+        total = (
+            cum_volume[end_idx] - cum_volume[start_idx] + (first_volume or 0)
+        )
+        return total / traded_days
 
     def get_price(self, date: datetime) -> float | None:
         """Get closing price on a specific date."""
@@ -76,21 +177,15 @@ class StockData:
         self, start_date: datetime, end_date: datetime
     ) -> dict:
         """Calculate various return metrics over a period."""
-        if self.df is None:
+        bounds = self.window_bounds(start_date, end_date)
+        if bounds is None or bounds[1] - bounds[0] < 1:
             return {}
 
-        period_df = self.df.filter(
-            (pl.col("date") >= start_date) & (pl.col("date") <= end_date)
-        )
-
-        if len(period_df) < 2:
-            return {}
+        start_idx, end_idx = bounds
+        df = self.ensure_cumulative_columns()
 
-        close_prices = period_df["close"].to_list()
-        volumes = period_df["volume"].to_list()
-
-        start_price_val = close_prices[0]
-        end_price_val = close_prices[-1]
+        start_price_val = df["close"][start_idx]
+        end_price_val = df["close"][end_idx]
 
         if start_price_val is None or end_price_val is None:
             return {}
@@ -101,56 +196,29 @@ class StockData:
         except (TypeError, ValueError):
             return {}
 
-        total_return = (
-            ((end_price - start_price) / start_price) * 100
-            if start_price > 0
-            else None
-        )
-
-        try:
-            avg_volume = (
-                sum(v for v in volumes if v is not None)
-                / len([v for v in volumes if v is not None])
-                if volumes
-                else 0.0
+        days = end_idx - start_idx + 1
+        prev_close = pl.col("close").shift(1)
+        volatility = (
+            df.slice(start_idx, days)
+            .select(
+                pl.when(prev_close != 0)
+                .then((pl.col("close") - prev_close) / prev_close * 100)
+                .otherwise(None)
+                .std()
             )
-        except (ZeroDivisionError, TypeError):
-            avg_volume = 0.0
-
-        if len(close_prices) > 1:
-            pct_changes = []
-            for i in range(1, len(close_prices)):
-                if (
-                    close_prices[i] is not None
-                    and close_prices[i - 1] is not None
-                    and close_prices[i - 1] != 0
-                ):
-                    pct_changes.append(
-                        (
-                            (close_prices[i] - close_prices[i - 1])
-                            / close_prices[i - 1]
-                        )
-                        * 100
-                    )
-
-            if len(pct_changes) > 1:
-                try:
-                    volatility = statistics.stdev(pct_changes)
-                except statistics.StatisticsError:
-                    volatility = 0.0
-            else:
-                volatility = 0.0
-        else:
-            volatility = 0.0
+            .item()
+        )
 
         return {
             "ticker": self.ticker,
-            "total_return": total_return,
+            "total_return": self._window_return(start_idx, end_idx),
             "start_price": start_price,
             "end_price": end_price,
-            "avg_volume": avg_volume,
-            "volatility": volatility,
-            "days": len(period_df),
+            "avg_volume": self._window_avg_volume(start_idx, end_idx),
+            "volatility": volatility
+            if volatility is not None and not math.isnan(volatility)
+            else 0.0,
+            "days": days,
         }
 
     def filter_by_criteria(
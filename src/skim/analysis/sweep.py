@@ -0,0 +1,516 @@
+"""
+Parameter sweeps of the gap breakout strategy's scanner and history filters.
+
+Every qualifying trade at the loosest gap threshold in the sweep is
+simulated once with ``simulate_trades``, together with the features the
+filters test at entry (gap size, open, prior-day volume, and the 3- and
+6-month return and average volume ``HistoricalDataService`` reports as
+of the prior bar). Each parameter point is then only a filter and an
+aggregation over that shared candidate table, so points are cheap and
+are fanned out across worker processes in chunks.
+
+Results go to a Parquet file, rewritten after every completed chunk. A
+rerun with the same period and exit settings skips points already in the
+file, so an interrupted sweep resumes where it stopped.
+"""
+
+import itertools
+import json
+import multiprocessing
+import os
+import random
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+from skim.analysis.backtest import FALLBACK_STOP_PCT, simulate_trades
+from skim.analysis.parallel import from_ipc_bytes, to_ipc_bytes
+from skim.trading.core.config import HistoricalConfig, ScannerConfig
+
+DEFAULT_SWEEP_PATH = Path("data/processed/sweep.parquet")
+
+# Sweepable parameters: the scanner thresholds and the history filter bounds
+SCANNER_PARAMETERS = ("gap_threshold", "price_filter", "volume_filter")
+HISTORY_PARAMETERS = (
+    "min_3month_return",
+    "max_3month_return",
+    "min_6month_return",
+    "min_avg_volume",
+)
+PARAMETERS: dict[str, type] = {
+    "gap_threshold": float,
+    "price_filter": float,
+    "volume_filter": int,
+    "min_3month_return": float,
+    "max_3month_return": float,
+    "min_6month_return": float,
+    "min_avg_volume": int,
+}
+
+# Calendar-day lookbacks of HistoricalDataRepository's 3- and 6-month figures
+LOOKBACK_DAYS = {"3m": 90, "6m": 180}
+
+# Days-since-epoch range per ticker in the (ticker, date) search key
+BAR_KEY_STRIDE = 1_000_000
+
+POINTS_PER_CHUNK = 50
+
+Point = dict[str, float | int | None]
+
+
+def parse_parameter(spec: str) -> tuple[str, list | tuple]:
+    """
+    Parse a ``name=values`` sweep specification.
+
+    Values are either a comma-separated list (``gap_threshold=5,9,15``),
+    an inclusive stepped range (``gap_threshold=5:20:5``) or, for random
+    search only, a continuous range (``min_3month_return=-20:50``).
+
+    Args:
+        spec: Parameter specification
+
+    Returns:
+        Tuple of (name, list of values) or (name, (low, high)) for a
+        continuous range
+
+    Raises:
+        ValueError: If the name or values are invalid
+    """
+    name, sep, values = spec.partition("=")
+    name = name.strip()
+    if not sep or not values.strip():
+        raise ValueError(f"Expected name=values, got '{spec}'")
+    if name not in PARAMETERS:
+        raise ValueError(
+            f"Unknown parameter '{name}'. Available: {', '.join(PARAMETERS)}"
+        )
+    cast = PARAMETERS[name]
+
+    try:
+        if ":" in values:
+            parts = [float(v) for v in values.split(":")]
+            if len(parts) == 2:
+                return name, (parts[0], parts[1])
+            if len(parts) != 3 or parts[2] <= 0:
+                raise ValueError
+            low, high, step = parts
+            count = int(round((high - low) / step)) + 1
+            return name, [cast(low + i * step) for i in range(count)]
+        return name, [cast(float(v)) for v in values.split(",")]
+    except ValueError:
+        raise ValueError(f"Invalid values for {name}: '{values}'") from None
+
+
+def default_point() -> Point:
+    """Parameter point of the live strategy's default configuration."""
+    scanner, history = ScannerConfig(), HistoricalConfig()
+    return {
+        **{name: getattr(scanner, name) for name in SCANNER_PARAMETERS},
+        **{name: getattr(history, name) for name in HISTORY_PARAMETERS},
+    }
+
+
+def grid_points(specs: dict[str, list | tuple]) -> list[Point]:
+    """
+    Every combination of the listed parameter values.
+
+    Raises:
+        ValueError: If a parameter is given as a continuous range
+    """
+    for name, values in specs.items():
+        if isinstance(values, tuple):
+            raise ValueError(
+                f"{name} needs a list or a stepped range (low:high:step) "
+                "for a grid sweep"
+            )
+    base = default_point()
+    return [
+        {**base, **dict(zip(specs, combo, strict=True))}
+        for combo in itertools.product(*specs.values())
+    ]
+
+
+def random_points(
+    specs: dict[str, list | tuple], count: int, seed: int = 0
+) -> list[Point]:
+    """Random parameter points drawn from lists or continuous ranges."""
+    rng = random.Random(seed)
+    base = default_point()
+    points = []
+    for _ in range(count):
+        point = dict(base)
+        for name, values in specs.items():
+            if isinstance(values, tuple):
+                value = rng.uniform(*values)
+                point[name] = (
+                    int(value) if PARAMETERS[name] is int else round(value, 4)
+                )
+            else:
+                point[name] = rng.choice(values)
+        points.append(point)
+    return points
+
+
+def point_key(point: Point, settings: dict) -> str:
+    """Canonical identity of a point under a sweep's period and exits."""
+    return json.dumps({**point, **settings}, sort_keys=True, default=str)
+
+
+def _lookback_features(
+    frame: pl.DataFrame, entries: pl.DataFrame, label: str, days: int
+) -> pl.DataFrame:
+    """
+    Return and average volume from ``days`` before the prior bar.
+
+    The window starts at the ticker's first bar on or after the lookback
+    date, found by a binary search over a (ticker, date) key that is
+    sorted because the frame is grouped by ticker and sorted by date.
+    """
+    start_rows = frame["bar_key"].search_sorted(
+        entries["ticker_id"] * BAR_KEY_STRIDE
+        + (entries["prev_date"] - timedelta(days=days)).dt.epoch("d"),
+        side="left",
+    )
+    prev_rows = entries["prev_row"]
+    close, volume = frame["close"], frame["cum_volume"]
+    bars = prev_rows - start_rows + 1
+    return entries.select("ticker", "prev_row").with_columns(
+        pl.when(bars >= 2)
+        .then((close.gather(prev_rows) / close.gather(start_rows) - 1) * 100)
+        .alias(f"return_{label}"),
+        pl.when(bars >= 2)
+        .then(
+            (
+                volume.gather(prev_rows)
+                - volume.gather(start_rows)
+                + frame["volume"].gather(start_rows)
+            )
+            // bars
+        )
+        .alias(f"avg_volume_{label}"),
+    )
+
+
+def prepare_candidates(
+    universe: pl.DataFrame,
+    start_date: date | datetime,
+    end_date: date | datetime,
+    min_gap: float,
+    stop_pct: float = FALLBACK_STOP_PCT,
+    max_hold_days: int | None = None,
+) -> pl.DataFrame:
+    """
+    Simulate every trade any point could take, with its filter features.
+
+    Args:
+        universe: Long OHLCV frame grouped by ticker and sorted by date
+        start_date: First date an entry may occur on
+        end_date: Last date of the simulation
+        min_gap: Lowest gap threshold in the sweep
+        stop_pct: Stop distance below entry
+        max_hold_days: Exit after this many bars (default: hold to stop)
+
+    Returns:
+        Trades from ``simulate_trades`` with open, prev_volume and the
+        3- and 6-month return and average volume columns
+    """
+    trades = simulate_trades(
+        universe,
+        start_date,
+        end_date,
+        gap_threshold=min_gap,
+        min_price=0.0,
+        min_volume=0,
+        stop_pct=stop_pct,
+        max_hold_days=max_hold_days,
+    )
+    frame = universe.select(
+        "ticker", "date", "open", "close", "volume", "cum_volume"
+    ).with_row_index("row")
+    ticker_id = pl.col("ticker").rle_id().cast(pl.Int64)
+    frame = frame.with_columns(
+        ticker_id.alias("ticker_id"),
+        (ticker_id * BAR_KEY_STRIDE + pl.col("date").dt.epoch("d")).alias(
+            "bar_key"
+        ),
+    )
+
+    entries = (
+        trades.select("ticker", "entry_date")
+        .join(
+            frame.select(
+                "ticker", pl.col("date").alias("entry_date"), "row", "ticker_id"
+            ),
+            on=["ticker", "entry_date"],
+        )
+        .with_columns((pl.col("row") - 1).alias("prev_row"))
+    )
+    entries = entries.with_columns(
+        frame["open"].gather(entries["row"]).alias("open"),
+        frame["date"].gather(entries["prev_row"]).alias("prev_date"),
+        frame["volume"].gather(entries["prev_row"]).alias("prev_volume"),
+    )
+    for label, days in LOOKBACK_DAYS.items():
+        entries = entries.join(
+            _lookback_features(frame, entries, label, days),
+            on=["ticker", "prev_row"],
+        )
+
+    return trades.join(
+        entries.drop("row", "prev_row", "prev_date", "ticker_id"),
+        on=["ticker", "entry_date"],
+        maintain_order="left",
+    )
+
+
+def evaluate_point(candidates: pl.DataFrame, point: Point) -> dict:
+    """
+    Filter the shared candidates to one point's trades and score them.
+
+    History bounds follow ``HistoricalDataService.filter_by_performance``
+    with 3-month data required: when any bound is set, trades without a
+    3-month history are dropped, and the volume bound uses the 3-month
+    average.
+
+    Args:
+        candidates: Output of ``prepare_candidates``
+        point: Parameter values
+
+    Returns:
+        Dictionary of trade count, win rate, total and average return,
+        profit factor and realized max drawdown
+    """
+    predicate = (
+        (pl.col("gap_percent") >= point["gap_threshold"])
+        & (pl.col("open") >= point["price_filter"])
+        & (pl.col("prev_volume") >= point["volume_filter"])
+    )
+    if any(point[name] is not None for name in HISTORY_PARAMETERS):
+        predicate &= pl.col("return_3m").is_not_null()
+        bounds = {
+            "min_3month_return": pl.col("return_3m").__ge__,
+            "max_3month_return": pl.col("return_3m").__le__,
+            "min_6month_return": (
+                lambda v: (
+                    pl.col("return_6m").is_null() | (pl.col("return_6m") >= v)
+                )
+            ),
+            "min_avg_volume": pl.col("avg_volume_3m").__ge__,
+        }
+        for name, bound in bounds.items():
+            if point[name] is not None:
+                predicate &= bound(point[name])
+
+    pnl = pl.col("pnl")
+    realized = pnl.sort_by("exit_date").cum_sum()
+    stats = (
+        candidates.lazy()
+        .filter(predicate)
+        .select(
+            pl.len().alias("trades"),
+            ((pnl > 0).mean() * 100).fill_null(0.0).alias("win_rate"),
+            pnl.sum().alias("total_pnl"),
+            pl.col("return_pct").mean().fill_null(0.0).alias("avg_return_pct"),
+            pl.when((pnl < 0).any())
+            .then(pnl.filter(pnl > 0).sum() / -pnl.filter(pnl < 0).sum())
+            .alias("profit_factor"),
+            (realized - realized.cum_max().clip(lower_bound=0))
+            .min()
+            .clip(upper_bound=0)
+            .fill_null(0.0)
+            .alias("max_drawdown"),
+        )
+        .collect()
+    )
+    return stats.row(0, named=True)
+
+
+_worker_candidates: pl.DataFrame | None = None
+
+
+def _init_worker(payload: bytes) -> None:
+    """Worker initializer: keep the shared candidates for every chunk."""
+    global _worker_candidates
+    _worker_candidates = from_ipc_bytes(payload)
+
+
+def _evaluate_chunk(points: list[Point]) -> list[dict]:
+    """Worker entry point: score a chunk of points."""
+    candidates = _worker_candidates
+    if candidates is None:
+        raise RuntimeError("Sweep worker was not initialised with candidates")
+    return [{**point, **evaluate_point(candidates, point)} for point in points]
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _write_results(path: Path, rows: pl.DataFrame) -> None:
+    """Atomically replace the results file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    rows.write_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def run_sweep(
+    universe: pl.DataFrame,
+    points: list[Point],
+    start_date: date | datetime,
+    end_date: date | datetime,
+    out_path: Path = DEFAULT_SWEEP_PATH,
+    workers: int = 1,
+    stop_pct: float = FALLBACK_STOP_PCT,
+    max_hold_days: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> pl.DataFrame:
+    """
+    Evaluate parameter points, resuming from any earlier results file.
+
+    Args:
+        universe: Long OHLCV frame grouped by ticker and sorted by date
+        points: Parameter points to evaluate
+        start_date: First date an entry may occur on
+        end_date: Last date of the simulation
+        out_path: Parquet results file, read on start and rewritten after
+            every completed chunk
+        workers: Worker processes; 1 evaluates in-process
+        stop_pct: Stop distance below entry
+        max_hold_days: Exit after this many bars (default: hold to stop)
+        progress: Optional callback receiving (points_done, points_total)
+
+    Returns:
+        DataFrame of every result in the file for these settings, one row
+        per point with its parameters, metrics and key, best total P&L
+        first
+    """
+    settings = {
+        "start_date": str(start_date)[:10],
+        "end_date": str(end_date)[:10],
+        "stop_pct": stop_pct,
+        "max_hold_days": max_hold_days,
+    }
+    existing = pl.read_parquet(out_path) if out_path.exists() else None
+    done = set() if existing is None else set(existing["key"])
+
+    keyed = {point_key(p, settings): p for p in points}
+    pending = [{**p, "key": k} for k, p in keyed.items() if k not in done]
+    total = len(keyed)
+    finished = total - len(pending)
+    results = [] if existing is None else [existing]
+
+    def record(rows: list[dict]) -> None:
+        nonlocal finished
+        frame = pl.DataFrame(rows, schema=_result_schema(rows[0]))
+        results.append(
+            frame.with_columns(
+                pl.lit(settings["start_date"]).alias("start_date"),
+                pl.lit(settings["end_date"]).alias("end_date"),
+                pl.lit(stop_pct).alias("stop_pct"),
+                pl.lit(max_hold_days, pl.Int64).alias("max_hold_days"),
+            )
+        )
+        _write_results(out_path, pl.concat(results, how="diagonal_relaxed"))
+        finished += len(rows)
+        if progress is not None:
+            progress(finished, total)
+
+    if pending:
+        candidates = prepare_candidates(
+            universe,
+            start_date,
+            end_date,
+            min(p["gap_threshold"] for p in pending),
+            stop_pct,
+            max_hold_days,
+        )
+        chunks = list(_chunks(pending, POINTS_PER_CHUNK))
+        if workers <= 1 or len(chunks) == 1:
+            _init_worker(to_ipc_bytes(candidates))
+            for chunk in chunks:
+                record(_evaluate_chunk(chunk))
+        else:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(to_ipc_bytes(candidates),),
+            ) as pool:
+                futures = [
+                    pool.submit(_evaluate_chunk, chunk) for chunk in chunks
+                ]
+                for future in as_completed(futures):
+                    record(future.result())
+
+    if not results:
+        return pl.DataFrame()
+    return (
+        pl.concat(results, how="diagonal_relaxed")
+        .filter(pl.col("key").is_in(list(keyed)))
+        .sort("total_pnl", descending=True, nulls_last=True)
+    )
+
+
+def _result_schema(row: dict) -> dict:
+    """Stable column types, so chunks with all-null bounds still concat."""
+    schema = {}
+    for name in row:
+        if name in PARAMETERS:
+            schema[name] = pl.Int64 if PARAMETERS[name] is int else pl.Float64
+        elif name == "key":
+            schema[name] = pl.Utf8
+        elif name == "trades":
+            schema[name] = pl.Int64
+        else:
+            schema[name] = pl.Float64
+    return schema
+
+
+def display_results(
+    results: pl.DataFrame, console: Console, limit: int = 20
+) -> None:
+    """Display the best sweep points in a formatted table."""
+    if results.is_empty():
+        console.print("[yellow]No sweep results[/yellow]")
+        return
+
+    swept = [
+        name
+        for name in PARAMETERS
+        if name in results.columns and results[name].n_unique() > 1
+    ] or list(SCANNER_PARAMETERS)
+
+    table = Table(
+        title=f"Sweep Results (top {min(limit, results.height)} "
+        f"of {results.height} points by total P&L)"
+    )
+    for name in swept:
+        table.add_column(name, justify="right")
+    table.add_column("Trades", justify="right")
+    table.add_column("Win %", justify="right")
+    table.add_column("Avg %", justify="right")
+    table.add_column("P&L", justify="right")
+    table.add_column("PF", justify="right")
+    table.add_column("Max DD", justify="right")
+
+    for row in results.head(limit).iter_rows(named=True):
+        pf = row["profit_factor"]
+        table.add_row(
+            *("-" if row[name] is None else f"{row[name]:g}" for name in swept),
+            f"{row['trades']:,}",
+            f"{row['win_rate']:.1f}",
+            f"{row['avg_return_pct']:.2f}",
+            f"{row['total_pnl']:,.0f}",
+            "N/A" if pf is None else f"{pf:.2f}",
+            f"{row['max_drawdown']:,.0f}",
+        )
+
+    console.print(table)
@@ -0,0 +1,132 @@
+"""
+Universe frame helpers for cross-sectional analysis across all loaded stocks.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import overload
+
+import polars as pl
+import pyarrow as pa
+
+from skim.analysis.stock_data import StockData
+
+UNIVERSE_SCHEMA = {
+    "ticker": pl.Utf8,
+    "date": pl.Date,
+    "open": pl.Float64,
+    "high": pl.Float64,
+    "low": pl.Float64,
+    "close": pl.Float64,
+    "volume": pl.Int64,
+    "cum_log_return": pl.Float64,
+    "cum_volume": pl.Int64,
+    "cum_traded_days": pl.Int64,
+}
+
+SHARED_FILENAME = "skim-universe.arrow"
+
+
+def default_shared_path() -> Path:
+    """Location of the published universe, preferring shared memory."""
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    return base / SHARED_FILENAME
+
+
+def publish_universe(frame: pl.DataFrame, path: Path) -> None:
+    """
+    Atomically write a universe frame as an uncompressed Arrow IPC file.
+
+    The frame is written to a sibling temporary file and renamed into
+    place, so attached readers keep their existing mapping while a new
+    version is published.
+
+    Args:
+        frame: Universe frame sorted by ticker then date
+        path: Destination path of the shared file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    frame.write_ipc(tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+
+def attach_universe(path: Path) -> pl.DataFrame:
+    """
+    Memory-map a published universe.
+
+    Numeric columns stay backed by the mapped file. String columns, such
+    as the ticker, are converted to Polars' string layout, which copies
+    them into process memory.
+
+    Args:
+        path: Path of the shared Arrow IPC file
+
+    Returns:
+        Universe frame backed by the memory-mapped file
+
+    Raises:
+        FileNotFoundError: If no dataset server has published the file
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"No shared dataset published at {path}")
+
+    source = pa.memory_map(str(path), "r")
+    table = pa.ipc.open_file(source).read_all()
+    return pl.DataFrame(pl.from_arrow(table, rechunk=False))
+
+
+def build_universe(stocks: dict[str, StockData]) -> pl.DataFrame:
+    """
+    Stack every loaded stock into a single long OHLCV frame.
+
+    Rows are grouped by ticker and ordered by date within each ticker, so
+    window expressions partitioned with ``.over("ticker")`` see each
+    stock's history in chronological order.
+
+    Args:
+        stocks: Dictionary mapping ticker -> StockData
+
+    Returns:
+        DataFrame with OHLCV and cumulative return/volume columns
+    """
+    frames = [
+        stock.ensure_cumulative_columns().select(
+            pl.lit(ticker).alias("ticker"),
+            *[
+                pl.col(name).cast(dtype)
+                for name, dtype in UNIVERSE_SCHEMA.items()
+                if name != "ticker"
+            ],
+        )
+        for ticker, stock in stocks.items()
+        if stock.df is not None
+    ]
+
+    if not frames:
+        return pl.DataFrame(schema=UNIVERSE_SCHEMA)
+
+    return pl.concat(frames, how="vertical", rechunk=True)
+
+
+@overload
+def filter_period(
+    frame: pl.DataFrame, start_date, end_date
+) -> pl.DataFrame: ...
+
+
+@overload
+def filter_period(
+    frame: pl.LazyFrame, start_date, end_date
+) -> pl.LazyFrame: ...
+
+
+def filter_period(
+    frame: pl.DataFrame | pl.LazyFrame, start_date, end_date
+) -> pl.DataFrame | pl.LazyFrame:
+    """Restrict a universe frame to rows between two dates (inclusive)."""
+    return frame.filter(
+        (pl.col("date") >= start_date) & (pl.col("date") <= end_date)
+    )
@@ -52,6 +52,7 @@ class NewsCandidate(Candidate):
     headline: str = field(default=_UNSET)
     announcement_type: str = field(default="pricesens")
     announcement_timestamp: datetime | None = field(default=None)
+    summary: str | None = field(default=None)
 
     def __post_init__(self):
         if self.strategy_name == "":
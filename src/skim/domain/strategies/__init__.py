@@ -1,6 +1,6 @@
 """Domain strategy abstractions and implementations"""
 
-from skim.domain.strategies.base import Strategy
+from skim.domain.strategies.base import Strategy, shutdown_strategies
 from skim.domain.strategies.context import StrategyContext
 from skim.domain.strategies.registry import StrategyRegistry, register_strategy
 
@@ -9,4 +9,5 @@ __all__ = [
     "StrategyContext",
     "StrategyRegistry",
     "register_strategy",
+    "shutdown_strategies",
 ]
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
+from loguru import logger
+
 from skim.domain.models.event import Event, EventSignal, EventType
 
 
@@ -156,6 +159,14 @@ class Strategy(ABC):
         """
         pass
 
+    async def shutdown(self) -> None:  # noqa: B027
+        """Release resources held by the strategy
+
+        Strategies can override this to stop workers or close clients.
+        Called once when the bot stops.
+        """
+        pass
+
     async def get_pending_signals(self) -> list[dict[str, Any]]:
         """Get pending signals for execution
 
@@ -165,3 +176,22 @@ class Strategy(ABC):
             List of pending signal dicts with ticker, action, price, quantity
         """
         return []
+
+
+async def shutdown_strategies(strategies: Iterable[Strategy]) -> None:
+    """Shut down every strategy, logging failures
+
+    A strategy whose shutdown raises does not keep the others from
+    shutting down.
+
+    Args:
+        strategies: Strategies to shut down, in order
+    """
+    for strategy in strategies:
+        try:
+            await strategy.shutdown()
+        except Exception as e:
+            logger.error(
+                f"Shutdown failed for strategy {strategy.name}: {e}",
+                exc_info=True,
+            )
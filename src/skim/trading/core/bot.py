@@ -9,6 +9,7 @@ from loguru import logger
 
 from skim.application.events.event_bus import EventBus
 from skim.domain.strategies.base import Strategy as DomainStrategy
+from skim.domain.strategies.base import shutdown_strategies
 from skim.domain.strategies.context import StrategyContext
 from skim.domain.strategies.registry import registry
 from skim.infrastructure.brokers.ibkr import IBKRClient
@@ -60,6 +61,7 @@ class TradingBot:
     async def stop(self) -> None:
         """Stop bot and event bus"""
         logger.info("Stopping Skim Trading Bot...")
+        await shutdown_strategies(self.strategies.values())
         await self.event_bus.stop()
         logger.info("Bot stopped successfully")
 
@@ -33,6 +33,12 @@ class ScannerConfig:
     # Breakout buffer above ORH (dollars)
     or_breakout_buffer: float = 0.1
 
+    # Summarise the first page of news candidates' announcement PDFs
+    announcement_pdfs: bool = False
+
+    # Time allowed for fetching and summarising the PDFs (seconds)
+    announcement_pdf_budget_seconds: float = 10.0
+
 
 @dataclass
 class HistoricalConfig:
@@ -205,7 +211,12 @@ class Config:
             discord_webhook_url=os.getenv("DISCORD_WEBHOOK_URL"),
             oauth_signature_key_path=str(oauth_paths["signature"]),
             oauth_encryption_key_path=str(oauth_paths["encryption"]),
-            scanner_config=ScannerConfig(),
+            scanner_config=ScannerConfig(
+                announcement_pdfs=os.getenv(
+                    "ANNOUNCEMENT_PDFS", "false"
+                ).lower()
+                == "true"
+            ),
             historical_config=HistoricalConfig(),
         )
 
@@ -243,6 +254,9 @@ class Config:
         logger.info(
             f"  OR Breakout Buffer: ${config.scanner_config.or_breakout_buffer}"
         )
+        logger.info(
+            f"  Announcement PDFs: {'Enabled' if config.scanner_config.announcement_pdfs else 'Disabled'}"
+        )
         logger.info(
             f"  Historical Filtering: {'Enabled' if config.historical_config.enable_filtering else 'Disabled'}"
         )
@@ -0,0 +1,280 @@
+"""Announcement PDF download and first-page summaries
+
+Fetches the PDFs behind price-sensitive announcements concurrently,
+caches them on disk by URL hash and extracts first-page text in worker
+processes. The whole batch runs under one time budget: whatever has not
+finished when it expires is dropped, and extraction still running is
+abandoned with its worker pool, so the morning scan is never held up by a
+slow download or a large PDF. Cached PDFs older than a few days are
+pruned, as announcements only matter around their release.
+
+Text extraction needs the optional ``pypdf`` package (``pip install
+skim[pdf]``).
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from urllib.parse import urljoin
+
+import httpx
+from bs4 import BeautifulSoup
+from loguru import logger
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_WORKERS = 2
+# Seconds for the whole batch, from first request to last summary
+DEFAULT_TIME_BUDGET = 10.0
+# Days a downloaded PDF is kept in the cache
+DEFAULT_CACHE_DAYS = 7.0
+SUMMARY_CHARS = 300
+
+
+def pdf_support() -> bool:
+    """Whether the optional PDF text extraction dependency is installed"""
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def extract_first_page(path: str) -> str:
+    """Extract the text of a PDF's first page
+
+    Runs in a worker process, so it takes and returns plain strings.
+
+    Args:
+        path: Path to the PDF file
+
+    Returns:
+        First-page text, empty if the PDF has no pages or no text layer
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    if not reader.pages:
+        return ""
+    return reader.pages[0].extract_text() or ""
+
+
+def summarize(text: str, max_chars: int = SUMMARY_CHARS) -> str:
+    """Collapse whitespace and cut text at a word boundary
+
+    Args:
+        text: Extracted page text
+        max_chars: Maximum summary length
+
+    Returns:
+        Summary of at most ``max_chars`` characters plus an ellipsis
+    """
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars].rsplit(" ", 1)[0]
+    return cut.rstrip(" ,;:-") + "..."
+
+
+def resolve_pdf_link(html: str, base_url: str) -> str | None:
+    """Find the PDF behind an ASX announcement display page
+
+    The announcement links in the ASX tables lead to an interstitial page
+    carrying the real document address in a ``pdfURL`` form field.
+
+    Args:
+        html: Display page HTML
+        base_url: URL the page was served from
+
+    Returns:
+        Absolute PDF URL, or None if the page links to no PDF
+    """
+    soup = BeautifulSoup(html, "lxml")
+    field = soup.find("input", attrs={"name": "pdfURL"})
+    if field is not None and field.get("value"):
+        return urljoin(base_url, str(field["value"]))
+    anchor = soup.find("a", href=re.compile(r"\.pdf($|\?)", re.IGNORECASE))
+    if anchor is not None:
+        return urljoin(base_url, str(anchor["href"]))
+    return None
+
+
+def _store(path: Path, content: bytes) -> None:
+    """Write a downloaded PDF to the cache atomically"""
+    tmp = path.with_suffix(".part")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+class AnnouncementPdfSummarizer:
+    """Downloads announcement PDFs and summarises their first page"""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        workers: int = DEFAULT_WORKERS,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        max_chars: int = SUMMARY_CHARS,
+        cache_days: float = DEFAULT_CACHE_DAYS,
+    ):
+        """Initialise the summariser
+
+        Args:
+            cache_dir: Directory for downloaded PDFs
+            concurrency: Maximum downloads in flight
+            workers: Text extraction processes
+            time_budget: Seconds allowed for each batch
+            max_chars: Maximum summary length
+            cache_days: Days a downloaded PDF is kept
+        """
+        self.cache_dir = Path(cache_dir)
+        self.concurrency = concurrency
+        self.workers = workers
+        self.time_budget = time_budget
+        self.max_chars = max_chars
+        self.cache_days = cache_days
+        self._pool: ProcessPoolExecutor | None = None
+
+    def cache_path(self, url: str) -> Path:
+        """Cache file for an announcement URL"""
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{digest}.pdf"
+
+    def prune_cache(self, now: float | None = None) -> int:
+        """Delete cached PDFs older than ``cache_days``
+
+        Args:
+            now: Reference time as a Unix timestamp (default: now)
+
+        Returns:
+            Number of files deleted
+        """
+        cutoff = (now or time.time()) - self.cache_days * 86400
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            if path.suffix not in (".pdf", ".part"):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    async def summarize_all(self, urls: Iterable[str]) -> dict[str, str]:
+        """Summarise the announcements behind each URL within the budget
+
+        Args:
+            urls: Announcement PDF or display page URLs
+
+        Returns:
+            Mapping of URL to first-page summary for every announcement
+            finished within the time budget
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        pool = self._executor()
+        # Warm-up: the executor spawns a worker per submitted job, so a
+        # no-op job starts one now and its startup overlaps the downloads
+        # instead of delaying the first extraction
+        pool.submit(int)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        extractions: list[Future] = []
+
+        async def summarize_one(client: httpx.AsyncClient, url: str):
+            path = self.cache_path(url)
+            if not path.exists():
+                async with semaphore:
+                    content = await self._download(client, url)
+                await asyncio.to_thread(_store, path, content)
+            extraction = pool.submit(extract_first_page, str(path))
+            extractions.append(extraction)
+            text = await asyncio.wrap_future(extraction)
+            return summarize(text, self.max_chars)
+
+        summaries: dict[str, str] = {}
+        async with httpx.AsyncClient(
+            timeout=self.time_budget, follow_redirects=True
+        ) as client:
+            tasks = {
+                asyncio.create_task(summarize_one(client, url)): url
+                for url in urls
+            }
+            done, pending = await asyncio.wait(tasks, timeout=self.time_budget)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Cancelling a task can leave its extraction queued or running in the
+        # pool; drop queued jobs, and replace the pool if one is running
+        # so it cannot hold up the next batch
+        running = [job for job in extractions if not job.cancel()]
+        if any(not job.done() for job in running):
+            self.close()
+        await asyncio.to_thread(self.prune_cache)
+
+        for task in done:
+            url = tasks[task]
+            if task.exception() is not None:
+                logger.warning(
+                    f"Announcement PDF failed for {url}: {task.exception()}"
+                )
+            elif task.result():
+                summaries[url] = task.result()
+
+        if pending:
+            logger.warning(
+                f"Announcement PDF budget of {self.time_budget}s expired "
+                f"with {len(pending)}/{len(urls)} unfinished"
+            )
+        return summaries
+
+    async def _download(self, client: httpx.AsyncClient, url: str) -> bytes:
+        """Fetch a PDF, following an HTML display page to the document
+
+        Raises:
+            httpx.HTTPError: If a request fails
+            ValueError: If no PDF is found behind the URL
+        """
+        response = await client.get(url)
+        response.raise_for_status()
+        if response.content.startswith(b"%PDF"):
+            return response.content
+
+        link = resolve_pdf_link(response.text, str(response.url))
+        if link is None:
+            raise ValueError("no PDF link on announcement page")
+        response = await client.get(link)
+        response.raise_for_status()
+        if not response.content.startswith(b"%PDF"):
+            raise ValueError(f"{link} is not a PDF")
+        return response.content
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=get_context("spawn")
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Stop the extraction workers, abandoning unfinished work"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> "AnnouncementPdfSummarizer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,6 +1,7 @@
 """ASX price-sensitive announcements scraper"""
 
 from datetime import datetime
+from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
@@ -57,35 +58,19 @@ class ASXAnnouncementScanner:
                             ticker = cells[0].get_text(strip=True)
                             headline = cells[1].get_text(strip=True)
 
-                            # Apply ticker length filter
-                            if not (
-                                filter_config.min_ticker_length
-                                <= len(ticker)
-                                <= filter_config.max_ticker_length
-                            ):
+                            if not filter_config.accepts_ticker(ticker):
                                 continue
 
-                            # Apply headline length filter
-                            if not (
-                                filter_config.min_headline_length
-                                <= len(headline)
-                                <= filter_config.max_headline_length
-                            ):
+                            categories = filter_config.classify(headline)
+                            if categories is None:
                                 continue
 
-                            # Apply include/exclude filters
-                            if (
-                                filter_config.include_only_tickers
-                                and ticker
-                                not in filter_config.include_only_tickers
-                            ):
-                                continue
-
-                            if (
-                                filter_config.exclude_tickers
-                                and ticker in filter_config.exclude_tickers
-                            ):
-                                continue
+                            link = row.find("a", href=True)
+                            pdf_url = (
+                                urljoin(self.ASX_URL, str(link["href"]))
+                                if link is not None
+                                else None
+                            )
 
                             # Parse timestamp (basic parsing - could be enhanced)
                             timestamp = datetime.now()  # Simplified for now
@@ -96,7 +81,8 @@ class ASXAnnouncementScanner:
                                 headline=headline,
                                 announcement_type="pricesens",
                                 timestamp=timestamp,
-                                pdf_url=None,
+                                pdf_url=pdf_url,
+                                categories=categories,
                             )
                             announcements.append(announcement)
 
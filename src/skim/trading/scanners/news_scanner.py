@@ -8,15 +8,22 @@ from loguru import logger
 from skim.domain.models import NewsCandidate
 from skim.domain.models.ticker import Ticker
 
+from .announcement_pdfs import AnnouncementPdfSummarizer
 from .asx_announcements import ASXAnnouncementScanner
 
 
 class NewsScanner:
     """Scanner for news-only stocks in play"""
 
-    def __init__(self):
-        """Initialise news scanner"""
+    def __init__(self, pdf_summarizer: AnnouncementPdfSummarizer | None = None):
+        """Initialise news scanner
+
+        Args:
+            pdf_summarizer: Optional summariser attaching the first page of
+                each announcement's PDF to its candidate
+        """
         self.asx_scanner = ASXAnnouncementScanner()
+        self.pdf_summarizer = pdf_summarizer
 
     @property
     def name(self) -> str:
@@ -46,6 +53,8 @@ class NewsScanner:
 
         logger.info(f"Found {len(announcements)} price-sensitive announcements")
 
+        summaries = await self._summaries(announcements)
+
         candidates = [
             NewsCandidate(
                 ticker=Ticker(symbol=ann.ticker),
@@ -54,9 +63,27 @@ class NewsScanner:
                 headline=ann.headline,
                 announcement_type=ann.announcement_type,
                 announcement_timestamp=ann.timestamp,
+                summary=summaries.get(ann.pdf_url) if ann.pdf_url else None,
             )
             for ann in announcements
         ]
 
         logger.info(f"Scan complete. Found {len(candidates)} news candidates")
         return candidates
+
+    async def _summaries(self, announcements) -> dict[str, str]:
+        """Summarise announcement PDFs, if enabled, within the time budget
+
+        Returns:
+            Mapping of PDF URL to first-page summary
+        """
+        if self.pdf_summarizer is None:
+            return {}
+        urls = [ann.pdf_url for ann in announcements if ann.pdf_url]
+        try:
+            summaries = await self.pdf_summarizer.summarize_all(urls)
+        except Exception as e:
+            logger.warning(f"Announcement PDF summaries failed: {e}")
+            return {}
+        logger.info(f"Summarised {len(summaries)}/{len(urls)} announcements")
+        return summaries
@@ -1,6 +1,7 @@
 """ORH Breakout Strategy - Event-driven architecture"""
 
 from datetime import date
+from pathlib import Path
 from typing import cast
 
 from loguru import logger
@@ -19,6 +20,10 @@ from skim.trading.data.repositories.orh_repository import ORHCandidateRepository
 from skim.trading.filters import FilterChain, HistoricalPerformanceFilter
 from skim.trading.monitor import Monitor
 from skim.trading.scanners import GapScanner, NewsScanner, ScannerOrchestrator
+from skim.trading.scanners.announcement_pdfs import (
+    AnnouncementPdfSummarizer,
+    pdf_support,
+)
 from skim.trading.strategies.orh_breakout.range_tracker import RangeTracker
 from skim.trading.strategies.orh_breakout.trader import Trader
 
@@ -60,7 +65,21 @@ class ORHBreakoutStrategy(Strategy):
                 gap_threshold=config.scanner_config.gap_threshold,
             )
         )
-        self.scanner_orchestrator.register_scanner(NewsScanner())
+        self.pdf_summarizer = None
+        if config.scanner_config.announcement_pdfs:
+            if pdf_support():
+                self.pdf_summarizer = AnnouncementPdfSummarizer(
+                    Path(config.db_path).parent / "announcement_pdfs",
+                    time_budget=config.scanner_config.announcement_pdf_budget_seconds,
+                )
+            else:
+                logger.warning(
+                    "Announcement PDFs enabled but pypdf is not installed; "
+                    "install skim[pdf] to summarise them"
+                )
+        self.scanner_orchestrator.register_scanner(
+            NewsScanner(pdf_summarizer=self.pdf_summarizer)
+        )
 
         self.range_tracker = RangeTracker(
             market_data_service=context.market_data,
@@ -284,3 +303,8 @@ class ORHBreakoutStrategy(Strategy):
         except Exception as e:
             logger.error(f"Health check failed: {e}", exc_info=True)
             return False
+
+    async def shutdown(self) -> None:
+        """Stop the announcement PDF extraction workers"""
+        if self.pdf_summarizer is not None:
+            self.pdf_summarizer.close()
@@ -5,11 +5,18 @@ announcement scraping, ensuring data quality and type safety throughout
 the scanning pipeline.
 """
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 
 class ScannerFilter(BaseModel):
@@ -174,6 +181,10 @@ class ASXAnnouncement(BaseModel):
     pdf_url: str | None = Field(
         default=None, description="URL to announcement PDF"
     )
+    categories: list[str] = Field(
+        default_factory=list,
+        description="Headline categories matched by the filter",
+    )
 
     @field_validator("ticker")
     @classmethod
@@ -182,8 +193,27 @@ class ASXAnnouncement(BaseModel):
         return v.upper().strip()
 
 
+# Labels of the include and exclude keyword rules; categories are labelled
+# ("category", name)
+_INCLUDE_RULE = ("rule", "include")
+_EXCLUDE_RULE = ("rule", "exclude")
+
+
+def _normalize_keyword(keyword: str) -> str:
+    """Lowercase a keyword and collapse its whitespace"""
+    return " ".join(keyword.lower().split())
+
+
 class PriceSensitiveFilter(BaseModel):
-    """Configuration for filtering ASX price-sensitive announcements"""
+    """Configuration for filtering ASX price-sensitive announcements
+
+    Keywords match whole words or phrases, ignoring case. Every keyword
+    rule (include, exclude and category) is compiled once into a single
+    regex, so classifying a headline is one pass however many rules
+    there are. Every keyword in a headline applies its rule, even where
+    keywords overlap or contain one another. Rules are compiled on
+    construction; build a new filter to change them.
+    """
 
     min_ticker_length: int = Field(
         default=3, ge=1, le=6, description="Minimum ticker length"
@@ -203,6 +233,25 @@ class PriceSensitiveFilter(BaseModel):
     max_headline_length: int = Field(
         default=200, ge=1, description="Maximum headline length"
     )
+    include_keywords: list[str] = Field(
+        default_factory=list,
+        description="Keep only headlines containing one of these",
+    )
+    exclude_keywords: list[str] = Field(
+        default_factory=list,
+        description="Drop headlines containing any of these",
+    )
+    categories: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description="Category name to the keywords that assign it",
+    )
+
+    _exclude_set: frozenset[str] = PrivateAttr(default=frozenset())
+    _include_set: frozenset[str] | None = PrivateAttr(default=None)
+    _pattern: re.Pattern | None = PrivateAttr(default=None)
+    _rules: dict[str, frozenset[tuple[str, str]]] = PrivateAttr(
+        default_factory=dict
+    )
 
     @field_validator("exclude_tickers", "include_only_tickers")
     @classmethod
@@ -212,6 +261,21 @@ class PriceSensitiveFilter(BaseModel):
             return v
         return [ticker.upper().strip() for ticker in v if ticker.strip()]
 
+    @field_validator("include_keywords", "exclude_keywords")
+    @classmethod
+    def validate_keywords(cls, v):
+        """Normalize keywords, dropping blanks"""
+        return [_normalize_keyword(k) for k in v if k.strip()]
+
+    @field_validator("categories")
+    @classmethod
+    def validate_categories(cls, v):
+        """Normalize category keywords, dropping blanks"""
+        return {
+            name: [_normalize_keyword(k) for k in keywords if k.strip()]
+            for name, keywords in v.items()
+        }
+
     @field_validator("include_only_tickers")
     @classmethod
     def validate_mutually_exclusive(cls, v, info):
@@ -222,6 +286,92 @@ class PriceSensitiveFilter(BaseModel):
             )
         return v
 
+    def model_post_init(self, __context) -> None:
+        """Build ticker sets and compile the keyword rules"""
+        self._exclude_set = frozenset(self.exclude_tickers)
+        self._include_set = (
+            frozenset(self.include_only_tickers)
+            if self.include_only_tickers
+            else None
+        )
+
+        # Keyword -> labels: an include/exclude rule or a category, kept
+        # apart so a category may be named "include" or "exclude"
+        labels: dict[str, list[tuple[str, str]]] = {}
+        for keyword in self.include_keywords:
+            labels.setdefault(keyword, []).append(_INCLUDE_RULE)
+        for keyword in self.exclude_keywords:
+            labels.setdefault(keyword, []).append(_EXCLUDE_RULE)
+        for name, keywords in self.categories.items():
+            for keyword in keywords:
+                labels.setdefault(keyword, []).append(("category", name))
+
+        # Only the longest keyword starting at a position is matched there,
+        # so a keyword also carries the labels of every keyword inside it
+        self._rules = {}
+        for keyword in labels:
+            inside = [
+                other
+                for other in labels
+                if re.search(rf"(?<!\w){re.escape(other)}(?!\w)", keyword)
+            ]
+            self._rules[keyword] = frozenset(
+                label for other in inside for label in labels[other]
+            )
+
+        if labels:
+            alternatives = "|".join(
+                r"\s+".join(re.escape(word) for word in keyword.split())
+                for keyword in sorted(labels, key=len, reverse=True)
+            )
+            # A lookahead match is empty, so a keyword is tried at every
+            # position, including inside the previous match
+            self._pattern = re.compile(
+                rf"(?=(?<!\w)({alternatives})(?!\w))", re.IGNORECASE
+            )
+        else:
+            self._pattern = None
+
+    def accepts_ticker(self, ticker: str) -> bool:
+        """Check a ticker against the length and include/exclude rules"""
+        if not (
+            self.min_ticker_length <= len(ticker) <= self.max_ticker_length
+        ):
+            return False
+        if self._include_set is not None and ticker not in self._include_set:
+            return False
+        return ticker not in self._exclude_set
+
+    def classify(self, headline: str) -> list[str] | None:
+        """Apply the headline rules in one pass over the headline
+
+        Args:
+            headline: Announcement headline
+
+        Returns:
+            Matched category names in rule order, or None if the headline
+            is rejected by its length or the keyword rules
+        """
+        if not (
+            self.min_headline_length
+            <= len(headline)
+            <= self.max_headline_length
+        ):
+            return None
+
+        matched: set[tuple[str, str]] = set()
+        if self._pattern is not None:
+            for match in self._pattern.finditer(headline):
+                matched.update(self._rules[_normalize_keyword(match[1])])
+
+        if _EXCLUDE_RULE in matched:
+            return None
+        if self.include_keywords and _INCLUDE_RULE not in matched:
+            return None
+        return [
+            name for name in self.categories if ("category", name) in matched
+        ]
+
 
 class ScannerValidationError(Exception):
     """Raised when scanner parameters or data fail validation"""
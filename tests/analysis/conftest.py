@@ -0,0 +1,25 @@
+"""Shared fixtures for analysis tests."""
+
+import random
+
+import pytest
+
+from skim.analysis.stock_data import StockData
+from tests.analysis.factories import make_stock, random_walk
+
+
+@pytest.fixture
+def universe_stocks() -> dict[str, StockData]:
+    """A small deterministic universe of random-walk stocks."""
+    rng = random.Random(42)
+    stocks = {}
+    for i, ticker in enumerate(["AAA", "BBB", "CCC", "DDD", "EEE"]):
+        n = 300
+        closes = random_walk(i, n, start_price=0.5 + i)
+        volumes = [rng.randint(20_000, 400_000) for _ in range(n)]
+        opens = [
+            round(c * (1 + rng.choice([0.0, 0.0, 0.0, 0.12, -0.05])), 4)
+            for c in closes
+        ]
+        stocks[ticker] = make_stock(ticker, closes, volumes, opens=opens)
+    return stocks
@@ -0,0 +1,69 @@
+"""Test data factories for building analysis stock data."""
+
+import math
+import random
+from datetime import date, timedelta
+
+import polars as pl
+
+from skim.analysis.stock_data import StockData
+
+
+def make_stock(
+    ticker: str,
+    closes: list[float | None],
+    volumes: list[int] | None = None,
+    start: date = date(2024, 1, 1),
+    opens: list[float | None] | None = None,
+) -> StockData:
+    """Build a StockData with one bar per calendar day."""
+    n = len(closes)
+    volumes = volumes or [100_000] * n
+    opens = opens or closes
+    df = pl.DataFrame(
+        {
+            "ticker": [ticker] * n,
+            "date": [start + timedelta(days=i) for i in range(n)],
+            "open": opens,
+            "high": [
+                None if c is None else max(c, o or c) * 1.01
+                for c, o in zip(closes, opens, strict=True)
+            ],
+            "low": [
+                None if c is None else min(c, o or c) * 0.99
+                for c, o in zip(closes, opens, strict=True)
+            ],
+            "close": closes,
+            "volume": volumes,
+        },
+        schema_overrides={
+            "open": pl.Float64,
+            "high": pl.Float64,
+            "low": pl.Float64,
+            "close": pl.Float64,
+            "volume": pl.Int64,
+        },
+    )
+    stock = StockData(ticker)
+    stock.df = df
+    return stock
+
+
+def random_walk(seed: int, n: int, start_price: float = 1.0) -> list[float]:
+    """Deterministic random-walk closing prices."""
+    rng = random.Random(seed)
+    prices = [start_price]
+    for _ in range(n - 1):
+        prices.append(round(prices[-1] * math.exp(rng.gauss(0, 0.03)), 4))
+    return prices
+
+
+def write_stock_csv(path, ticker: str, closes: list[float], volume: int):
+    """Write a headerless CoolTrader-format CSV with one bar per day."""
+    start = date(2024, 1, 1)
+    lines = [
+        f"{ticker},{(start + timedelta(days=i)).strftime('%d/%m/%Y')},"
+        f"{c},{c},{c},{c},{volume}"
+        for i, c in enumerate(closes)
+    ]
+    path.write_text("\n".join(lines) + "\n")
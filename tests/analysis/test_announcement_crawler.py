@@ -0,0 +1,243 @@
+"""Tests for the announcement crawler against a local stand-in site."""
+
+import asyncio
+import threading
+import time
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import pairwise
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from skim.analysis import announcement_scraper
+from skim.analysis.announcement_crawler import (
+    HostRateLimiter,
+    crawl_announcements,
+)
+from skim.analysis.announcement_scraper import AnnouncementScraper
+from skim.analysis.announcements import AnnouncementArchive
+
+TODAY = date(2025, 6, 30)
+
+ROW = """
+<tr>
+<td>
+{day}
+{time}
+</td>
+<td>{flag}</td>
+<td>
+<a href="/asxpdf/{day_key}.pdf">
+{headline}
+<span class="page">3 pages</span></a>
+</td>
+</tr>
+"""
+
+
+def announcements_page(ticker: str, year: int) -> str:
+    """Two announcements per ticker-year, the first price sensitive."""
+    rows = [
+        ROW.format(
+            day=f"{day:02d}/03/{year}",
+            day_key=f"{year}03{day:02d}",
+            time="9:15 am",
+            flag='<img class="pricesens">' if day == 1 else "",
+            headline=f"{ticker} update {day}",
+        )
+        for day in (1, 2)
+    ]
+    return (
+        '<html><div id="content"><div><announcement_data><table>'
+        f"<tr><th>Date</th></tr>{''.join(rows)}"
+        "</table></announcement_data></div></div></html>"
+    )
+
+
+class StandInSite(ThreadingHTTPServer):
+    """ASX announcements stand-in recording requests and concurrency."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.requests: list[tuple[str, int]] = []
+        self.failing: set[tuple[str, int]] = set()
+        self.blocked: set[tuple[str, int]] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server: StandInSite
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        key = (query["asxCode"][0], int(query["year"][0]))
+        with self.server.lock:
+            self.server.requests.append(key)
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(
+                self.server.max_in_flight, self.server.in_flight
+            )
+        time.sleep(0.02)
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        status = 503 if key in self.server.failing else 200
+        body = announcements_page(*key).encode() if status == 200 else b""
+        if key in self.server.blocked:
+            body = b"<html><h1>Access denied</h1></html>"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = StandInSite()
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.05,), daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = AnnouncementArchive(tmp_path / "announcements.db")
+    yield archive
+    archive.close()
+
+
+def crawl(archive, site, tickers, years, **kwargs):
+    return asyncio.run(
+        crawl_announcements(
+            archive,
+            tickers,
+            years,
+            base_url=site.url,
+            today=TODAY,
+            rate=0,
+            retry_delay=0,
+            **kwargs,
+        )
+    )
+
+
+def test_past_years_are_fetched_once(archive, site):
+    first = crawl(archive, site, ["abc", "xyz"], range(2023, 2027))
+    requests = sorted(site.requests)
+    second = crawl(archive, site, ["ABC", "XYZ"], range(2023, 2027))
+
+    assert requests == [
+        (t, y) for t in ("ABC", "XYZ") for y in (2023, 2024, 2025)
+    ]
+    assert (first.fetched, first.added, first.failed) == (6, 12, [])
+    # Only the current year is refreshed, and nothing new was listed
+    assert sorted(site.requests[6:]) == [("ABC", 2025), ("XYZ", 2025)]
+    assert (second.fetched, second.added) == (2, 0)
+
+    stored = archive.get("ABC", datetime(2024, 1, 1), datetime(2024, 12, 31))
+    assert [a["headline"] for a in stored] == ["ABC update 2", "ABC update 1"]
+    assert [a["price_sensitive"] for a in stored] == [False, True]
+    assert stored[0]["time"] == "0915"
+
+
+def test_failed_years_stay_pending(archive, site):
+    site.failing = {("ABC", 2023)}
+
+    result = crawl(archive, site, ["ABC"], [2023, 2024])
+
+    assert result.failed == [("ABC", 2023)]
+    assert site.requests.count(("ABC", 2023)) == 4
+    assert archive.pending_years("ABC", [2023, 2024], TODAY) == [2023]
+
+
+def test_pages_without_a_table_stay_pending(archive, site):
+    site.blocked = {("ABC", 2023)}
+
+    result = crawl(archive, site, ["ABC"], [2023, 2024])
+
+    assert result.failed == [("ABC", 2023)]
+    assert result.fetched == 1
+    assert archive.pending_years("ABC", [2023, 2024], TODAY) == [2023]
+
+
+def test_requests_in_flight_are_bounded(archive, site):
+    tickers = [f"T{i:02d}" for i in range(12)]
+
+    result = crawl(archive, site, tickers, [2024], concurrency=3)
+
+    assert result.fetched == 12
+    assert 1 < site.max_in_flight <= 3
+
+
+def test_rate_limiter_spaces_requests_per_host():
+    async def stamps():
+        limiter = HostRateLimiter(rate=50)
+        times = []
+
+        async def hit(url):
+            await limiter.wait(url)
+            times.append((url, asyncio.get_running_loop().time()))
+
+        await asyncio.gather(
+            *(hit("http://a.test/x") for _ in range(5)),
+            hit("http://b.test/x"),
+        )
+        return times
+
+    times = asyncio.run(stamps())
+
+    host_a = sorted(t for url, t in times if "a.test" in url)
+    gaps = [later - earlier for earlier, later in pairwise(host_a)]
+    assert min(gaps) >= 0.015
+    # Another host is not held back by the first host's queue
+    assert [t for url, t in times if "b.test" in url][0] < host_a[-1]
+
+
+def test_scraper_reads_complete_years_from_archive(archive, monkeypatch):
+    calls = []
+
+    def fetch(ticker, year):
+        calls.append((ticker, year))
+        return [
+            {
+                "date": f"{year}0301",
+                "time": "0915",
+                "headline": f"{ticker} {year}",
+                "price_sensitive": True,
+                "pages": 1,
+            }
+        ]
+
+    monkeypatch.setattr(
+        announcement_scraper, "fetch_announcements_for_year", fetch
+    )
+    scraper = AnnouncementScraper(archive)
+    this_year = date.today().year
+    period = (datetime(this_year - 1, 1, 1), datetime(this_year, 12, 31))
+
+    scraper.get_announcements("abc", *period)
+    found = scraper.get_announcements("abc", *period)
+
+    assert calls == [
+        ("ABC", this_year - 1),
+        ("ABC", this_year),
+        ("ABC", this_year),
+    ]
+    assert [a["headline"] for a in found] == [
+        f"ABC {this_year}",
+        f"ABC {this_year - 1}",
+    ]
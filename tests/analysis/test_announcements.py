@@ -0,0 +1,188 @@
+"""Unit tests for the announcement archive, search and gap linking."""
+
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import polars as pl
+import pytest
+
+from skim.analysis.announcements import (
+    AnnouncementArchive,
+    link_announcements,
+)
+
+# Archive layout before announcements had an id column
+LEGACY_SCHEMA = """
+CREATE TABLE announcements (
+    ticker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL,
+    headline TEXT NOT NULL,
+    price_sensitive INTEGER NOT NULL,
+    pages INTEGER NOT NULL,
+    PRIMARY KEY (ticker, date, time, headline)
+);
+CREATE INDEX idx_announcements_date ON announcements (date, ticker);
+"""
+
+
+def _ann(day: str, time: str, headline: str, sensitive: bool = True) -> dict:
+    return {
+        "date": day,
+        "time": time,
+        "headline": headline,
+        "price_sensitive": sensitive,
+        "pages": 2,
+    }
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = AnnouncementArchive(tmp_path / "announcements.db")
+    archive.add(
+        "abc",
+        [
+            _ann("20240102", "0830", "Placement completed"),
+            _ann("20240102", "0915", "Appendix 2A", sensitive=False),
+            _ann("20240105", "1400", "Drilling results"),
+            _ann("20231201", "0830", "Quarterly report"),
+        ],
+    )
+    archive.add("xyz", [_ann("20240101", "1630", "Trading halt")])
+    yield archive
+    archive.close()
+
+
+def test_archive_ignores_duplicates(archive):
+    added = archive.add(
+        "ABC", [_ann("20240102", "0830", "Placement completed")]
+    )
+
+    stored = archive.get("ABC", datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+    assert added == 0
+    assert [a["headline"] for a in stored] == [
+        "Drilling results",
+        "Appendix 2A",
+        "Placement completed",
+    ]
+    assert stored[0]["price_sensitive"] is True
+
+    frame = archive.frame(tickers=["XYZ"])
+    assert frame.height == 1
+    assert frame["published"][0] == datetime(2024, 1, 1, 16, 30)
+
+
+def test_gaps_link_to_latest_announcement_before_open(archive):
+    gaps = pl.DataFrame(
+        {
+            "ticker": ["ABC", "ABC", "XYZ", "ABC", "DEF"],
+            "date": [
+                date(2024, 1, 2),
+                date(2024, 1, 5),
+                date(2024, 1, 2),
+                date(2024, 1, 8),
+                date(2024, 1, 2),
+            ],
+            "gap_percent": [12.0, 15.0, 20.0, 11.0, 30.0],
+        }
+    )
+
+    linked = link_announcements(gaps, archive.frame())
+
+    assert linked["gap_percent"].to_list() == gaps["gap_percent"].to_list()
+    assert linked["headline"].to_list() == [
+        "Appendix 2A",
+        # Placement is 3 days and 90 minutes before the open; the drilling
+        # results came out after it
+        None,
+        "Trading halt",
+        "Drilling results",
+        None,
+    ]
+    assert linked["lag_hours"][0] == pytest.approx(0.75)
+    assert linked["lag_hours"][2] == pytest.approx(17.5)
+
+    sensitive = link_announcements(
+        gaps.head(1), archive.frame(), price_sensitive_only=True
+    )
+    assert sensitive["headline"][0] == "Placement completed"
+
+    wider = link_announcements(
+        gaps, archive.frame(), tolerance=timedelta(days=4)
+    )
+    assert wider["headline"][1] == "Appendix 2A"
+
+
+def test_search_supports_fts_queries(archive):
+    def headlines(query, **kwargs):
+        return archive.search(query, **kwargs)["headline"].to_list()
+
+    assert headlines("placement") == ["Placement completed"]
+    assert headlines("placements") == ["Placement completed"]
+    assert headlines('"results drilling"') == []
+    assert headlines("drill*") == ["Drilling results"]
+    assert headlines("placement OR halt OR report") == [
+        "Placement completed",
+        "Trading halt",
+        "Quarterly report",
+    ]
+    assert headlines("placement OR appendix NOT 2A") == ["Placement completed"]
+    assert headlines("halt", ticker="abc") == []
+    assert headlines("report OR halt", start_date=date(2024, 1, 1)) == [
+        "Trading halt"
+    ]
+    assert headlines("appendix OR placement", price_sensitive_only=True) == [
+        "Placement completed"
+    ]
+    with pytest.raises(ValueError, match="Invalid search query"):
+        archive.search('"unbalanced')
+
+    archive.add("def", [_ann("20240201", "1000", "Placement and offer")])
+
+    assert headlines("placement", limit=1) == ["Placement and offer"]
+
+
+def test_search_cannot_escape_the_headline_column(archive):
+    with pytest.raises(ValueError, match="unmatched"):
+        archive.search("x) OR ticker : (ABC")
+    with pytest.raises(ValueError, match="unclosed"):
+        archive.search("(placement")
+
+    assert archive.search("ticker : ABC").is_empty()
+    assert archive.search('"(placement"')["headline"].to_list() == [
+        "Placement completed"
+    ]
+
+
+def test_archives_without_search_index_are_migrated(tmp_path):
+    path = tmp_path / "announcements.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO announcements VALUES ('ABC', ?, ?, ?, 1, 2)",
+        [
+            ("20240105", "1400", "Drilling results"),
+            ("20240102", "0830", "Placement completed"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    archive = AnnouncementArchive(path)
+
+    assert archive.search("drilling OR placement")["headline"].to_list() == [
+        "Drilling results",
+        "Placement completed",
+    ]
+    archive.add("ABC", [_ann("20240102", "0830", "Placement completed")])
+    archive.add("ABC", [_ann("20240103", "1000", "Placement and offer")])
+    assert archive.search("placement")["headline"].to_list() == [
+        "Placement and offer",
+        "Placement completed",
+    ]
+    archive.conn.execute("VACUUM")
+    assert archive.search("placement", start_date=date(2024, 1, 3))[
+        "headline"
+    ].to_list() == ["Placement and offer"]
+    archive.close()
@@ -0,0 +1,154 @@
+"""Unit tests for the vectorized gap breakout backtester."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+from rich.console import Console
+
+from skim.analysis.backtest import Backtester, simulate_trades
+from skim.trading.core.config import ScannerConfig
+from tests.analysis.factories import make_stock
+
+
+def _legacy_trades(stock, start, end, threshold, stop_pct, max_hold):
+    """Bar-by-bar event loop over one ticker, as a reference."""
+    rows = stock.df.filter(pl.col("date") <= end).rows(named=True)
+    trades = []
+    for i in range(1, len(rows)):
+        bar, prev = rows[i], rows[i - 1]
+        gap = (bar["open"] - prev["close"]) / prev["close"] * 100
+        if bar["date"] < start or gap < threshold or prev["volume"] < 10000:
+            continue
+        entry = bar["open"]
+        quantity = min(int(5000.0 / entry), 1000)
+        if quantity < 1 or entry < 0.05:
+            continue
+        stop = entry * (1 - stop_pct / 100)
+        limit = len(rows) - 1 if max_hold is None else i + max_hold
+        limit = min(limit, len(rows) - 1)
+        exit_price, exit_date = None, None
+        for j in range(i, limit + 1):
+            if rows[j]["low"] <= stop:
+                exit_price = stop if j == i else min(rows[j]["open"], stop)
+                exit_date = rows[j]["date"]
+                break
+        if exit_price is None:
+            exit_price, exit_date = rows[limit]["close"], rows[limit]["date"]
+        trades.append(
+            (
+                stock.ticker,
+                bar["date"],
+                exit_date,
+                round(quantity * (exit_price - entry), 6),
+            )
+        )
+    return trades
+
+
+@pytest.mark.parametrize("max_hold", [None, 5])
+def test_matches_event_loop(universe_stocks, max_hold):
+    start, end = date(2024, 2, 1), date(2024, 9, 30)
+
+    trades = (
+        Backtester(universe_stocks)
+        .run(
+            start, end, ScannerConfig(gap_threshold=9.0), max_hold_days=max_hold
+        )
+        .trades
+    )
+
+    expected = sorted(
+        t
+        for stock in universe_stocks.values()
+        for t in _legacy_trades(stock, start, end, 9.0, 5.0, max_hold)
+    )
+    actual = sorted(
+        (t, e, x, round(p, 6))
+        for t, e, x, p in trades.select(
+            "ticker", "entry_date", "exit_date", "pnl"
+        ).iter_rows()
+    )
+    assert expected
+    assert actual == expected
+
+
+def test_stop_and_end_exits():
+    stock = make_stock(
+        "AAA",
+        closes=[1.0, 1.25, 1.28, 1.0, 1.05],
+        opens=[1.0, 1.2, 1.25, 1.1, 1.0],
+    )
+    universe = Backtester({"AAA": stock}).universe
+
+    trades = simulate_trades(universe, date(2024, 1, 1), date(2024, 1, 5))
+
+    trade = trades.row(0, named=True)
+    assert trades.height == 1
+    assert trade["quantity"] == 1000
+    assert trade["stop"] == pytest.approx(1.14)
+    assert trade["exit_reason"] == "stop"
+    assert trade["exit_date"] == date(2024, 1, 4)
+    # The exit bar opens below the stop, so the fill is at the open
+    assert trade["exit_price"] == pytest.approx(1.1)
+    assert trade["pnl"] == pytest.approx(-100.0)
+
+    held = simulate_trades(
+        universe, date(2024, 1, 1), date(2024, 1, 5), stop_pct=50.0
+    ).row(0, named=True)
+    assert held["exit_reason"] == "end"
+    assert held["exit_price"] == 1.05
+
+
+def test_position_size_is_capped():
+    cheap = make_stock("LOW", closes=[0.5, 0.6, 0.6], opens=[0.5, 0.6, 0.6])
+    dear = make_stock("HI", closes=[20.0, 24.0, 24.0], opens=[20, 24.0, 24])
+    universe = Backtester({"LOW": cheap, "HI": dear}).universe
+
+    trades = simulate_trades(universe, date(2024, 1, 1), date(2024, 1, 3))
+
+    sizes = dict(trades.select("ticker", "quantity").iter_rows())
+    assert sizes == {"LOW": 1000, "HI": 208}
+
+
+def test_opening_range_columns_set_entry_and_stop():
+    stock = make_stock(
+        "AAA", closes=[1.0, 1.3, 1.3, 1.3], opens=[1.0, 1.2, 1.3, 1.3]
+    )
+    universe = Backtester({"AAA": stock}).universe.with_columns(
+        pl.lit(1.25).alias("or_high"), pl.lit(1.19).alias("or_low")
+    )
+
+    trade = simulate_trades(universe, date(2024, 1, 1), date(2024, 1, 4)).row(
+        0, named=True
+    )
+
+    assert trade["entry_price"] == 1.25
+    assert trade["stop"] == 1.19
+
+
+def test_equity_curve_marks_open_positions(universe_stocks):
+    start, end = date(2024, 2, 1), date(2024, 9, 30)
+
+    result = Backtester(universe_stocks).run(start, end, capital=10_000.0)
+
+    equity = result.equity
+    assert equity["date"].is_sorted()
+    assert equity["date"].min() >= start
+    assert equity["equity"][-1] == pytest.approx(
+        10_000.0 + result.trades["pnl"].sum()
+    )
+    assert equity["open_positions"].min() >= 0
+    assert result.summary()["trades"] == result.trades.height
+
+
+def test_display_results_lists_trades(universe_stocks):
+    backtester = Backtester(universe_stocks)
+    result = backtester.run(date(2024, 2, 1), date(2024, 9, 30))
+    console = Console(record=True, width=140)
+
+    backtester.display_results(result, console)
+
+    out = console.export_text()
+    assert "Win rate" in out
+    assert "Backtest Trades" in out
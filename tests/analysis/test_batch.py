@@ -0,0 +1,128 @@
+"""Tests for the non-interactive batch mode."""
+
+import polars as pl
+import pytest
+
+from skim.analysis.cli import cli as cli_module
+from skim.analysis.cli.batch import split_commands, write_results
+from skim.analysis.cli.main import main
+from tests.analysis.factories import make_stock, random_walk
+
+
+class CountingLoader:
+    """DataLoader stand-in counting full loads."""
+
+    loads = 0
+
+    def __init__(self, *args, **kwargs):
+        self.stocks = {}
+
+    def load_all(self, **kwargs):
+        CountingLoader.loads += 1
+        self.stocks = {
+            ticker: make_stock(ticker, random_walk(seed, 300), [200_000] * 300)
+            for seed, ticker in enumerate(["BHP", "CBA", "TLS"])
+        }
+        return self.stocks
+
+
+@pytest.fixture
+def run_batch(tmp_path, monkeypatch):
+    CountingLoader.loads = 0
+    monkeypatch.setattr(cli_module, "DataLoader", CountingLoader)
+
+    def run(*args):
+        return main(
+            [
+                "--announcements",
+                str(tmp_path / "announcements.db"),
+                "--companies",
+                str(tmp_path / "companies.db"),
+                "--output-dir",
+                str(tmp_path / "out"),
+                *args,
+            ]
+        )
+
+    return run
+
+
+def test_split_commands_accepts_lines_and_semicolons():
+    script = "gaps 2024; top 3M\n\n# bursts\n  bursts 1Y ;"
+
+    assert split_commands(script) == ["gaps 2024", "top 3M", "bursts 1Y"]
+
+
+def test_commands_share_one_load_and_write_files(run_batch, tmp_path):
+    status = run_batch(
+        "--format", "parquet", "-c", "top 2024; bursts 2024; screen close > 0"
+    )
+
+    out = tmp_path / "out"
+    assert status == 0
+    assert CountingLoader.loads == 1
+    assert sorted(p.name for p in out.iterdir()) == [
+        "01-top.parquet",
+        "02-momentum.parquet",
+        "03-screen.parquet",
+    ]
+    assert set(pl.read_parquet(out / "03-screen.parquet")["ticker"]) == {
+        "BHP",
+        "CBA",
+        "TLS",
+    }
+    assert "daily_gains" in pl.read_parquet(out / "02-momentum.parquet").columns
+
+
+def test_batch_writes_full_results_of_table_commands(run_batch, tmp_path):
+    status = run_batch(
+        "-c", "bursts 2024; pattern BHP 2024; perf BHP 2024; movestats 2024"
+    )
+
+    out = tmp_path / "out"
+    assert status == 0
+    # The console shows the top 50 bursts; batch output keeps them all
+    assert pl.read_csv(out / "01-momentum.csv").height == 58
+    assert set(pl.read_csv(out / "02-pattern.csv")["pattern_type"]) == {
+        "momentum_burst"
+    }
+    perf = pl.read_csv(out / "03-perf.csv")
+    assert perf["ticker"].to_list() == ["BHP"]
+    assert {"return_1M", "return_1Y"} <= set(perf.columns)
+    stats = pl.read_csv(out / "04-movestats.csv")
+    assert stats.columns == ["pattern", "metric", "value"]
+    assert "total_count" in stats["metric"].to_list()
+
+
+def test_script_stops_at_first_failure(run_batch, tmp_path, capsys):
+    script = tmp_path / "script.txt"
+    script.write_text("top 2024\ntop nonsense\nchart BHP\nscreen close > 0\n")
+
+    assert run_batch("run", str(script)) == 1
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+        "01-top.csv"
+    ]
+
+    assert run_batch("run", str(script), "--keep-going") == 1
+    assert "04-screen.csv" in {p.name for p in (tmp_path / "out").iterdir()}
+    err = capsys.readouterr().err
+    assert "Command 2 failed: top nonsense" in err
+    assert "'chart' is not available in batch mode" in err
+    assert run_batch("run", str(tmp_path / "missing.txt")) == 2
+
+
+def test_write_results_formats(tmp_path):
+    frame = pl.DataFrame(
+        {"ticker": ["BHP", "CBA"], "daily_gains": [[1.5, 2.0], [3.0]]}
+    )
+
+    assert write_results(frame, tmp_path / "r.csv", "csv") == 2
+    assert write_results(frame.to_dicts(), tmp_path / "r.jsonl", "json") == 2
+
+    assert pl.read_csv(tmp_path / "r.csv")["daily_gains"].to_list() == [
+        "1.5;2.0",
+        "3.0",
+    ]
+    assert pl.read_ndjson(tmp_path / "r.jsonl").equals(frame)
+    with pytest.raises(ValueError, match="Unknown format"):
+        write_results(frame, tmp_path / "r.xlsx", "xlsx")
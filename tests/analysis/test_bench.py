@@ -0,0 +1,98 @@
+"""Unit tests for the synthetic universe generator and benchmark runner."""
+
+import zipfile
+
+from skim.analysis.bench.runner import (
+    BenchResult,
+    compare,
+    load_baseline,
+    regressions,
+    run_suite,
+    save_baseline,
+)
+from skim.analysis.bench.synthetic import generate_universe, synthetic_tickers
+from skim.analysis.data_loader import DataLoader
+
+
+def test_synthetic_tickers_are_three_letters():
+    tickers = synthetic_tickers(30)
+
+    assert tickers[:3] == ["AAA", "AAB", "AAC"]
+    assert len(set(tickers)) == 30
+    assert all(len(t) == 3 and t.isalpha() for t in tickers)
+
+
+def test_generator_is_deterministic(tmp_path):
+    first = generate_universe(tmp_path / "a", tickers=3, years=1, seed=7)
+    second = generate_universe(tmp_path / "b", tickers=3, years=1, seed=7)
+    other = generate_universe(tmp_path / "c", tickers=3, years=1, seed=8)
+
+    for path in sorted(first.glob("*.csv")):
+        assert path.read_bytes() == (second / path.name).read_bytes()
+    assert (first / "AAA.csv").read_bytes() != (other / "AAA.csv").read_bytes()
+
+
+def test_generated_files_load_as_cooltrader_data(tmp_path):
+    historical = generate_universe(
+        tmp_path, tickers=4, years=1, seed=0, zip_months=2
+    )
+
+    stocks = DataLoader(str(historical)).load_all(
+        min_price=0, min_volume=0, quiet=True
+    )
+
+    assert sorted(stocks) == ["AAA", "AAB", "AAC", "AAD"]
+    for stock in stocks.values():
+        df = stock.df
+        assert (df["high"] >= df[["open", "close"]].max_horizontal()).all()
+        assert (df["low"] <= df[["open", "close"]].min_horizontal()).all()
+
+    zips = sorted((tmp_path / "zips").glob("*.zip"))
+    assert [z.name for z in zips] == ["202511.zip", "202512.zip"]
+    with zipfile.ZipFile(zips[-1]) as archive:
+        day = archive.read("20251231.csv").decode().splitlines()
+    assert [line.split(",")[:2] for line in day][0] == ["AAA", "31/12/2025"]
+    assert len(day) == 4
+
+
+def test_compare_flags_regressions(tmp_path):
+    path = tmp_path / "baseline.json"
+    scale = {"tickers": 10, "years": 1, "seed": 0}
+    save_baseline(
+        [BenchResult("load_all", 1.0, 100), BenchResult("find_gaps", 0.5, 90)],
+        path,
+        scale,
+    )
+
+    baseline = load_baseline(path)
+    changes = compare(
+        [
+            BenchResult("load_all", 1.5, 100),
+            BenchResult("find_gaps", 0.5, 90),
+            BenchResult("new_step", 0.1, 90),
+        ],
+        baseline,
+    )
+
+    assert baseline["scale"] == scale
+    assert changes["load_all"] == 0.5
+    assert changes["find_gaps"] == 0.0
+    assert changes["new_step"] is None
+    assert regressions(changes, threshold=0.2) == ["load_all"]
+
+
+def test_run_suite_times_each_step(tmp_path):
+    historical = generate_universe(tmp_path, tickers=5, years=1, zip_months=0)
+
+    results = run_suite(historical, repeat=1, import_tickers=1)
+
+    assert [r.name for r in results] == [
+        "load_all",
+        "find_gaps",
+        "momentum_bursts",
+        "consolidations",
+        "top_performers",
+        "backtest",
+        "import_historical",
+    ]
+    assert all(r.seconds > 0 and r.peak_mb > 0 for r in results)
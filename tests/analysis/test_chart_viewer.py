@@ -0,0 +1,77 @@
+"""Unit tests for chart resampling."""
+
+from datetime import date
+
+import pytest
+from rich.console import Console
+
+from skim.analysis import chart_viewer
+from skim.analysis.chart_viewer import (
+    ChartViewer,
+    build_candles,
+    choose_interval,
+    parse_interval,
+    resample_ohlcv,
+)
+from tests.analysis.factories import make_stock, random_walk
+
+
+@pytest.fixture
+def decade():
+    return make_stock("BHP", random_walk(7, 3650, 10.0), start=date(2015, 1, 1))
+
+
+def test_resample_aggregates_ohlcv(decade):
+    weekly = resample_ohlcv(decade.df, "1w")
+
+    first = decade.df.filter(date(2014, 12, 29) <= decade.df["date"])
+    first = first.filter(first["date"] <= date(2015, 1, 4))
+    row = weekly.row(0, named=True)
+    assert row["date"] == date(2014, 12, 29)
+    assert row["open"] == first["open"][0]
+    assert row["close"] == first["close"][-1]
+    assert row["high"] == first["high"].max()
+    assert row["low"] == first["low"].min()
+    assert row["volume"] == first["volume"].sum()
+
+
+def test_interval_follows_period_length_and_width(decade):
+    dates = decade.df["date"]
+
+    assert choose_interval(dates.tail(90), 120) == "1d"
+    assert choose_interval(dates.tail(365), 120) == "1w"
+    assert choose_interval(dates, 120) == "1mo"
+    assert choose_interval(dates.tail(365), 400) == "1d"
+
+
+def test_parse_interval_aliases():
+    assert parse_interval("weekly") == "1w"
+    assert parse_interval("M") == "1mo"
+    with pytest.raises(ValueError, match="Unknown interval"):
+        parse_interval("hourly")
+
+
+def test_candles_built_from_columns(decade):
+    candles = build_candles(decade.df.head(3))
+
+    assert len(candles) == 3
+    assert candles[0].close == decade.df["close"][0]
+
+
+def test_show_chart_resamples_long_periods(decade, monkeypatch):
+    drawn = []
+
+    class RecordingChart:
+        def __init__(self, candles, title):
+            drawn.append((len(candles), title))
+
+        def __getattr__(self, name):
+            return lambda *args: None
+
+    monkeypatch.setattr(chart_viewer, "Chart", RecordingChart)
+    viewer = ChartViewer({"BHP": decade}, Console(width=120))
+
+    viewer.show_chart("BHP", "2015-01-01 to 2024-12-31")
+    viewer.show_chart("BHP", "2024", interval="weekly")
+
+    assert drawn == [(120, "BHP OHLC (1mo)"), (52, "BHP OHLC (1w)")]
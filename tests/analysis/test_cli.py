@@ -0,0 +1,193 @@
+"""Unit tests for the interactive analysis CLI."""
+
+import threading
+
+import pytest
+
+from skim.analysis.cli import cli as cli_module
+from skim.analysis.cli.cli import CLI
+from skim.analysis.cli.main import build_parser
+from skim.analysis.event_index import DEFAULT_INDEX_PATH
+from tests.analysis.factories import make_stock
+
+
+class BlockingLoader:
+    """DataLoader stand-in that waits for the test to release it."""
+
+    release = threading.Event()
+
+    def __init__(self, *args, **kwargs):
+        self.stocks = {}
+
+    def load_all(self, progress=None, **kwargs):
+        if progress is not None:
+            progress(1, 4)
+        self.release.wait(timeout=5)
+        self.stocks = {"BHP": make_stock("BHP", [1.0, 1.1, 1.2])}
+        return self.stocks
+
+
+class FailingLoader(BlockingLoader):
+    def load_all(self, progress=None, **kwargs):
+        raise OSError("disk unavailable")
+
+
+@pytest.fixture
+def blocking_loader(monkeypatch):
+    BlockingLoader.release = threading.Event()
+    monkeypatch.setattr(cli_module, "DataLoader", BlockingLoader)
+    return BlockingLoader
+
+
+def test_prompt_shows_progress_while_loading(blocking_loader):
+    cli = CLI()
+    cli.start_background_load()
+
+    try:
+        for _ in range(100):
+            if cli._load_progress != (0, 0):
+                break
+            threading.Event().wait(0.01)
+        assert cli.prompt() == "[loading 25%] > "
+        assert not cli.data_loaded
+    finally:
+        blocking_loader.release.set()
+
+
+def test_data_commands_wait_for_background_load(blocking_loader):
+    cli = CLI()
+    cli.start_background_load()
+    blocking_loader.release.set()
+
+    assert cli.ensure_data() is True
+    assert cli.data_loaded
+    assert list(cli.loader.stocks) == ["BHP"]
+    assert cli.prompt() == "> "
+
+
+def test_failed_background_load_is_reported(monkeypatch):
+    monkeypatch.setattr(cli_module, "DataLoader", FailingLoader)
+    cli = CLI()
+    cli.start_background_load()
+
+    assert cli.ensure_data() is False
+    assert not cli.data_loaded
+
+
+@pytest.fixture
+def loaded_cli(blocking_loader):
+    cli = CLI()
+    cli.start_background_load()
+    blocking_loader.release.set()
+    cli.ensure_data()
+    return cli
+
+
+def test_timing_reports_wall_and_cpu_time(loaded_cli, capsys):
+    assert loaded_cli.execute("timing on")
+    loaded_cli.execute("perf BHP 2024")
+
+    assert loaded_cli.timing_enabled
+    assert "wall" in capsys.readouterr().out
+
+
+def test_profile_dumps_pstats(loaded_cli, tmp_path, capsys):
+    dump = tmp_path / "perf.pstats"
+
+    assert loaded_cli.execute(f"profile --dump {dump} perf BHP 2024")
+
+    assert dump.exists()
+    assert "cumulative" in capsys.readouterr().out
+
+
+def test_profile_passes_on_quit(loaded_cli):
+    assert loaded_cli.execute("profile quit") is False
+
+
+def test_mem_shows_frame_sizes(loaded_cli, capsys):
+    loaded_cli.execute("mem")
+    loaded_cli.execute("mem")
+    loaded_cli.execute("mem off")
+
+    out = capsys.readouterr().out
+    assert "Top Allocations" in out
+    assert "Frame Sizes" in out
+    assert "BHP" in out
+
+
+def test_screen_command_lists_matches(loaded_cli, capsys):
+    loaded_cli.execute("screen return_1d > 5%")
+    loaded_cli.execute("screen bogus > 1")
+
+    out = capsys.readouterr().out
+    assert "BHP" in out
+    assert "Unknown feature 'bogus'" in out
+
+
+def test_backtest_command_reports_summary(loaded_cli, capsys):
+    loaded_cli.execute("backtest 2024 --gap 5 --hold 1")
+    loaded_cli.execute("backtest 2024 --gap")
+
+    out = capsys.readouterr().out
+    assert "Trades:" in out
+    assert "Usage: backtest" in out
+
+
+def test_search_command_queries_archive(tmp_path, capsys):
+    cli = CLI(archive_path=tmp_path / "announcements.db")
+    cli.archive.add(
+        "BHP",
+        [
+            {
+                "date": "20240301",
+                "time": "0915",
+                "headline": "Drilling results",
+                "price_sensitive": True,
+                "pages": 3,
+            }
+        ],
+    )
+
+    cli.execute('search "drilling results" --ps')
+    cli.execute("search drilling --ticker")
+    cli.execute('search "drilling')
+
+    out = capsys.readouterr().out
+    assert "BHP" in out
+    assert "Usage: search" in out
+    assert "Invalid search query" in out
+
+
+def test_info_reads_company_store(loaded_cli, tmp_path, monkeypatch, capsys):
+    def offline(ticker):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(cli_module, "yahoo_company_info", offline)
+    cli = CLI(company_path=tmp_path / "companies.db")
+    cli.companies.put(
+        "BHP",
+        {
+            "name": "BHP Group Limited",
+            "sector": "Basic Materials",
+            "market_cap": 2.1e11,
+        },
+    )
+    loaded_cli.companies = cli.companies
+
+    cli.execute("info bhp")
+    cli.execute("info CBA")
+    loaded_cli.execute("sectors 2024")
+
+    out = capsys.readouterr().out
+    assert "BHP Group Limited" in out
+    assert "$210.00B" in out
+    assert "Error fetching info for CBA: offline" in out
+    assert "Basic Materials" in out
+
+
+def test_event_index_is_opt_in():
+    parser = build_parser()
+
+    assert parser.parse_args([]).index is None
+    assert parser.parse_args(["--index"]).index == DEFAULT_INDEX_PATH
+    assert parser.parse_args(["--index", "e.db"]).index.name == "e.db"
@@ -0,0 +1,146 @@
+"""Tests for the company info store and prefetch."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+
+from skim.analysis.company_info import (
+    CompanyStore,
+    parse_yahoo_info,
+    prefetch_company_info,
+    sector_performance,
+)
+
+NOW = datetime(2025, 6, 30, 18, 0)
+
+SECTORS = {"BHP": "Basic Materials", "CBA": "Financial Services"}
+
+
+class StandInYahoo:
+    """Yahoo Finance stand-in recording calls and concurrency."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+        self.failing: set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, ticker: str) -> dict | None:
+        with self.lock:
+            self.calls.append(ticker)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+
+        if ticker in self.failing:
+            raise ConnectionError("rate limited")
+        return parse_yahoo_info(
+            {
+                "longName": f"{ticker} Limited",
+                "sector": SECTORS.get(ticker, "Energy"),
+                "industry": "Other",
+                "marketCap": 2.5e9,
+            }
+            if not ticker.startswith("X")
+            else {"trailingPegRatio": None}
+        )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CompanyStore(tmp_path / "companies.db")
+    yield store
+    store.close()
+
+
+def prefetch(store, source, tickers, **kwargs):
+    kwargs = {"rate": 0, "now": NOW, **kwargs}
+    return asyncio.run(prefetch_company_info(store, tickers, source, **kwargs))
+
+
+def test_prefetch_fills_store_until_entries_expire(store):
+    source = StandInYahoo()
+
+    first = prefetch(store, source, ["bhp", "CBA", "XYZ"])
+    calls = sorted(source.calls)
+    second = prefetch(store, source, ["BHP", "CBA", "XYZ"])
+    later = prefetch(
+        store, source, ["BHP"], now=NOW + timedelta(days=8), concurrency=1
+    )
+
+    assert calls == ["BHP", "CBA", "XYZ"]
+    assert (first.fetched, first.missing, first.failed) == (2, 1, [])
+    # Unknown tickers are remembered as well
+    assert (second.fetched, second.missing) == (0, 0)
+    assert later.fetched == 1
+    assert source.calls[3:] == ["BHP"]
+
+    info = store.get("bhp")
+    assert info["name"] == "BHP Limited"
+    assert info["market_cap"] == 2.5e9
+    assert info["fetched_at"] == NOW + timedelta(days=8)
+    assert store.get("XYZ")["name"] is None
+    assert store.get("ABC") is None
+    assert store.frame()["ticker"].to_list() == ["BHP", "CBA"]
+
+
+def test_empty_response_keeps_known_company(store):
+    prefetch(store, StandInYahoo(), ["BHP"])
+
+    result = prefetch(
+        store, lambda ticker: None, ["BHP"], now=NOW + timedelta(days=8)
+    )
+
+    assert result.missing == 1
+    info = store.get("BHP")
+    assert info["name"] == "BHP Limited"
+    assert info["fetched_at"] == NOW + timedelta(days=8)
+    assert store.stale(["BHP"], now=NOW + timedelta(days=8)) == []
+
+
+def test_failed_fetches_stay_stale(store):
+    source = StandInYahoo()
+    source.failing = {"CBA"}
+
+    result = prefetch(store, source, ["BHP", "CBA"])
+
+    assert result.failed == ["CBA"]
+    assert store.stale(["BHP", "CBA"], now=NOW) == ["CBA"]
+
+
+def test_prefetch_bounds_calls_in_flight(store):
+    source = StandInYahoo()
+    tickers = [f"T{i:02d}" for i in range(12)]
+
+    result = prefetch(store, source, tickers, concurrency=3)
+
+    assert result.fetched == 12
+    assert 1 < source.max_in_flight <= 3
+
+
+def test_sector_performance_groups_returns(store):
+    store.put("BHP", parse_yahoo_info({"longName": "BHP", "sector": "Mat"}))
+    store.put("RIO", parse_yahoo_info({"longName": "RIO", "sector": "Mat"}))
+    store.put("CBA", parse_yahoo_info({"longName": "CBA", "sector": "Fin"}))
+    performance = pl.DataFrame(
+        {
+            "ticker": ["BHP", "RIO", "CBA", "NEW"],
+            "total_return": [10.0, -4.0, 2.0, 50.0],
+        }
+    )
+
+    sectors = sector_performance(performance, store.frame())
+
+    assert sectors["sector"].to_list() == ["Unknown", "Mat", "Fin"]
+    mat = sectors.row(1, named=True)
+    assert mat["stocks"] == 2
+    assert mat["median_return"] == pytest.approx(3.0)
+    assert mat["up_pct"] == pytest.approx(50.0)
+    assert mat["best"] == "BHP"
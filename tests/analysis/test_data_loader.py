@@ -0,0 +1,79 @@
+"""Unit tests for DataLoader filter pushdown."""
+
+import pytest
+
+from skim.analysis.data_loader import DataLoader, build_prefilter_plan
+from skim.analysis.stock_data import StockData
+from tests.analysis.factories import write_stock_csv
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    write_stock_csv(tmp_path / "GOD.csv", "GOD", [1.0] * 60, 100_000)
+    write_stock_csv(tmp_path / "CHP.csv", "CHP", [0.05] * 60, 100_000)
+    write_stock_csv(tmp_path / "ILQ.csv", "ILQ", [1.0] * 60, 1_000)
+    write_stock_csv(tmp_path / "LONG.csv", "LONG", [1.0] * 60, 100_000)
+    return tmp_path
+
+
+def test_prefilter_plan_uses_trailing_window(tmp_path):
+    path = tmp_path / "TRL.csv"
+    closes = [0.01] * 100 + [1.0] * 50
+    write_stock_csv(path, "TRL", closes, 60_000)
+
+    result = build_prefilter_plan(path, 0.20, 50_000).collect()
+
+    assert result.height == 1
+    assert result["latest_close"][0] == 1.0
+
+
+def test_prefilter_plan_dedupes_repeated_trailing_rows(tmp_path):
+    path = tmp_path / "DUP.csv"
+    write_stock_csv(path, "DUP", [1.0] * 60, 100_000)
+    lines = path.read_text().splitlines()
+    quiet = [line.replace(",100000", ",40000") for line in lines[30:]]
+    # The latest bar repeated, as an interrupted append leaves it
+    path.write_text("\n".join(lines[:30] + quiet + quiet[-1:] * 30) + "\n")
+    stock = StockData("DUP")
+    stock.load_from_csv(str(path))
+
+    result = build_prefilter_plan(path, 0.20, 50_000).collect()
+
+    # 20 bars at 100k and 30 at 40k average 64k once repeats are dropped
+    assert stock.filter_by_criteria(0.20, 50_000)
+    assert result["avg_volume"].to_list() == [64_000.0]
+    assert list(DataLoader(str(tmp_path)).load_all(quiet=True)) == ["DUP"]
+
+
+def test_prefilter_plan_reads_unordered_files_by_date(tmp_path):
+    path = tmp_path / "REV.csv"
+    write_stock_csv(path, "REV", [0.01] * 10 + [1.0] * 50, 60_000)
+    lines = path.read_text().splitlines()
+    path.write_text("\n".join(reversed(lines)) + "\n")
+
+    result = build_prefilter_plan(path, 0.20, 50_000).collect()
+
+    assert result["latest_close"].to_list() == [1.0]
+
+
+def test_load_all_keeps_only_liquid_stocks(data_dir):
+    loader = DataLoader(str(data_dir))
+
+    stocks = loader.load_all(quiet=True)
+
+    assert list(stocks) == ["GOD"]
+
+
+def test_rejected_stocks_are_never_fully_parsed(data_dir, monkeypatch):
+    parsed = []
+    original = StockData.load_from_csv
+
+    def tracking_load(self, filepath):
+        parsed.append(self.ticker)
+        original(self, filepath)
+
+    monkeypatch.setattr(StockData, "load_from_csv", tracking_load)
+
+    DataLoader(str(data_dir)).load_all(quiet=True)
+
+    assert parsed == ["GOD"]
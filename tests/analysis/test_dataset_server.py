@@ -0,0 +1,80 @@
+"""Unit tests for the shared-memory dataset server."""
+
+import pytest
+
+from skim.analysis.data_loader import DataLoader
+from skim.analysis.dataset_server import DatasetServer
+from skim.analysis.universe import attach_universe
+from tests.analysis.factories import write_stock_csv
+
+
+@pytest.fixture
+def server(tmp_path):
+    data_dir = tmp_path / "csv"
+    data_dir.mkdir()
+    write_stock_csv(
+        data_dir / "AAA.csv", "AAA", [1.0 + i / 100 for i in range(60)], 90_000
+    )
+    write_stock_csv(data_dir / "BBB.csv", "BBB", [2.0] * 70, 80_000)
+    write_stock_csv(data_dir / "CCC.csv", "CCC", [0.01] * 60, 80_000)
+    return DatasetServer(
+        data_dir=str(data_dir), shared_path=tmp_path / "shm" / "universe.arrow"
+    )
+
+
+def test_attach_reads_published_universe(server):
+    assert server.publish() == 2
+
+    stocks = DataLoader().attach(server.shared_path)
+
+    assert sorted(stocks) == ["AAA", "BBB"]
+    assert stocks["AAA"].df.height == 60
+    assert stocks["BBB"].df.height == 70
+    assert stocks["AAA"].df["close"][-1] == pytest.approx(1.59)
+    assert "cum_log_return" in stocks["AAA"].df.columns
+
+
+def test_attached_stocks_match_csv_load(server):
+    server.publish()
+    attached = DataLoader().attach(server.shared_path)
+    loaded = DataLoader(str(server.data_dir)).load_all(quiet=True)
+
+    for ticker, stock in loaded.items():
+        assert (
+            attached[ticker]
+            .df.select("date", "close", "volume")
+            .equals(stock.df.select("date", "close", "volume"))
+        )
+
+
+def test_close_removes_published_file(server):
+    server.publish()
+    server.close()
+
+    with pytest.raises(FileNotFoundError):
+        attach_universe(server.shared_path)
+
+
+def test_serve_forever_republishes_when_a_csv_is_removed(server, monkeypatch):
+    published = []
+    monkeypatch.setattr(
+        server, "publish", lambda: published.append(1) or len(published)
+    )
+    checks = iter(
+        [
+            lambda: (server.data_dir / "BBB.csv").unlink(),
+            lambda: None,
+        ]
+    )
+
+    def sleep(_):
+        try:
+            next(checks)()
+        except StopIteration:
+            raise KeyboardInterrupt from None
+
+    monkeypatch.setattr("skim.analysis.dataset_server.time.sleep", sleep)
+
+    server.serve_forever(refresh_interval=0)
+
+    assert len(published) == 2
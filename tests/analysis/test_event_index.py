@@ -0,0 +1,151 @@
+"""Unit tests for the persisted pattern event index."""
+
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from skim.analysis.event_index import EventIndex
+from skim.analysis.gap_scanner import GapScanner, gap_events
+from skim.analysis.momentum_scanner import (
+    MomentumScanner,
+    consolidations,
+    momentum_bursts,
+)
+from skim.analysis.universe import build_universe
+
+ALL_TIME = (date(2000, 1, 1), date(2100, 1, 1))
+
+PATTERNS = [
+    (
+        "gap",
+        gap_events,
+        {"gap_threshold": 1.0, "volume_multiplier": 0.0, "min_volume": 0},
+    ),
+    ("momentum_burst", momentum_bursts, {"min_days": 3}),
+    (
+        "consolidation",
+        consolidations,
+        {
+            "max_range_pct": 20.0,
+            "min_days": 5,
+            "volume_threshold": 1.0,
+            "merge": True,
+        },
+    ),
+]
+
+
+def _first_bars(universe, n):
+    return universe.filter(pl.int_range(pl.len()).over("ticker") < n)
+
+
+@pytest.mark.parametrize(("pattern", "detector", "params"), PATTERNS)
+def test_incremental_updates_match_full_build(
+    tmp_path, universe_stocks, pattern, detector, params
+):
+    universe = build_universe(universe_stocks)
+    full = EventIndex(tmp_path / "full.db")
+    incremental = EventIndex(tmp_path / "incremental.db")
+
+    full.update(pattern, detector, universe, params)
+    for bars in (120, 121, 200, 300):
+        incremental.update(
+            pattern, detector, _first_bars(universe, bars), params
+        )
+
+    schema = EventIndex._schema(detector, universe, params)
+    expected = full.query(pattern, *ALL_TIME, params, schema)
+    assert expected.height > 0
+    assert_frame_equal(
+        incremental.query(pattern, *ALL_TIME, params, schema), expected
+    )
+
+
+def test_update_skips_tickers_without_new_bars(tmp_path, universe_stocks):
+    universe = build_universe(universe_stocks)
+    index = EventIndex(tmp_path / "events.db")
+
+    assert index.update("momentum_burst", momentum_bursts, universe, {}) == 5
+    assert index.update("momentum_burst", momentum_bursts, universe, {}) == 0
+
+
+def test_query_returns_events_within_period(tmp_path, universe_stocks):
+    universe = build_universe(universe_stocks)
+    index = EventIndex(tmp_path / "events.db")
+    start, end = date(2024, 3, 1), date(2024, 6, 30)
+
+    events = index.events(
+        "momentum_burst", momentum_bursts, universe, start, end, {}
+    )
+
+    assert events.height > 0
+    assert events["start_date"].min() >= start
+    assert events["end_date"].max() <= end
+
+
+def test_scanners_answer_from_index(tmp_path, universe_stocks):
+    index = EventIndex(tmp_path / "events.db")
+    start, end = datetime(2024, 1, 1), datetime(2024, 10, 26)
+
+    indexed = MomentumScanner(universe_stocks, index=index)
+    scanned = MomentumScanner(universe_stocks)
+    gap_params = {"gap_threshold": 1.0, "volume_multiplier": 0.0}
+
+    assert_frame_equal(
+        indexed.find_all_momentum_bursts(start, end, limit=1000),
+        scanned.find_all_momentum_bursts(start, end, limit=1000),
+    )
+    assert_frame_equal(
+        GapScanner(universe_stocks, index=index).find_gaps(
+            start, end, **gap_params
+        ),
+        GapScanner(universe_stocks).find_gaps(start, end, **gap_params),
+    )
+    count = index.conn.execute("SELECT COUNT(*) FROM pattern_events")
+    assert count.fetchone()[0] > 0
+
+
+def test_queries_only_return_the_universe_tickers(tmp_path, universe_stocks):
+    index = EventIndex(tmp_path / "events.db")
+    start, end = datetime(2024, 1, 1), datetime(2024, 10, 26)
+    MomentumScanner(universe_stocks, index=index).find_all_momentum_bursts(
+        start, end, limit=1000
+    )
+    subset = {"AAA": universe_stocks["AAA"]}
+
+    indexed = MomentumScanner(
+        subset, index=EventIndex(tmp_path / "events.db")
+    ).find_all_momentum_bursts(start, end, limit=1000)
+
+    assert indexed.height > 0
+    assert set(indexed["ticker"]) == {"AAA"}
+    assert_frame_equal(
+        indexed,
+        MomentumScanner(subset).find_all_momentum_bursts(
+            start, end, limit=1000
+        ),
+    )
+
+
+def test_corrected_bars_are_rescanned(tmp_path, universe_stocks):
+    universe = build_universe(universe_stocks)
+    corrected = universe.with_columns(
+        pl.when((pl.col("ticker") == "BBB") & (pl.int_range(pl.len()) % 7 == 0))
+        .then(pl.col("close") * 1.5)
+        .otherwise(pl.col("close"))
+        .alias("close")
+    )
+    index = EventIndex(tmp_path / "events.db")
+    rebuilt = EventIndex(tmp_path / "rebuilt.db")
+
+    index.update("momentum_burst", momentum_bursts, universe, {})
+    assert index.update("momentum_burst", momentum_bursts, corrected, {}) == 1
+    rebuilt.update("momentum_burst", momentum_bursts, corrected, {})
+
+    schema = EventIndex._schema(momentum_bursts, universe, {})
+    assert_frame_equal(
+        index.query("momentum_burst", *ALL_TIME, {}, schema),
+        rebuilt.query("momentum_burst", *ALL_TIME, {}, schema),
+    )
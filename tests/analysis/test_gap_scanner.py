@@ -0,0 +1,98 @@
+"""Unit tests for vectorized gap detection."""
+
+import re
+from datetime import datetime
+
+import polars as pl
+import pytest
+from rich.console import Console
+
+from skim.analysis.gap_scanner import GapScanner
+from skim.analysis.results import to_records
+from tests.analysis.factories import make_stock
+
+
+def _legacy_gaps(stock, start, end, threshold, multiplier, min_volume):
+    """Row-by-row reference implementation of the original scanner."""
+    period = stock.df.filter(
+        (pl.col("date") >= start) & (pl.col("date") <= end)
+    )
+    gaps = []
+    for i in range(1, len(period)):
+        current = period.row(i, named=True)
+        previous = period.row(i - 1, named=True)
+        gap = (current["open"] - previous["close"]) / previous["close"] * 100
+        if gap < threshold:
+            continue
+        history = stock.df.filter(pl.col("date") < current["date"])
+        avg = history["volume"].tail(50).mean() if len(history) >= 50 else 0.0
+        multiple = current["volume"] / avg if avg > 0 else 0
+        if current["volume"] >= min_volume and multiple >= multiplier:
+            gaps.append((stock.ticker, current["date"], gap, avg, multiple))
+    return gaps
+
+
+def test_matches_row_by_row_scan(universe_stocks):
+    scanner = GapScanner(universe_stocks)
+    start, end = datetime(2024, 3, 1), datetime(2024, 9, 30)
+
+    gaps = scanner.find_gaps(start, end, 10.0, 1.0, 50_000)
+
+    expected = [
+        g
+        for stock in universe_stocks.values()
+        for g in _legacy_gaps(stock, start, end, 10.0, 1.0, 50_000)
+    ]
+    assert gaps.height == len(expected) > 0
+    got = {(g["ticker"], g["date"]): g for g in gaps.iter_rows(named=True)}
+    for ticker, date, gap, avg, multiple in expected:
+        row = got[(ticker, date)]
+        assert row["gap_percent"] == pytest.approx(gap)
+        assert row["avg_volume_50d"] == pytest.approx(avg)
+        assert row["volume_multiple"] == pytest.approx(multiple)
+    assert gaps["gap_percent"].is_sorted(descending=True)
+
+
+def test_first_bar_of_period_is_not_a_gap():
+    closes = [1.0] * 60
+    opens = [1.0] * 59 + [1.5]
+    volumes = [100_000] * 59 + [500_000]
+    stock = make_stock("GAP", closes, volumes, opens=opens)
+    scanner = GapScanner({"GAP": stock})
+    gap_day = stock.df["date"][-1]
+
+    inside = scanner.find_gaps(datetime(2024, 1, 1), datetime(2024, 12, 31))
+    edge = scanner.find_gaps(gap_day, gap_day)
+
+    assert inside["date"].to_list() == [gap_day]
+    assert inside["volume_multiple"][0] == pytest.approx(5.0)
+    assert edge.is_empty()
+
+
+def test_display_renders_only_shown_rows(universe_stocks):
+    scanner = GapScanner(universe_stocks)
+    gaps = scanner.find_gaps(
+        datetime(2024, 1, 1),
+        datetime(2024, 12, 31),
+        gap_threshold=1.0,
+        volume_multiplier=0.0,
+        min_volume=0,
+    )
+    console = Console(record=True, width=120)
+
+    scanner.display_gaps(gaps, console)
+
+    assert gaps.height > 50
+    shown = re.findall(r"\d{4}-\d{2}-\d{2}", console.export_text())
+    assert len(shown) == 50
+
+
+def test_legacy_records_adapter(universe_stocks):
+    gaps = GapScanner(universe_stocks).find_gaps(
+        datetime(2024, 1, 1), datetime(2024, 12, 31)
+    )
+
+    records = to_records(gaps)
+
+    assert records == gaps.to_dicts()
+    assert to_records(records) is records
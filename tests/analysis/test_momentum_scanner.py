@@ -0,0 +1,306 @@
+"""Unit tests for vectorized momentum pattern detection."""
+
+from datetime import datetime
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from skim.analysis.momentum_scanner import (
+    MomentumScanner,
+    PatternCache,
+    analyze_distribution,
+    consolidations,
+)
+from skim.analysis.universe import build_universe
+from tests.analysis.factories import make_stock
+
+
+def _legacy_bursts(stock, min_days, start, end):
+    """Loop-based reference implementation of the original burst detector."""
+    df = stock.df.filter((pl.col("date") >= start) & (pl.col("date") <= end))
+    closes = df["close"].to_list()
+    volumes = df["volume"].to_list()
+    dates = df["date"].to_list()
+    bursts = []
+
+    def add(s, e, n):
+        avg = sum(v for v in volumes[s : e + 1] if v is not None) / (e - s + 1)
+        base_start = max(0, s - 50)
+        count = s - base_start
+        base = sum(volumes[base_start:s]) / count if count > 0 else avg
+        gains = [
+            (closes[j] - closes[j - 1]) / closes[j - 1] * 100
+            for j in range(s + 1, e + 1)
+        ]
+        bursts.append(
+            {
+                "ticker": stock.ticker,
+                "start_date": dates[s],
+                "end_date": dates[e],
+                "duration_days": n,
+                "total_gain_pct": (closes[e] - closes[s]) / closes[s] * 100,
+                "daily_gains": gains,
+                "avg_volume": int(avg),
+                "volume_spike_multiple": round(
+                    avg / base if base > 0 else 1.0, 2
+                ),
+            }
+        )
+
+    run, begin = 0, None
+    for i in range(1, len(closes)):
+        up = (
+            closes[i] is not None
+            and closes[i - 1] is not None
+            and closes[i] > closes[i - 1]
+        )
+        if up:
+            run += 1
+            begin = i - 1 if begin is None else begin
+            continue
+        if run >= min_days:
+            add(begin, i - 1, run)
+        run, begin = 0, None
+    if run >= min_days:
+        add(begin, len(closes) - 1, run)
+    return bursts
+
+
+def _legacy_consolidations(stock, max_range, min_days, threshold):
+    """Loop-based reference implementation of the original window scan."""
+    df = stock.df
+    closes, volumes = df["close"].to_list(), df["volume"].to_list()
+    highs, lows = df["high"].to_list(), df["low"].to_list()
+    found = []
+    for i in range(len(closes) - min_days + 1):
+        end = i + min_days
+        hi, lo = max(highs[i:end]), min(lows[i:end])
+        range_pct = (hi - lo) / ((hi + lo) / 2) * 100
+        if range_pct > max_range:
+            continue
+        avg = sum(volumes[i:end]) / min_days
+        base = sum(volumes[max(0, i - 50) : i]) / min(50, i) if i > 0 else avg
+        ratio = avg / base if base > 0 else 1.0
+        if ratio <= threshold:
+            found.append((df["date"][i], round(range_pct, 2), round(ratio, 2)))
+    return found
+
+
+def test_bursts_match_loop_reference(universe_stocks):
+    scanner = MomentumScanner(universe_stocks)
+    start, end = datetime(2024, 2, 1), datetime(2024, 10, 1)
+
+    for stock in universe_stocks.values():
+        got = scanner.detect_momentum_bursts(
+            stock, min_days=3, start_date=start, end_date=end
+        )
+        want = _legacy_bursts(stock, 3, start, end)
+
+        assert len(got) == len(want)
+        for g, w in zip(got, want, strict=True):
+            for key in (
+                "start_date",
+                "end_date",
+                "duration_days",
+                "avg_volume",
+            ):
+                assert g[key] == w[key]
+            assert g["total_gain_pct"] == pytest.approx(w["total_gain_pct"])
+            assert g["daily_gains"] == pytest.approx(w["daily_gains"])
+            assert g["volume_spike_multiple"] == pytest.approx(
+                w["volume_spike_multiple"], abs=0.011
+            )
+
+
+def test_missing_close_breaks_a_run():
+    stock = make_stock("NUL", [1.0, 1.1, 1.2, None, 1.3, 1.4, 1.5, 1.6])
+    scanner = MomentumScanner({"NUL": stock})
+
+    bursts = scanner.detect_momentum_bursts(stock, min_days=2)
+
+    assert [(b["start_price"], b["end_price"]) for b in bursts] == [
+        (1.0, 1.2),
+        (1.3, 1.6),
+    ]
+    assert bursts[1]["consecutive_up_days"] == 3
+
+
+def test_find_all_momentum_bursts_ranks_by_gain(universe_stocks):
+    scanner = MomentumScanner(universe_stocks)
+
+    bursts = scanner.find_all_momentum_bursts(
+        datetime(2024, 1, 1), datetime(2024, 12, 31), limit=5
+    )
+
+    assert bursts.height == 5
+    gains = bursts["total_gain_pct"].to_list()
+    assert gains == sorted(gains, reverse=True)
+    assert bursts["daily_gains"].dtype == pl.List(pl.Float64)
+    assert bursts["pattern_type"][0] == "momentum_burst"
+
+
+@pytest.fixture
+def quiet_stock():
+    """Trending stock with two quiet, flat stretches."""
+    closes = [1.0 + 0.02 * i for i in range(60)]
+    closes += [2.2] * 12
+    closes += [2.2 + 0.05 * i for i in range(20)]
+    closes += [3.2] * 8
+    volumes = [200_000] * 60 + [40_000] * 12 + [200_000] * 20 + [30_000] * 8
+    return make_stock("QQQ", closes, volumes)
+
+
+def test_raw_windows_match_loop_reference(universe_stocks, quiet_stock):
+    stocks = dict(universe_stocks, QQQ=quiet_stock)
+    scanner = MomentumScanner(stocks)
+
+    for stock in stocks.values():
+        got = scanner.detect_consolidation(
+            stock, max_range_pct=15.0, volume_threshold=0.8, merge=False
+        )
+        want = _legacy_consolidations(stock, 15.0, 5, 0.8)
+
+        assert [
+            (c["start_date"], c["price_range_pct"], c["volume_ratio_to_avg"])
+            for c in got
+        ] == want
+
+
+def test_overlapping_windows_merge_into_intervals(quiet_stock):
+    scanner = MomentumScanner({"QQQ": quiet_stock})
+
+    raw = scanner.detect_consolidation(quiet_stock, merge=False)
+    merged = scanner.detect_consolidation(quiet_stock)
+
+    intervals = []
+    for window in raw:
+        if intervals and window["start_date"] <= intervals[-1][1]:
+            intervals[-1][1] = window["end_date"]
+        else:
+            intervals.append([window["start_date"], window["end_date"]])
+
+    assert len(raw) > len(merged) == 2
+    assert [[c["start_date"], c["end_date"]] for c in merged] == intervals
+    for c in merged:
+        covered = [
+            w
+            for w in raw
+            if c["start_date"] <= w["start_date"] <= c["end_date"]
+        ]
+        assert c["duration_days"] == (c["end_date"] - c["start_date"]).days + 1
+        assert c["high"] == pytest.approx(max(w["high"] for w in covered))
+        assert c["low"] == pytest.approx(min(w["low"] for w in covered))
+
+
+def test_merged_spans_that_drift_out_of_range_are_split():
+    closes = [1.0 + 0.02 * i for i in range(60)]
+    closes += [2.0 + 0.03 * i for i in range(9)]
+    closes += [3.0 + 0.1 * i for i in range(10)]
+    volumes = [200_000] * 60 + [40_000] * 9 + [200_000] * 10
+    stock = make_stock("DRF", closes, volumes)
+    scanner = MomentumScanner({"DRF": stock})
+
+    raw = scanner.detect_consolidation(stock, merge=False)
+    merged = scanner.detect_consolidation(stock)
+
+    # Each window qualifies, but their union ranges over 13%
+    assert len(raw) == 5
+    assert [(c["start_date"].day, c["end_date"].day) for c in merged] == [
+        (1, 6),
+        (3, 8),
+        (5, 9),
+    ]
+    for c in merged:
+        assert c["price_range_pct"] <= 10.0
+        assert c["volume_ratio_to_avg"] <= 0.5
+    for w in raw:
+        assert any(
+            c["start_date"] <= w["start_date"]
+            and w["end_date"] <= c["end_date"]
+            for c in merged
+        )
+
+
+def test_split_spans_are_per_ticker_in_a_universe_scan(quiet_stock):
+    closes = [1.0 + 0.02 * i for i in range(60)]
+    closes += [2.0 + 0.03 * i for i in range(9)]
+    closes += [3.0 + 0.1 * i for i in range(10)]
+    volumes = [200_000] * 60 + [40_000] * 9 + [200_000] * 10
+    drift = make_stock("DRF", closes, volumes)
+    stocks = {"DRF": drift, quiet_stock.ticker: quiet_stock}
+
+    universe = consolidations(build_universe(stocks))
+    alone = consolidations(build_universe({"DRF": drift}))
+
+    assert_frame_equal(universe.filter(pl.col("ticker") == "DRF"), alone)
+    assert universe["ticker"].n_unique() == 2
+
+
+def test_find_all_consolidations_ranks_by_duration(quiet_stock):
+    scanner = MomentumScanner({"QQQ": quiet_stock})
+
+    found = scanner.find_all_consolidations(
+        datetime(2024, 1, 1), datetime(2024, 12, 31)
+    )
+
+    durations = found["duration_days"].to_list()
+    assert found.height == 2
+    assert durations == sorted(durations, reverse=True)
+    assert found["pattern_type"][0] == "consolidation"
+
+
+def test_repeated_scans_reuse_cached_patterns(universe_stocks):
+    scanner = MomentumScanner(universe_stocks)
+    start, end = datetime(2024, 1, 1), datetime(2024, 10, 26)
+
+    first = scanner.find_all_momentum_bursts(start, end, limit=5)
+    second = scanner.find_all_momentum_bursts(start, end, limit=10)
+
+    assert_frame_equal(second.head(5), first)
+    assert scanner.cache.hits == 1
+    assert len(scanner.cache) == 1
+
+
+def test_move_statistics_share_cached_scans(universe_stocks):
+    scanner = MomentumScanner(universe_stocks)
+    start, end = datetime(2024, 1, 1), datetime(2024, 10, 26)
+    bursts = scanner.find_all_momentum_bursts(start, end, limit=1000)
+
+    stats = scanner.get_move_statistics(start, end)
+
+    assert scanner.cache.hits == 1
+    momentum = stats["momentum_bursts"]
+    durations = bursts["duration_days"]
+    assert momentum["total_count"] == bursts.height
+    assert momentum["max_duration_days"] == durations.max()
+    assert momentum["avg_duration_days"] == round(durations.mean(), 2)
+    assert sum(momentum["duration_distribution"].values()) == bursts.height
+
+
+def test_pattern_cache_evicts_least_recently_used():
+    cache = PatternCache(max_entries=2)
+    frame = pl.DataFrame({"x": [1, 2, 3]})
+
+    cache.put("a", frame)
+    cache.put("b", frame)
+    cache.get("a")
+    cache.put("c", frame)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+
+
+def test_analyze_distribution_bins_durations():
+    durations = pl.Series("duration_days", [2, 3, 4, 5, 7, 12])
+
+    result = analyze_distribution(durations, [3, 4, 5, 10])
+
+    assert list(result.items()) == [
+        ("1-3_days", 2),
+        ("4_days", 1),
+        ("5_days", 1),
+        ("6+_days", 1),
+        ("11+_days", 1),
+    ]
@@ -0,0 +1,12 @@
+"""Unit tests for process-pool frame transport."""
+
+from polars.testing import assert_frame_equal
+
+from skim.analysis.parallel import from_ipc_bytes, to_ipc_bytes
+from skim.analysis.universe import build_universe
+
+
+def test_ipc_round_trip_preserves_frame(universe_stocks):
+    universe = build_universe(universe_stocks)
+
+    assert_frame_equal(from_ipc_bytes(to_ipc_bytes(universe)), universe)
@@ -0,0 +1,96 @@
+"""Unit tests for vectorized performance ranking."""
+
+from datetime import datetime
+
+import pytest
+
+from skim.analysis.performance import PerformanceCalculator
+from tests.analysis.factories import make_stock
+
+
+def _legacy_top(stocks, start, end, limit, min_price, min_volume):
+    results = []
+    for stock in stocks.values():
+        metrics = stock.calculate_returns_over_period(start, end)
+        if (
+            metrics
+            and metrics.get("total_return") is not None
+            and metrics["start_price"] >= min_price
+            and metrics["avg_volume"] >= min_volume
+        ):
+            results.append(metrics)
+    results.sort(key=lambda x: x["total_return"], reverse=True)
+    return results[:limit]
+
+
+def test_matches_per_ticker_metrics(universe_stocks):
+    calc = PerformanceCalculator(universe_stocks)
+    start, end = datetime(2024, 2, 1), datetime(2024, 6, 30)
+
+    results = calc.find_top_performers(start, end, limit=3, min_volume=0)
+    expected = _legacy_top(universe_stocks, start, end, 3, 0.20, 0)
+
+    assert results["ticker"].to_list() == [e["ticker"] for e in expected]
+    for got, want in zip(results.iter_rows(named=True), expected, strict=True):
+        assert got["total_return"] == pytest.approx(want["total_return"])
+        assert got["avg_volume"] == pytest.approx(want["avg_volume"])
+        assert got["volatility"] == pytest.approx(want["volatility"])
+        assert got["days"] == want["days"]
+
+
+def test_applies_price_and_volume_filters():
+    stocks = {
+        "LOW": make_stock("LOW", [0.10, 0.20, 0.30]),
+        "THN": make_stock("THN", [1.0, 2.0, 3.0], volumes=[10, 10, 10]),
+        "OKK": make_stock("OKK", [1.0, 1.1, 1.2]),
+    }
+    calc = PerformanceCalculator(stocks)
+
+    results = calc.find_top_performers(
+        datetime(2024, 1, 1), datetime(2024, 1, 31)
+    )
+
+    assert results["ticker"].to_list() == ["OKK"]
+    assert results["total_return"][0] == pytest.approx(20.0)
+
+
+def test_skips_single_bar_windows():
+    stocks = {"ONE": make_stock("ONE", [1.0, 1.5])}
+    calc = PerformanceCalculator(stocks)
+
+    results = calc.find_top_performers(
+        datetime(2024, 1, 2), datetime(2024, 1, 31)
+    )
+
+    assert results.is_empty()
+
+
+def test_returns_matrix_matches_window_returns(universe_stocks):
+    calc = PerformanceCalculator(universe_stocks)
+    reference = datetime(2024, 10, 1)
+
+    matrix = calc.returns_matrix(
+        tickers=["aaa", "CCC"],
+        periods=["1M", "3M", "2024-02"],
+        reference_date=reference,
+    )
+
+    assert matrix.columns == ["ticker", "1M", "3M", "2024-02"]
+    assert matrix["ticker"].to_list() == ["AAA", "CCC"]
+    for row in matrix.iter_rows(named=True):
+        stock = universe_stocks[row["ticker"]]
+        assert row["3M"] == pytest.approx(
+            stock.calculate_return(datetime(2024, 7, 3), reference)
+        )
+        assert row["2024-02"] == pytest.approx(
+            stock.calculate_return(datetime(2024, 2, 1), datetime(2024, 2, 29))
+        )
+
+
+def test_returns_matrix_defaults_to_latest_bar():
+    stocks = {"UPP": make_stock("UPP", [1.0] * 20 + [2.0])}
+    calc = PerformanceCalculator(stocks)
+
+    matrix = calc.returns_matrix(periods=["1M"])
+
+    assert matrix["1M"][0] == pytest.approx(100.0)
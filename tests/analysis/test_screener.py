@@ -0,0 +1,79 @@
+"""Unit tests for the screen expression language."""
+
+from datetime import date
+
+import pytest
+
+from skim.analysis.screener import Screen, Screener
+from tests.analysis.factories import make_stock
+
+
+@pytest.fixture
+def screener():
+    flat = [1.0] * 70
+    stocks = {
+        "RUN": make_stock(
+            "RUN", flat[:6] + [1.0 + 0.01 * i for i in range(64)]
+        ),
+        "FLT": make_stock("FLT", flat),
+        "GAP": make_stock(
+            "GAP",
+            flat,
+            volumes=[300_000] * 70,
+            opens=flat[:65] + [1.08] + flat[:4],
+        ),
+    }
+    return Screener(stocks)
+
+
+def test_window_features_match_per_ticker_values(universe_stocks):
+    screener = Screener(universe_stocks)
+
+    result = screener.screen("return_3m > -100%, avg_volume_50d >= 0")
+
+    assert result.height == len(universe_stocks)
+    for row in result.iter_rows(named=True):
+        df = universe_stocks[row["ticker"]].df
+        closes = df["close"]
+        assert row["return_3m"] == pytest.approx(
+            (closes[-1] / closes[-64] - 1) * 100
+        )
+        assert row["avg_volume_50d"] == pytest.approx(
+            df["volume"].tail(50).mean()
+        )
+    returns = result["return_3m"].to_list()
+    assert returns == sorted(returns, reverse=True)
+
+
+def test_conditions_combine_with_and_or_not(screener):
+    def tickers(expression):
+        return sorted(screener.screen(expression)["ticker"])
+
+    assert tickers("return_3m > 30%") == ["RUN"]
+    assert tickers("max_gap_10d > 5%, avg_volume_50d > 200k") == ["GAP"]
+    assert tickers("return_3m > 30% or max_gap_2w > 5%") == ["GAP", "RUN"]
+    assert tickers("not (return_3m > 30% or max_gap_10d > 5%)") == ["FLT"]
+    assert tickers("from_high_20d > -1.5% and up_days_5d == 5") == ["RUN"]
+
+
+def test_as_of_evaluates_history(screener):
+    assert screener.screen("max_gap_10d > 5%").height == 1
+    assert screener.screen(
+        "max_gap_10d > 5%", as_of=date(2024, 1, 30)
+    ).is_empty()
+
+
+@pytest.mark.parametrize(
+    ("expression", "message"),
+    [
+        ("", "Empty screen"),
+        ("return_3x > 1", "Unknown feature"),
+        ("close >", "Unexpected end"),
+        ("(close > 1", "Missing closing parenthesis"),
+        ("close ~ 1", "Unexpected character"),
+        ("1 > 0", "at least one feature"),
+    ],
+)
+def test_invalid_screens_raise(expression, message):
+    with pytest.raises(ValueError, match=message):
+        Screen(expression)
@@ -0,0 +1,57 @@
+"""Unit tests for StockData window lookups."""
+
+from datetime import datetime
+
+import pytest
+
+from tests.analysis.factories import make_stock
+
+
+def test_window_return_uses_cumulative_log_returns():
+    stock = make_stock("WIN", [1.0, 1.2, None, 1.5, 1.8])
+
+    result = stock.calculate_return(datetime(2024, 1, 2), datetime(2024, 1, 5))
+
+    assert "cum_log_return" in stock.df.columns
+    assert result == pytest.approx(50.0)
+
+
+def test_window_bounds_excludes_out_of_range_dates():
+    stock = make_stock("WIN", [1.0, 1.1, 1.2])
+
+    assert stock.window_bounds(datetime(2024, 1, 2), datetime(2024, 3, 1)) == (
+        1,
+        2,
+    )
+    assert (
+        stock.window_bounds(datetime(2025, 1, 1), datetime(2025, 2, 1)) is None
+    )
+
+
+def test_returns_over_period_averages_volume_from_cumulative_sums():
+    stock = make_stock("VOL", [1.0, 2.0, 3.0, 4.0], volumes=[10, 20, 30, 40])
+
+    metrics = stock.calculate_returns_over_period(
+        datetime(2024, 1, 2), datetime(2024, 1, 4)
+    )
+
+    assert metrics["avg_volume"] == pytest.approx(30.0)
+    assert metrics["total_return"] == pytest.approx(100.0)
+    assert metrics["days"] == 3
+
+
+def test_average_volume_skips_days_without_volume():
+    stock = make_stock("VOL", [1.0, 2.0, 3.0, 4.0], volumes=[10, None, 30, 40])
+
+    metrics = stock.calculate_returns_over_period(
+        datetime(2024, 1, 1), datetime(2024, 1, 3)
+    )
+
+    assert metrics["avg_volume"] == pytest.approx(20.0)
+    assert "cum_traded_days" in stock.df.columns
+
+    from_gap = stock.calculate_returns_over_period(
+        datetime(2024, 1, 2), datetime(2024, 1, 4)
+    )
+
+    assert from_gap["avg_volume"] == pytest.approx(35.0)
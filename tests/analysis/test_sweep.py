@@ -0,0 +1,122 @@
+"""Unit tests for the parameter sweep engine."""
+
+from datetime import date
+
+import polars as pl
+import pytest
+
+from skim.analysis.backtest import Backtester
+from skim.analysis.sweep import (
+    default_point,
+    evaluate_point,
+    grid_points,
+    parse_parameter,
+    prepare_candidates,
+    random_points,
+    run_sweep,
+)
+from skim.trading.core.config import ScannerConfig
+
+START, END = date(2024, 2, 1), date(2024, 9, 30)
+
+
+def test_parse_parameter_forms():
+    assert parse_parameter("gap_threshold=5,9.5") == (
+        "gap_threshold",
+        [5.0, 9.5],
+    )
+    assert parse_parameter("volume_filter=0:20000:10000") == (
+        "volume_filter",
+        [0, 10000, 20000],
+    )
+    assert parse_parameter("min_3month_return=-20:50") == (
+        "min_3month_return",
+        (-20.0, 50.0),
+    )
+
+    for spec in ["gap_threshold", "nope=1", "gap_threshold=a", "gap=1:2:0"]:
+        with pytest.raises(ValueError):
+            parse_parameter(spec)
+
+
+def test_grid_and_random_points():
+    specs = dict(
+        [
+            parse_parameter("gap_threshold=5,9"),
+            parse_parameter("price_filter=1,2"),
+        ]
+    )
+
+    grid = grid_points(specs)
+
+    assert len(grid) == 4
+    assert grid[0] == {
+        **default_point(),
+        "gap_threshold": 5.0,
+        "price_filter": 1.0,
+    }
+
+    ranged = {"min_3month_return": (-20.0, 50.0)}
+    with pytest.raises(ValueError):
+        grid_points(ranged)
+    points = random_points(ranged, 10, seed=3)
+    assert points == random_points(ranged, 10, seed=3)
+    assert all(-20 <= p["min_3month_return"] <= 50 for p in points)
+
+
+@pytest.mark.parametrize("threshold", [5.0, 9.0])
+def test_point_matches_backtest(universe_stocks, threshold):
+    backtester = Backtester(universe_stocks)
+    candidates = prepare_candidates(backtester.universe, START, END, 5.0)
+
+    stats = evaluate_point(
+        candidates, {**default_point(), "gap_threshold": threshold}
+    )
+
+    trades = backtester.run(
+        START, END, ScannerConfig(gap_threshold=threshold)
+    ).trades
+    assert trades.height > 0
+    assert stats["trades"] == trades.height
+    assert stats["total_pnl"] == pytest.approx(trades["pnl"].sum())
+
+
+def test_history_bounds_require_three_month_data(universe_stocks):
+    candidates = prepare_candidates(
+        Backtester(universe_stocks).universe, date(2023, 1, 1), END, 5.0
+    )
+    point = {**default_point(), "gap_threshold": 5.0}
+
+    unfiltered = evaluate_point(candidates, point)
+    bounded = evaluate_point(candidates, {**point, "min_3month_return": -100.0})
+
+    with_history = candidates.filter(
+        (pl.col("gap_percent") >= 5.0)
+        & (pl.col("prev_volume") >= 10000)
+        & pl.col("return_3m").is_not_null()
+    )
+    assert bounded["trades"] == with_history.height
+    assert bounded["trades"] < unfiltered["trades"]
+
+
+def test_sweep_writes_and_resumes(universe_stocks, tmp_path):
+    universe = Backtester(universe_stocks).universe
+    out = tmp_path / "sweep.parquet"
+    points = grid_points({"gap_threshold": [5.0, 9.0, 12.0]})
+
+    first = run_sweep(universe, points[:2], START, END, out_path=out)
+    seen = []
+    second = run_sweep(
+        universe,
+        points,
+        START,
+        END,
+        out_path=out,
+        progress=lambda done, total: seen.append((done, total)),
+    )
+
+    assert first.height == 2
+    assert second.height == 3
+    assert second["total_pnl"].is_sorted(descending=True)
+    assert seen == [(3, 3)]
+    assert pl.read_parquet(out).height == 3
@@ -1,10 +1,11 @@
 """Tests for strategy registry"""
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
-from skim.domain.strategies.base import Strategy
+from skim.domain.strategies.base import Strategy, shutdown_strategies
 from skim.domain.strategies.context import StrategyContext
 from skim.domain.strategies.registry import (
     StrategyRegistry,
@@ -122,3 +123,23 @@ class TestGlobalRegistry:
         """Test that global registry is instantiated"""
         assert registry is not None
         assert isinstance(registry, StrategyRegistry)
+
+
+class TestShutdownStrategies:
+    """Tests for shutting strategies down"""
+
+    def test_failed_shutdown_does_not_skip_the_rest(self):
+        """Test every strategy is shut down even if one raises"""
+        shut_down = []
+
+        class ClosingStrategy(MockStrategy):
+            async def shutdown(self) -> None:
+                shut_down.append(self.name)
+                if self.name == "broken":
+                    raise RuntimeError("worker pool already gone")
+
+        strategies = [ClosingStrategy("broken"), ClosingStrategy("orh")]
+
+        asyncio.run(shutdown_strategies(strategies))
+
+        assert shut_down == ["broken", "orh"]
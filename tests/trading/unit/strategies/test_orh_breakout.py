@@ -12,6 +12,7 @@ def mock_strategy():
     """Create a mock ORHBreakoutStrategy for testing."""
     mock_config = Mock()
     mock_config.scanner_config.gap_threshold = 9.0
+    mock_config.scanner_config.announcement_pdfs = False
     mock_config.historical_config.enable_filtering = False
 
     mock_repo = Mock()
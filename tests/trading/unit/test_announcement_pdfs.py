@@ -0,0 +1,209 @@
+"""Tests for announcement PDF download and summaries"""
+
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from skim.trading.scanners import NewsScanner
+from skim.trading.scanners.announcement_pdfs import (
+    AnnouncementPdfSummarizer,
+    summarize,
+)
+from skim.trading.validation.scanners import ASXAnnouncement
+
+pytest.importorskip("pypdf")
+
+
+def make_pdf(text: str) -> bytes:
+    """Build a one-page PDF showing the given text"""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return pdf
+
+
+class StandInAsx(ThreadingHTTPServer):
+    """Serves announcement display pages and PDFs, recording requests"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.requests: list[str] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server: StandInAsx
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path.startswith("/display"):
+            body = (
+                b"<html><form><input name='pdfURL' "
+                b"value='/asxpdf/placement.pdf'></form></html>"
+            )
+        elif self.path == "/asxpdf/placement.pdf":
+            body = make_pdf("Placement to raise 12 million dollars")
+        elif self.path == "/asxpdf/slow.pdf":
+            time.sleep(4)
+            body = make_pdf("Too late")
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        try:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except ConnectionError:
+            # The client gave up on a slow response
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = StandInAsx()
+    thread = threading.Thread(
+        target=server.serve_forever, args=(0.05,), daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def summarizer(tmp_path):
+    with AnnouncementPdfSummarizer(
+        tmp_path / "pdfs", workers=1, time_budget=3.0
+    ) as summarizer:
+        yield summarizer
+    assert summarizer._pool is None
+
+
+def test_display_pages_resolve_to_cached_pdfs(site, summarizer):
+    url = f"{site.url}/display?idsId=1"
+
+    first = asyncio.run(summarizer.summarize_all([url, url]))
+    second = asyncio.run(summarizer.summarize_all([url]))
+
+    assert first == {url: "Placement to raise 12 million dollars"}
+    assert second == first
+    assert site.requests == ["/display?idsId=1", "/asxpdf/placement.pdf"]
+    assert summarizer.cache_path(url).read_bytes().startswith(b"%PDF")
+
+
+def test_unfinished_announcements_are_dropped_at_budget(site, summarizer):
+    fast = f"{site.url}/asxpdf/placement.pdf"
+    summarizer.time_budget = 2.5
+
+    started = time.monotonic()
+    summaries = asyncio.run(
+        summarizer.summarize_all(
+            [f"{site.url}/asxpdf/slow.pdf", f"{site.url}/missing", fast]
+        )
+    )
+
+    assert time.monotonic() - started < 3.0
+    assert list(summaries) == [fast]
+
+
+# Waits out a worker spawn per batch on top of the budget
+@pytest.mark.timeout(15)
+def test_running_extraction_is_abandoned_at_budget(tmp_path):
+    slow, fast = "https://asx.test/slow", "https://asx.test/fast"
+    with AnnouncementPdfSummarizer(
+        tmp_path / "pdfs", workers=1, time_budget=1.0
+    ) as summarizer:
+        summarizer.cache_dir.mkdir()
+        # Seconds of text extraction for a single page
+        summarizer.cache_path(slow).write_bytes(
+            make_pdf(") Tj T* (".join(["word"] * 60_000))
+        )
+        summarizer.cache_path(fast).write_bytes(make_pdf("Trading halt lifted"))
+
+        assert asyncio.run(summarizer.summarize_all([slow])) == {}
+        assert summarizer._pool is None
+
+        summarizer.time_budget = 3.0
+        assert asyncio.run(summarizer.summarize_all([fast])) == {
+            fast: "Trading halt lifted"
+        }
+
+
+def test_cache_drops_old_pdfs(tmp_path):
+    summarizer = AnnouncementPdfSummarizer(tmp_path, cache_days=7)
+    old, new = tmp_path / "old.pdf", tmp_path / "new.pdf"
+    old.write_bytes(b"%PDF")
+    new.write_bytes(b"%PDF")
+    week_ago = time.time() - 8 * 86400
+    os.utime(old, (week_ago, week_ago))
+
+    assert summarizer.prune_cache() == 1
+    assert not old.exists()
+    assert new.exists()
+
+
+def test_summary_cuts_at_word_boundary():
+    text = "Trading  halt\nrequested pending   an announcement"
+
+    assert summarize(text) == "Trading halt requested pending an announcement"
+    assert summarize(text, max_chars=26) == "Trading halt requested..."
+
+
+def test_news_candidates_carry_pdf_summaries():
+    class StubAsx:
+        def fetch_price_sensitive_announcements(self):
+            return [
+                ASXAnnouncement(
+                    ticker=ticker,
+                    headline=f"{ticker} placement completed",
+                    announcement_type="pricesens",
+                    timestamp=datetime(2025, 6, 30, 9, 30),
+                    pdf_url=f"https://asx.test/{ticker}",
+                )
+                for ticker in ("ABC", "XYZ")
+            ]
+
+    class StubSummarizer:
+        async def summarize_all(self, urls):
+            return {"https://asx.test/ABC": "Raised $12m"}
+
+    scanner = NewsScanner(pdf_summarizer=StubSummarizer())
+    scanner.asx_scanner = StubAsx()
+
+    candidates = asyncio.run(scanner.scan())
+
+    assert [(c.ticker.symbol, c.summary) for c in candidates] == [
+        ("ABC", "Raised $12m"),
+        ("XYZ", None),
+    ]
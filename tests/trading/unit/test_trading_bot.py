@@ -63,6 +63,7 @@ def mock_trading_bot(mock_bot_config):
         mock_strategy.trade = AsyncMock(return_value=0)
         mock_strategy.manage = AsyncMock(return_value=0)
         mock_strategy.health_check = AsyncMock(return_value=True)
+        mock_strategy.shutdown = AsyncMock()
         mock_registry.list_available.return_value = ["orh_breakout"]
         mock_registry.get.return_value = mock_strategy
 
@@ -208,6 +209,16 @@ class TestTradingBot:
         ].health_check.assert_awaited_once()
         assert result is True
 
+    async def test_stop_shuts_down_strategies(self, mock_trading_bot):
+        """stop should release every strategy's resources."""
+        mock_trading_bot.event_bus.stop = AsyncMock()
+
+        await mock_trading_bot.stop()
+
+        strategy = mock_trading_bot.strategies["orh_breakout"]
+        strategy.shutdown.assert_awaited_once()
+        mock_trading_bot.event_bus.stop.assert_awaited_once()
+
     async def test_get_strategy_returns_strategy(self, mock_trading_bot):
         """_get_strategy should return the strategy instance."""
         strategy = mock_trading_bot._get_strategy("orh_breakout")
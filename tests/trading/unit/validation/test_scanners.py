@@ -273,3 +273,90 @@ class TestPriceSensitiveFilter:
             exclude_tickers=["bhp", "rio"],
         )
         assert filter_config.exclude_tickers == ["BHP", "RIO"]
+
+    def test_ticker_rules_use_lengths_and_lists(self):
+        """Test ticker acceptance against length and include/exclude lists"""
+        excluding = PriceSensitiveFilter(exclude_tickers=["bhp"])
+        including = PriceSensitiveFilter(include_only_tickers=["RIO"])
+
+        assert excluding.accepts_ticker("RIO")
+        assert not excluding.accepts_ticker("BHP")
+        assert not excluding.accepts_ticker("AB")
+        assert including.accepts_ticker("RIO")
+        assert not including.accepts_ticker("BHP")
+
+    def test_keyword_rules_classify_headlines(self):
+        """Test include/exclude keywords and categories in one pass"""
+        filter_config = PriceSensitiveFilter(
+            include_keywords=["acquisition", "placement", "drilling results"],
+            exclude_keywords=["Appendix 3B"],
+            categories={
+                "capital_raising": ["placement", "entitlement offer"],
+                "exploration": ["drilling results", "assays"],
+            },
+        )
+
+        assert filter_config.classify("Completion of PLACEMENT") == [
+            "capital_raising"
+        ]
+        assert filter_config.classify(
+            "Placement and drilling results with assays"
+        ) == ["capital_raising", "exploration"]
+        assert filter_config.classify("Acquisition of lithium project") == []
+        # Excludes win, whole words only, and phrases span any whitespace
+        assert filter_config.classify("Appendix 3B - placement") is None
+        assert filter_config.classify("Completion of placements") is None
+        assert filter_config.classify("Drilling\n results update") == [
+            "exploration"
+        ]
+        assert filter_config.classify("Short") is None
+
+    def test_overlapping_keywords_all_apply(self):
+        """Test keywords inside or overlapping another keyword still match"""
+        results = PriceSensitiveFilter(
+            include_keywords=["drilling"],
+            categories={"results": ["drilling results"]},
+        )
+        capital = PriceSensitiveFilter(
+            categories={
+                "capital": ["placement"],
+                "shares": ["share placement"],
+                "offer": ["placement offer"],
+            },
+        )
+        excluding = PriceSensitiveFilter(
+            include_keywords=["share placement"],
+            exclude_keywords=["placement"],
+        )
+
+        assert results.classify("Drilling results from Project X") == [
+            "results"
+        ]
+        assert capital.classify("Share placement completed") == [
+            "capital",
+            "shares",
+        ]
+        assert capital.classify("Share placement offer closes") == [
+            "capital",
+            "shares",
+            "offer",
+        ]
+        assert excluding.classify("Share placement completed") is None
+
+    def test_categories_named_like_rules_are_only_categories(self):
+        """Test categories called include or exclude apply no keyword rule"""
+        excluding = PriceSensitiveFilter(categories={"exclude": ["placement"]})
+        including = PriceSensitiveFilter(
+            include_keywords=["drilling"],
+            categories={"include": ["placement"]},
+        )
+
+        assert excluding.classify("Placement to raise capital") == ["exclude"]
+        assert including.classify("Placement to raise capital") is None
+        assert including.classify("Drilling and placement update") == [
+            "include"
+        ]
+
+    def test_no_keyword_rules_accepts_any_headline(self):
+        """Test the default filter only checks headline length"""
+        assert PriceSensitiveFilter().classify("Quarterly activities") == []